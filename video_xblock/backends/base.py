@@ -7,10 +7,21 @@ Base Video player plugin.
 """
 
 import abc
+import copy
+from email.utils import parsedate_to_datetime
+import hashlib
+import http.client as httplib
 import itertools
 import json
+import logging
 import operator
+import random
 import re
+import threading
+import time
+import urllib.parse
+
+import requests
 
 from webob import Response
 from xblock.fragment import Fragment
@@ -18,8 +29,263 @@ from xblock.plugin import Plugin
 
 from django.conf import settings
 
+from video_xblock import sessions
+from video_xblock.cache import TokenBucket, TTLCache
+from video_xblock.constants import PlayerAssetsMode
 from video_xblock.exceptions import VideoXBlockException
-from video_xblock.utils import render_resource, render_template, resource_string, ugettext as _
+from video_xblock.utils import (
+    hashed_asset_uri, render_resource, render_template, resource_string, ugettext as _, xblock_settings,
+)
+
+log = logging.getLogger(__name__)
+
+# Transcripts lists fetched from video platforms, keyed by platform, account and media id:
+default_transcripts_cache = TTLCache(  # pylint: disable=invalid-name
+    'default_transcripts', ttl=3600, negative_ttl=60, settings_key='default_transcripts_cache'
+)
+
+
+RETRY_DEFAULTS = {
+    'attempts': 3,  # number of attempts made for each request
+    'backoff': 0.5,  # seconds, upper bound of the first retry delay; it doubles with each next retry
+    'max_backoff': 5,  # seconds, upper bound of retry delay
+    'max_retry_after': 10,  # seconds, longer `Retry-After` delays aren't waited for
+}
+CIRCUIT_BREAKER_DEFAULTS = {
+    'failure_threshold': 5,  # consecutive failures of a host opening its circuit
+    'reset_timeout': 30,  # seconds to fail fast for, before a trial request is let through
+}
+RATE_LIMIT_DEFAULTS = {
+    'rate': 0,  # requests per second allowed for each account of a platform, 0 to not limit requests
+    'burst': 10,  # requests which can be sent at once, before rate limit kicks in
+    'policy': 'queue',  # "queue" to wait for request's turn up to `max_wait` seconds, "shed" to fail fast
+    'max_wait': 5,  # seconds
+}
+# Responses worth retrying; platforms are considered to be failing if they respond with 5xx:
+RETRY_STATUSES = frozenset([httplib.TOO_MANY_REQUESTS, httplib.INTERNAL_SERVER_ERROR, httplib.BAD_GATEWAY,
+                            httplib.SERVICE_UNAVAILABLE, httplib.GATEWAY_TIMEOUT])
+# Responses meaning a request hasn't been processed, so that even non-idempotent requests can be retried:
+NOT_PROCESSED_STATUSES = frozenset([httplib.TOO_MANY_REQUESTS, httplib.SERVICE_UNAVAILABLE])
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD'])
+# Network failures worth retrying; other request errors (e.g. invalid URL) aren't going to go away:
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+_circuit_breakers = {}  # host -> CircuitBreaker
+_circuit_breakers_lock = threading.Lock()  # pylint: disable=invalid-name
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Request isn't sent, since its host has been failing recently.
+    """
+
+
+class RateLimitExceeded(requests.exceptions.ConnectionError):
+    """
+    Request isn't sent, since it would exceed request rate allowed for a platform's account.
+    """
+
+
+class CircuitBreaker(object):
+    """
+    Thread-safe per-host circuit breaker.
+
+    Circuit opens after `failure_threshold` consecutive failures: requests fail fast for `reset_timeout` seconds,
+    then a single trial request is let through. Its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        """
+        Initialize closed circuit.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        """
+        Tell if a request can be sent.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if not self.trial_started and time.time() - self.opened_at >= self.reset_timeout:
+                self.trial_started = True
+                return True
+            return False
+
+    def record_success(self):
+        """
+        Close the circuit.
+        """
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = False
+
+    def cancel_trial(self):
+        """
+        Let another trial request through, since the one let through has neither succeeded nor failed.
+        """
+        with self._lock:
+            self.trial_started = False
+
+    def record_failure(self):
+        """
+        Count a failure, open the circuit if there have been too many of them in a row.
+        """
+        with self._lock:
+            self.failures += 1
+            self.trial_started = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+
+
+def get_circuit_breaker(url):
+    """
+    Return circuit breaker of URL's host, `api_circuit_breaker` xblock setting overrides its defaults.
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    with _circuit_breakers_lock:
+        if host not in _circuit_breakers:
+            settings = dict(CIRCUIT_BREAKER_DEFAULTS, **xblock_settings().get('api_circuit_breaker', {}))
+            _circuit_breakers[host] = CircuitBreaker(
+                int(settings['failure_threshold']), float(settings['reset_timeout'])
+            )
+        return _circuit_breakers[host]
+
+
+def reset_circuit_breakers():
+    """
+    Close all the circuits, e.g. once settings are changed.
+    """
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
+
+
+def get_rate_limiter(rate_limit_key):
+    """
+    Return rate limiter of a platform's account and the longest wait for request's turn, `(None, 0)` if not limited.
+
+    Limits are configured per platform with `api_rate_limit` xblock setting, "default" limits apply to all of them,
+    e.g. `{"default": {"rate": 10}, "vimeo": {"rate": 1, "policy": "shed"}}`.
+
+    Arguments:
+        rate_limit_key (tuple): Platform name and account id or API key.
+    """
+    configured_limits = xblock_settings().get('api_rate_limit', {})
+    settings = dict(RATE_LIMIT_DEFAULTS)
+    settings.update(configured_limits.get('default', {}))
+    settings.update(configured_limits.get(rate_limit_key[0], {}))
+    if not settings['rate']:
+        return None, 0
+    max_wait = float(settings['max_wait']) if settings['policy'] == 'queue' else 0
+    return TokenBucket(('api_rate_limit',) + tuple(rate_limit_key), settings['rate'], settings['burst']), max_wait
+
+
+def get_retry_delay(response, attempt, settings):
+    """
+    Return seconds to wait before next attempt, `None` if server asks to wait too long.
+
+    `Retry-After` header is honored, otherwise delay is chosen randomly ("full jitter"),
+    with its upper bound growing exponentially.
+    """
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = 0
+        delay = max(delay, 0)
+        return delay if delay <= float(settings['max_retry_after']) else None
+    return random.uniform(0, min(float(settings['max_backoff']), float(settings['backoff']) * 2 ** attempt))
+
+
+def send_api_request(method, url, revalidate=False, rate_limit_key=None, **kwargs):
+    """
+    Send HTTP request to a video platform's or 3PlayMedia API through the shared session, resiliently.
+
+    - Requests are sent with `timeout` given or with session's default timeouts.
+    - Connection failures and 429/5xx responses are retried with jittered exponential backoff (or after
+      `Retry-After` delay), `api_retry` xblock setting overrides `RETRY_DEFAULTS`. Non-idempotent requests are
+      retried only if they haven't been processed.
+    - Requests to a host which has been failing recently fail fast with `CircuitOpenError`.
+    - Requests made on behalf of a platform's account wait for their turn within account's rate limit,
+      or fail fast with `RateLimitExceeded`, see `get_rate_limiter`.
+
+    Arguments:
+        method (str): HTTP method.
+        url (str): Request URL.
+        revalidate (bool): True if response received last time is to be revalidated with its `ETag` (GET only).
+        rate_limit_key (tuple): Platform name and account id or API key, which requests' rate is limited by.
+        kwargs: Same arguments as `requests.request` accepts.
+    Returns:
+        Response of the last attempt.
+    """
+    method = method.upper()
+    settings = dict(RETRY_DEFAULTS, **xblock_settings().get('api_retry', {}))
+    attempts = max(int(settings['attempts']), 1)
+    circuit_breaker = get_circuit_breaker(url)
+    rate_limiter, max_wait = get_rate_limiter(rate_limit_key) if rate_limit_key else (None, 0)
+    send = sessions.get_revalidated if revalidate else getattr(sessions, method.lower())
+
+    for attempt in range(attempts):
+        # Rate limit is consulted first, so that request's turn isn't waited for with circuit's trial request:
+        if rate_limiter is not None:
+            turn_delay = rate_limiter.reserve(max_wait)
+            if turn_delay is None:
+                raise RateLimitExceeded("{} request rate limit is exceeded, request isn't sent: {} {}".format(
+                    rate_limit_key[0], method, url
+                ))
+            if turn_delay:
+                time.sleep(turn_delay)
+        if not circuit_breaker.allow_request():
+            raise CircuitOpenError("{} has been failing recently, request isn't sent: {} {}".format(
+                urllib.parse.urlsplit(url).netloc, method, url
+            ))
+        is_last_attempt = attempt == attempts - 1
+        try:
+            response = send(url, **kwargs)
+        except TRANSIENT_ERRORS as exc:
+            circuit_breaker.record_failure()
+            can_retry = method in IDEMPOTENT_METHODS or isinstance(exc, requests.exceptions.ConnectTimeout)
+            if is_last_attempt or not can_retry:
+                raise
+            log.warning("API request has failed, retrying: {} {}: {}".format(method, url, exc))
+            delay = get_retry_delay(None, attempt, settings)
+        except requests.exceptions.RequestException:
+            # E.g. broken response body, not worth retrying, but the host is failing all the same:
+            circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Request hasn't told anything about the host, circuit's trial request (if it's one) mustn't stay pending:
+            circuit_breaker.cancel_trial()
+            raise
+        else:
+            status_code = response.status_code
+            if status_code >= httplib.INTERNAL_SERVER_ERROR:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+            if status_code == httplib.TOO_MANY_REQUESTS and rate_limiter is not None:
+                rate_limiter.drain()
+            can_retry = method in IDEMPOTENT_METHODS or status_code in NOT_PROCESSED_STATUSES
+            if is_last_attempt or status_code not in RETRY_STATUSES or not can_retry:
+                return response
+            delay = get_retry_delay(response, attempt, settings)
+            if delay is None:
+                return response
+            log.warning("API request has failed with {}, retrying in {:.2f}s: {} {}".format(
+                status_code, delay, method, url
+            ))
+            response.close()
+        time.sleep(delay)
 
 
 class BaseApiClient(object):
@@ -32,7 +298,7 @@ class BaseApiClient(object):
     """
 
     @abc.abstractmethod
-    def get(self, url, headers=None, can_retry=True):
+    def get(self, url, headers=None, can_retry=True, revalidate=False):
         """
         Issue REST GET request to a given URL.
 
@@ -42,6 +308,7 @@ class BaseApiClient(object):
             url (str): API url to fetch a resource from.
             headers (dict): Headers necessary as per API, e.g. authorization bearer to perform authorised requests.
             can_retry (bool): True if this is to retry a call if authentication failed.
+            revalidate (bool): True if response received last time is to be revalidated with its `ETag`.
         Returns:
             Response in python native data format.
         """
@@ -194,7 +461,7 @@ class BaseVideoPlayer(Plugin, metaclass=abc.ABCMeta):
             'static/css/videojs-contextmenu-ui.css',
         ]
         for css_file in css_files:
-            frag.add_css(self.resource_string(css_file))
+            self.add_css_resource(frag, css_file)
 
         frag.add_javascript(
             self.render_resource('static/js/context.js', **context)
@@ -225,10 +492,53 @@ class BaseVideoPlayer(Plugin, metaclass=abc.ABCMeta):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
         return frag
 
+    @property
+    def assets_mode(self):
+        """
+        Return the way player's static assets are delivered, see `PlayerAssetsMode`.
+
+        Is set by `player_assets` key of xblock settings, defaults to inlining.
+        """
+        if self.xblock.settings.get('player_assets') == PlayerAssetsMode.URL:
+            return PlayerAssetsMode.URL
+        return PlayerAssetsMode.INLINE
+
+    def asset_url(self, path):
+        """
+        Return cacheable URL of a static asset, or None if runtime can't serve it.
+
+        URL contains asset's content hash, so it changes only when the asset itself is changed,
+        and is served by `VideoXBlock.player_asset` handler with far-future cache headers.
+        """
+        try:
+            return self.xblock.runtime.handler_url(self.xblock, 'player_asset', hashed_asset_uri(path))
+        except NotImplementedError:
+            return None
+
+    def add_js_resource(self, frag, path):
+        """
+        Add static javascript file to a fragment either as a URL or inline, depending on `assets_mode`.
+        """
+        url = self.asset_url(path) if self.assets_mode == PlayerAssetsMode.URL else None
+        if url:
+            frag.add_javascript_url(url)
+        else:
+            frag.add_javascript(self.resource_string(path))
+
+    def add_css_resource(self, frag, path):
+        """
+        Add static css file to a fragment either as a URL or inline, depending on `assets_mode`.
+        """
+        url = self.asset_url(path) if self.assets_mode == PlayerAssetsMode.URL else None
+        if url:
+            frag.add_css_url(url)
+        else:
+            frag.add_css(self.resource_string(path))
+
     @staticmethod
     def player_data_setup(context):
         """
@@ -345,6 +655,42 @@ class BaseVideoPlayer(Plugin, metaclass=abc.ABCMeta):
         """
         return [], ''
 
+    def default_transcripts_cache_key(self, **kwargs):
+        """
+        Make cache key of a video's transcripts list out of platform's name, account id and media id.
+
+        Platforms having no account ids are keyed by a digest of API credentials instead,
+        since transcripts' URLs may contain them (e.g. Wistia's).
+        """
+        account_id = kwargs.get('account_id')
+        if not account_id:
+            credentials = kwargs.get('token') or kwargs.get('access_token') or ''
+            account_id = hashlib.sha1(str(credentials).encode('utf8')).hexdigest()
+        return (str(self.xblock.player_name), account_id, kwargs.get('video_id'))
+
+    def get_cached_default_transcripts(self, **kwargs):
+        """
+        Fetch transcripts list from a video platform, unless it has been fetched recently.
+
+        Lists are cached for `ttl` seconds of `default_transcripts_cache` xblock setting (an hour by default),
+        empty lists are cached for `negative_ttl` seconds (a minute by default).
+
+        Arguments and returned values are the same as `get_default_transcripts` ones.
+        """
+        default_transcripts, message = default_transcripts_cache.get_or_set(
+            self.default_transcripts_cache_key(**kwargs),
+            lambda: self.get_default_transcripts(**kwargs),
+            is_failure=lambda result: not result[0],
+        )
+        # Callers are free to change the list, it shouldn't affect cached one:
+        return copy.deepcopy(default_transcripts), message
+
+    def invalidate_default_transcripts(self, **kwargs):
+        """
+        Drop cached transcripts list of a video, so that it's fetched from a video platform next time.
+        """
+        default_transcripts_cache.delete(self.default_transcripts_cache_key(**kwargs))
+
     def authenticate_api(self, **kwargs):  # pylint: disable=unused-argument
         """
         Authenticate to a video platform's API in order to perform authorized requests.
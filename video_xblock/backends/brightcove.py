@@ -12,8 +12,9 @@ import re
 import requests
 from xblock.fragment import Fragment
 
-from video_xblock.backends.base import BaseVideoPlayer, BaseApiClient
-from video_xblock.constants import TranscriptSource
+from video_xblock.backends.base import BaseVideoPlayer, BaseApiClient, send_api_request
+from video_xblock.cache import cache_lock, get_cache_backend, make_cache_key
+from video_xblock.constants import PlayerAssetsMode, TranscriptSource
 from video_xblock.exceptions import ApiClientError, VideoXBlockException
 from video_xblock.utils import ugettext as _, remove_escaping
 
@@ -36,10 +37,15 @@ class BrightcoveApiClient(BaseApiClient):
     Responsible for API credentials issuing and access_token refreshing.
     """
 
+    ACCESS_TOKEN_LIFETIME = 300  # seconds
+    ACCESS_TOKEN_EARLY_REFRESH = 60  # seconds
+
     def __init__(self, api_key, api_secret, token=None, account_id=None):
         """
         Initialize Brightcove API client.
         """
+        # Requests are rate limited by account, or by client ID if account isn't known:
+        self.rate_limit_key = ('brightcove', str(account_id) if account_id else api_key)
         if token and account_id:
             self.create_credentials(token, account_id)
         else:
@@ -77,7 +83,9 @@ class BrightcoveApiClient(BaseApiClient):
             "name": "Open edX Video XBlock"
         }
         url = 'https://oauth.brightcove.com/v4/client_credentials'
-        response = requests.post(url, json=data, headers=headers)
+        response = send_api_request(
+            'POST', url, json=data, headers=headers, rate_limit_key=('brightcove', str(account_id))
+        )
         response_data = response.json()
         # New resource must have been created.
         if response.status_code == http.client.CREATED and response_data:
@@ -91,9 +99,40 @@ class BrightcoveApiClient(BaseApiClient):
             raise BrightcoveApiClientError(error_message)
         return client_secret, client_id, error_message
 
-    def _refresh_access_token(self):
+    def _refresh_access_token(self, rejected_token=None):
         """
-        Request new access token to send with requests to Brightcove. Access Token expires every 5 minutes.
+        Get access token to send with requests to Brightcove. Access Token expires every 5 minutes.
+
+        Tokens are shared by all API clients with the same client ID and secret through the cache
+        and are refreshed a bit earlier than they expire. Only one process requests new token at a time.
+
+        Arguments:
+            rejected_token (str): Token rejected by Brightcove API, which mustn't be reused.
+        """
+        # Secret is a part of the key, so that a client with wrong secret doesn't get someone else's token:
+        cache_key = make_cache_key('brightcove-access-token', (self.api_key, self.api_secret))
+        cache = get_cache_backend()
+        cached_token = cache.get(cache_key)
+        if cached_token and cached_token != rejected_token:
+            return cached_token
+
+        with cache_lock(cache_key):
+            # Token may have been refreshed by another process, while we've been waiting for the lock:
+            cached_token = cache.get(cache_key)
+            if cached_token and cached_token != rejected_token:
+                return cached_token
+            access_token, expires_in = self._request_access_token()
+            if access_token:
+                timeout = max(expires_in - self.ACCESS_TOKEN_EARLY_REFRESH, 1)
+                cache.set(cache_key, access_token, timeout)
+            return access_token
+
+    def _request_access_token(self):
+        """
+        Request new access token from Brightcove OAuth API.
+
+        Returns:
+            (tuple) access token (None on failure) and its lifetime in seconds.
         """
         url = "https://oauth.brightcove.com/v3/access_token"
         params = {"grant_type": "client_credentials"}
@@ -103,15 +142,17 @@ class BrightcoveApiClient(BaseApiClient):
         basicauth = requests.auth.HTTPBasicAuth(self.api_key, self.api_secret)
 
         try:
-            resp = requests.post(url, auth=basicauth, headers=headers, data=params)
+            resp = send_api_request(
+                'POST', url, auth=basicauth, headers=headers, data=params, rate_limit_key=self.rate_limit_key,
+            )
             if resp.status_code == http.client.OK:
                 result = resp.json()
-                return result['access_token']
+                return result['access_token'], int(result.get('expires_in', self.ACCESS_TOKEN_LIFETIME))
         except IOError:
             log.exception(_("Connection issue. Couldn't refresh API access token."))
-            return None
+        return None, 0
 
-    def get(self, url, headers=None, can_retry=True):
+    def get(self, url, headers=None, can_retry=True, revalidate=False):
         """
         Issue REST GET request to a given URL. Can throw ApiClientError or its subclass.
 
@@ -119,18 +160,21 @@ class BrightcoveApiClient(BaseApiClient):
             url (str): API url to fetch a resource from.
             headers (dict): Headers necessary as per API, e.g. authorization bearer to perform authorised requests.
             can_retry (bool): True if in a case of authentication error it can refresh access token and retry a call.
+            revalidate (bool): True if response received last time is to be revalidated with its `ETag`.
         Returns:
             Response in python native data format.
         """
         headers_ = {'Authorization': 'Bearer ' + str(self.access_token)}
         if headers is not None:
             headers_.update(headers)
-        resp = requests.get(url, headers=headers_)
+        resp = send_api_request(
+            'GET', url, revalidate=revalidate, headers=headers_, rate_limit_key=self.rate_limit_key
+        )
         if resp.status_code == http.client.OK:
             return resp.json()
         elif resp.status_code == http.client.UNAUTHORIZED and can_retry:
-            self.access_token = self._refresh_access_token()
-            return self.get(url, headers, can_retry=False)
+            self.access_token = self._refresh_access_token(rejected_token=self.access_token)
+            return self.get(url, headers, can_retry=False, revalidate=revalidate)
         else:
             raise BrightcoveApiClientError
 
@@ -153,12 +197,14 @@ class BrightcoveApiClient(BaseApiClient):
         if headers is not None:
             headers_.update(headers)
 
-        resp = requests.post(url, data=payload, headers=headers_)
+        resp = send_api_request(
+            'POST', url, data=payload, headers=headers_, rate_limit_key=self.rate_limit_key
+        )
         log.debug("BC response status: {}".format(resp.status_code))
         if resp.status_code in (http.client.OK, http.client.CREATED):
             return resp.json()
         elif resp.status_code == http.client.UNAUTHORIZED and can_retry:
-            self.access_token = self._refresh_access_token()
+            self.access_token = self._refresh_access_token(rejected_token=self.access_token)
             return self.post(url, payload, headers, can_retry=False)
 
         try:
@@ -348,9 +394,6 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
         }
     }
 
-    # Stores default transcripts fetched from the captions API
-    default_transcripts = []
-
     @property
     def basic_fields(self):
         """
@@ -393,7 +436,7 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
         super(BrightcovePlayer, self).__init__(xblock)
         self.api_key = xblock.metadata.get('client_id')
         self.api_secret = xblock.metadata.get('client_secret')
-        self.api_client = BrightcoveApiClient(self.api_key, self.api_secret)
+        self.api_client = BrightcoveApiClient(self.api_key, self.api_secret, account_id=xblock.account_id)
 
     def media_id(self, href):
         """
@@ -433,11 +476,9 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
-        frag.add_css(
-            self.resource_string('static/css/brightcove.css')
-        )
+        self.add_css_resource(frag, 'static/css/brightcove.css')
         log.debug("[get_frag] initialized scripts: %s", js_files)
         return frag
 
@@ -454,7 +495,13 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
                 'static/vendor/js/videojs-transcript.min.js',
                 'static/js/videojs/videojs-transcript.js'
             ]
-        context['vjs_plugins'] = list(map(self.resource_string, vjs_plugins))
+        vjs_plugin_urls = []
+        if self.assets_mode == PlayerAssetsMode.URL:
+            vjs_plugin_urls = [self.asset_url(vjs_plugin) for vjs_plugin in vjs_plugins]
+        if vjs_plugin_urls and all(vjs_plugin_urls):
+            context['vjs_plugin_urls'] = vjs_plugin_urls
+        else:
+            context['vjs_plugins'] = list(map(self.resource_string, vjs_plugins))
         log.debug("Initialized scripts: %s", vjs_plugins)
         return super(BrightcovePlayer, self).get_player_html(**context)
 
@@ -528,8 +575,6 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
 
         self.api_client.api_key = client_id
         self.api_client.api_secret = client_secret
-        self.xblock.metadata['client_id'] = client_id
-        self.xblock.metadata['client_secret'] = client_secret
         auth_data = {
             'client_secret': client_secret,
             'client_id': client_id,
@@ -566,7 +611,7 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
         default_transcripts = []
         # Fetch available transcripts' languages and urls if authentication succeeded.
         try:
-            text = self.api_client.get(url)
+            text = self.api_client.get(url, revalidate=True)
         except BrightcoveApiClientError:
             message = _('No timed transcript may be fetched from a video platform.')
             return default_transcripts, message
@@ -608,7 +653,7 @@ class BrightcovePlayer(BaseVideoPlayer, BrightcoveHlsMixin):
         log.debug("BC: downloading default transcript from url:{}".format(url))
         if url is None:
             raise VideoXBlockException(_('`url` parameter is required.'))
-        data = requests.get(url)
-        text = data.content
+        data = send_api_request('GET', url)
+        text = data.text
         cleaned_captions_text = remove_escaping(text)
         return cleaned_captions_text
@@ -68,7 +68,7 @@ class Html5Player(BaseVideoPlayer):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
         return frag
 
@@ -8,10 +8,8 @@ import json
 import logging
 import re
 
-import requests
-
 from video_xblock import BaseVideoPlayer, ApiClientError
-from video_xblock.backends.base import BaseApiClient
+from video_xblock.backends.base import BaseApiClient, send_api_request
 from video_xblock.utils import ugettext as _, remove_escaping
 
 log = logging.getLogger(__name__)
@@ -39,7 +37,7 @@ class VimeoApiClient(BaseApiClient):
         """
         self.access_token = token or ''
 
-    def get(self, url, headers=None, can_retry=False):
+    def get(self, url, headers=None, can_retry=False, revalidate=False):
         """
         Issue REST GET request to a given URL. Can throw ApiClientError or its subclass.
 
@@ -47,6 +45,7 @@ class VimeoApiClient(BaseApiClient):
             url (str): API url to fetch a resource from.
             headers (dict): Headers necessary as per API, e.g. authorization bearer to perform
             authorised requests.
+            revalidate (bool): True if response received last time is to be revalidated with its `ETag`.
         Returns:
             Response in python native data format.
         """
@@ -56,7 +55,9 @@ class VimeoApiClient(BaseApiClient):
         }
         if headers is not None:
             headers_.update(headers)
-        resp = requests.get(url, headers=headers_)
+        resp = send_api_request(
+            'GET', url, revalidate=revalidate, headers=headers_, rate_limit_key=('vimeo', self.access_token)
+        )
         if resp.status_code == http.client.OK:
             return resp.json()
         else:
@@ -172,7 +173,7 @@ class VimeoPlayer(BaseVideoPlayer):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
         return frag
 
@@ -223,7 +224,7 @@ class VimeoPlayer(BaseVideoPlayer):
         default_transcripts = []
         # Fetch available transcripts' languages and urls.
         try:
-            json_data = self.api_client.get(url)
+            json_data = self.api_client.get(url, revalidate=True)
         except VimeoApiClientError:
             message = _('No timed transcript may be fetched from a video platform.<br>')
             return default_transcripts, message
@@ -274,7 +275,7 @@ class VimeoPlayer(BaseVideoPlayer):
         Returns:
             sub (str): Transcripts formatted per WebVTT format https://w3c.github.io/webvtt/
         """
-        data = requests.get(url)
-        text = data.content
+        data = send_api_request('GET', url)
+        text = data.text
         cleaned_captions_text = remove_escaping(text)
         return cleaned_captions_text
@@ -13,6 +13,7 @@ import requests
 import babelfish
 
 from video_xblock import BaseVideoPlayer
+from video_xblock.backends.base import send_api_request
 from video_xblock.constants import TranscriptSource
 from video_xblock.utils import ugettext as _
 
@@ -52,9 +53,6 @@ class WistiaPlayer(BaseVideoPlayer):
         }
     }
 
-    # Stores default transcripts fetched from the captions API
-    default_transcripts = []
-
     fields_help = {
         'token': 'You can get a master token following the guide of '
                  '<a href="https://wistia.com/doc/data-api" target="_blank">Wistia</a>. '
@@ -108,7 +106,7 @@ class WistiaPlayer(BaseVideoPlayer):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
         return frag
 
@@ -145,7 +143,7 @@ class WistiaPlayer(BaseVideoPlayer):
         auth_data, error_message = {}, ''
         auth_data['token'] = token
         url = self.captions_api.get('auth_sample_url').format(token=str(token))
-        response = requests.get('https://' + url)
+        response = send_api_request('GET', 'https://' + url, rate_limit_key=('wistia', token))
         if response.status_code == httplib.UNAUTHORIZED:
             error_message = "Authentication failed. " \
                             "Please ensure you have provided a valid master token, using Video API Token field."
@@ -179,29 +177,31 @@ class WistiaPlayer(BaseVideoPlayer):
         url = self.captions_api['url'].format(token=token, media_id=video_id)
 
         message = _('Success.')
-        self.default_transcripts = []
+        default_transcripts = []
         # Fetch available transcripts' languages (codes and English labels), and assign its' urls.
         try:
             # get all languages caps data:
-            response = requests.get('https://{}'.format(url))
+            response = send_api_request(
+                'GET', 'https://{}'.format(url), revalidate=True, rate_limit_key=('wistia', token)
+            )
         except requests.exceptions.RequestException as exc:
             # Probably, current API has changed
             message = _('No timed transcript may be fetched from a video platform.\nError details: {}').format(
                 str(exc)
             )
             log.exception("Transcripts INDEX request failure.")
-            return self.default_transcripts, message
+            return default_transcripts, message
 
         # If a video does not exist, the response will be an empty HTTP 404 Not Found.
         # Reference: https://wistia.com/doc/data-api#captions_index
         if response.status_code == httplib.NOT_FOUND:
             message = _("Wistia video {} doesn't exist.").format(video_id)
-            return self.default_transcripts, message
+            return default_transcripts, message
 
         # Fetch other failure cases:
         if not response.ok:
             message = _("Invalid request.")
-            return self.default_transcripts, message
+            return default_transcripts, message
 
         try:
             wistia_data = response.json()
@@ -211,7 +211,7 @@ class WistiaPlayer(BaseVideoPlayer):
         # No transcripts case, see: wistia.com/doc/data-api#captions_index
         if not wistia_data:
             message = _("For now, video platform doesn't have any timed transcript for this video.")
-            return self.default_transcripts, message
+            return default_transcripts, message
 
         transcripts_data = [
             [el.get('language'), el.get('english_name')]
@@ -236,14 +236,14 @@ class WistiaPlayer(BaseVideoPlayer):
 
             lang_label = self.get_transcript_language_parameters(lang_code)[1]
 
-            self.default_transcripts.append({
+            default_transcripts.append({
                 'lang': lang_code,
                 'label': lang_label,
                 'url': download_url,
                 'source': TranscriptSource.DEFAULT,
             })
 
-        return self.default_transcripts, message
+        return default_transcripts, message
 
     @staticmethod
     def format_transcript_text_line(line):
@@ -288,7 +288,7 @@ class WistiaPlayer(BaseVideoPlayer):
             text (str): Text of transcripts.
         """
         try:
-            response = requests.get(url)
+            response = send_api_request('GET', url, rate_limit_key=('wistia', self.xblock.token))
             json_data = response.json()
             return json_data['text']
         except IOError:
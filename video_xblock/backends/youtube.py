@@ -3,21 +3,22 @@
 YouTube Video player plugin.
 """
 
-from html.parser import unescape, HTMLParser
+from html import unescape
+import io
 import json
 import http.client as httplib
 import re
-import textwrap
 import urllib.request, urllib.parse, urllib.error
 
 import requests
 from lxml import etree
 
+from video_xblock import webvtt
 from video_xblock.constants import TranscriptSource
 from video_xblock.exceptions import VideoXBlockException
 from video_xblock.utils import ugettext as _
 
-from .base import BaseVideoPlayer
+from .base import BaseVideoPlayer, send_api_request
 
 
 class YoutubePlayer(BaseVideoPlayer):
@@ -30,15 +31,14 @@ class YoutubePlayer(BaseVideoPlayer):
         r'(?:youtube\.com\/\S*(?:(?:\/e(?:mbed))?\/|watch\?(?:\S*?&?v\=))|youtu\.be\/)(?P<media_id>[a-zA-Z0-9_-]{6,11})'
     )
 
+    DEFAULT_CUE_DURATION = 2  # seconds, for cues of timed text without duration
+
     # YouTube API for requesting transcripts.
     # For example: http://video.google.com/timedtext?lang=en&v=QLQ-85Td2Gs
+    # Request parameters are: `v` (video id), `lang` and `name` (both not mandatory).
+    # They are built per call, since class attributes are shared by concurrent requests.
     captions_api = {
         'url': 'video.google.com/timedtext',
-        'params': {
-            'v': 'set_video_id_here',
-            'lang': 'en',  # not mandatory
-            'name': ''     # not mandatory
-        },
         'response': {
             'language_code': 'lang_code',
             'language_label': 'lang_translated',
@@ -46,9 +46,6 @@ class YoutubePlayer(BaseVideoPlayer):
         }
     }
 
-    # Stores default transcripts fetched from the Youtube captions API
-    default_transcripts = []
-
     def media_id(self, href):
         """
         Extract Platform's media id from the video url.
@@ -72,7 +69,7 @@ class YoutubePlayer(BaseVideoPlayer):
         ]
 
         for js_file in js_files:
-            frag.add_javascript(self.resource_string(js_file))
+            self.add_js_resource(frag, js_file)
 
         return frag
 
@@ -110,14 +107,15 @@ class YoutubePlayer(BaseVideoPlayer):
             message (str): Message with status on captions API call.
         """
         utf8_parser = etree.XMLParser(encoding='utf-8')
-        # This is to update self.captions_api with a video id.
-        self.captions_api['params']['v'] = video_id
-        transcripts_param = {'type': 'list', 'v': self.captions_api['params']['v']}
+        transcripts_param = {'type': 'list', 'v': video_id}
         available_languages = []
         message = ''
 
         try:
-            data = requests.get('http://' + self.captions_api['url'], params=transcripts_param)
+            data = send_api_request(
+                'GET', 'http://' + self.captions_api['url'], revalidate=True, params=transcripts_param,
+                rate_limit_key=('youtube', None),
+            )
         except requests.exceptions.RequestException as exception:
             # Probably, current API has changed
             message = 'No timed transcript may be fetched from a video platform. ' \
@@ -145,23 +143,21 @@ class YoutubePlayer(BaseVideoPlayer):
         # Fetch available transcripts' languages from API
         video_id = kwargs.get('video_id')
         available_languages, message = self.fetch_default_transcripts_languages(video_id)
-        self.default_transcripts = []
+        default_transcripts = []
         for lang_code, lang_translated, transcript_name in available_languages:  # pylint: disable=unused-variable
-            self.captions_api['params']['lang'] = lang_code
-            self.captions_api['params']['name'] = transcript_name
             transcript_url = 'http://{url}?{params}'.format(
                 url=self.captions_api['url'],
-                params=urllib.parse.urlencode(self.captions_api['params'])
+                params=urllib.parse.urlencode({'v': video_id, 'lang': lang_code, 'name': transcript_name})
             )
             # Update default transcripts languages parameters in accordance with pre-configured language settings
             lang_code, lang_label = self.get_transcript_language_parameters(lang_code)
-            self.default_transcripts.append({
+            default_transcripts.append({
                 'lang': lang_code,
                 'label': lang_label,
                 'url': transcript_url,
                 'source': TranscriptSource.DEFAULT,
             })
-        return self.default_transcripts, message
+        return default_transcripts, message
 
     @staticmethod
     def format_transcript_timing(sec, period_type=None):
@@ -174,68 +170,86 @@ class YoutubePlayer(BaseVideoPlayer):
         """
         # Youtube returns transcripts with the equal endtime and startime for previous and next transcript blocks
         # respectively. That is why transcript blocks are overlapping. Get rid of it by decreasing timing on 0.001.
-        float_sec = float(sec)
-        sec = float_sec - 0.001 if period_type == 'end' and float_sec >= 0.001 else sec
-
-        mins, secs = divmod(sec, 60)
+        msec = int(round(float(sec) * 1000))
+        if period_type == 'end' and msec >= 1:
+            msec -= 1
+        secs, msec = divmod(msec, 1000)
+        mins, secs = divmod(secs, 60)
         hours, mins = divmod(mins, 60)
-        hours_formatted = str(int(hours)).zfill(2)
-        mins_formatted = str(int(mins)).zfill(2)
-        secs_formatted = str("{:06.3f}".format(round(secs, 3)))
-        timing = "{}:{}:{}".format(
-            hours_formatted,
-            mins_formatted,
-            secs_formatted
-        )
-        return timing
+        return '{:02d}:{:02d}:{:02d}.{:03d}'.format(hours, mins, secs, msec)
 
-    def format_transcript_element(self, element, element_number):
+    def convert_transcript_to_vtt(self, source):
         """
-        Format transcript's element in order for it to be converted to WebVTT format.
+        Convert Youtube timed text XML into WebVTT format, cue by cue.
+
+        Cues are written straight to the output buffer and processed elements are cleared,
+        so that parser's memory usage doesn't grow with transcript's length.
+        Cues without duration (it's not mandatory) last until the next cue starts,
+        the last one - for `DEFAULT_CUE_DURATION` seconds.
+
+        Arguments:
+            source: File-like object (or file name) to read timed text XML from.
+        Returns:
+            str: WebVTT transcript.
         """
-        sub_element = "\n\n"
-        html_parser = HTMLParser()
-        if element.tag == "text":
-            start = float(element.get("start"))
-            duration = float(element.get("dur", 0))  # dur is not mandatory
+        output = io.StringIO()
+        output.write('WEBVTT\n\n')
+        cue_number = 0
+        pending_cue = None  # (number, start, text) of a cue without duration, written once the next cue starts
+
+        def write_cue(number, start, end, text):  # pylint: disable=missing-docstring
+            output.write('{}\n{} --> {}\n{}\n\n'.format(
+                number,
+                self.format_transcript_timing(start),
+                self.format_transcript_timing(end, 'end'),
+                webvtt.escape_cue_text(text),
+            ))
+
+        for _event, element in etree.iterparse(source, events=('end',), tag='text', encoding='utf-8'):
+            start = float(element.get('start'))
+            if pending_cue is not None:
+                number, pending_start, pending_text = pending_cue
+                end = start if start > pending_start else pending_start + self.DEFAULT_CUE_DURATION
+                write_cue(number, pending_start, end, pending_text)
+                pending_cue = None
             text = element.text
-            end = start + duration
             if text:
-                formatted_start = self.format_transcript_timing(start)
-                formatted_end = self.format_transcript_timing(end, 'end')
-                timing = '{} --> {}'.format(formatted_start, formatted_end)
-                text_encoded = text.encode('utf8', 'ignore')
-                text = text_encoded.replace(b'\n', b' ')
-                unescaped_text = unescape(text.decode('utf8'))
-                sub_element = """\
-                {element_number}
-                {timing}
-                {unescaped_text}
-
-                """.format(
-                    element_number=element_number, timing=timing, unescaped_text=unescaped_text
-                )
-        return textwrap.dedent(sub_element)
+                cue_number += 1
+                text = text.replace('\n', ' ')
+                if '&' in text:
+                    # Youtube escapes entities twice, e.g. "&amp;#39;"
+                    text = unescape(text)
+                duration = float(element.get('dur', 0))
+                if duration > 0:
+                    write_cue(cue_number, start, start + duration, text)
+                else:
+                    pending_cue = (cue_number, start, text)
+            # Drop processed elements, together with references to them kept by their parent:
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        if pending_cue is not None:
+            number, pending_start, pending_text = pending_cue
+            write_cue(number, pending_start, pending_start + self.DEFAULT_CUE_DURATION, pending_text)
+        return output.getvalue()
 
     def download_default_transcript(self, url=None, language_code=None):  # pylint: disable=unused-argument
         """
         Download default transcript from Youtube API and format it to WebVTT-like unicode.
 
+        Transcript is parsed while it's being downloaded.
+
         Reference to `get_transcripts_from_youtube()`:
             https://github.com/edx/edx-platform/blob/ecc3473d36b3c7a360e260f8962e21cb01eb1c39/common/lib/xmodule/xmodule/video_module/transcripts_utils.py#L122
         """
         if url is None:
             raise VideoXBlockException(_('`url` parameter is required.'))
-        utf8_parser = etree.XMLParser(encoding='utf-8')
-        data = requests.get(url)
-        xmltree = etree.fromstring(data.content, parser=utf8_parser)
-        sub = [
-            self.format_transcript_element(element, i)
-            for i, element in enumerate(xmltree, 1)
-        ]
-        sub = "".join(sub)
-        sub = "WEBVTT\n\n" + sub if "WEBVTT" not in sub else sub
-        return sub
+        data = send_api_request('GET', url, stream=True, rate_limit_key=('youtube', None))
+        try:
+            data.raw.decode_content = True  # let urllib3 ungzip the stream
+            return self.convert_transcript_to_vtt(data.raw)
+        finally:
+            data.close()
 
     def dispatch(self, request, suffix):
         """
@@ -0,0 +1,328 @@
+"""
+Video xblock caching helpers.
+
+Cached values are kept in Django cache (`cache_alias` xblock setting, "default" if omitted),
+falling back to an in-process LRU cache when Django cache isn't configured.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import logging
+import threading
+import time
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from .utils import xblock_settings
+
+log = logging.getLogger(__name__)
+
+NOT_FOUND = object()
+
+
+class LRUCache(object):
+    """
+    Thread-safe in-process LRU cache, compatible with a subset of Django cache API.
+    """
+
+    def __init__(self, max_entries=1000):
+        """
+        Initialize empty cache holding up to `max_entries` items.
+        """
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return cached value, or `default` if key is missing or expired.
+        """
+        with self._lock:
+            expires_at, value = self._data.get(key, (None, NOT_FOUND))
+            if value is NOT_FOUND:
+                return default
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        """
+        Store value for `timeout` seconds (forever if `None`), evict least recently used items if full.
+        """
+        expires_at = None if timeout is None else time.time() + timeout
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def add(self, key, value, timeout=None):
+        """
+        Store value only if the key isn't in the cache yet.
+
+        Returns: True if value has been stored.
+        """
+        with self._lock:
+            expires_at, _value = self._data.get(key, (None, NOT_FOUND))
+            if _value is not NOT_FOUND and (expires_at is None or expires_at > time.time()):
+                return False
+            self._data[key] = (None if timeout is None else time.time() + timeout, value)
+            return True
+
+    def delete(self, key):
+        """
+        Remove key from the cache.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all items from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LRUCache()  # pylint: disable=invalid-name
+
+
+def get_cache_backend():
+    """
+    Return Django cache configured for video xblock, or in-process LRU cache if Django cache isn't available.
+    """
+    try:
+        return caches[xblock_settings().get('cache_alias', 'default')]
+    except ImproperlyConfigured:
+        return local_cache
+
+
+def make_cache_key(namespace, key):
+    """
+    Make backend-safe cache key out of a namespace and key parts.
+    """
+    digest = hashlib.sha1(repr(key).encode('utf8')).hexdigest()
+    return 'video_xblock:{}:{}'.format(namespace, digest)
+
+
+@contextmanager
+def cache_lock(cache_key, timeout=10, wait=5, poll_interval=0.05):
+    """
+    Best-effort lock shared by all processes using the same cache, to make sure expensive work is done once.
+
+    Waits up to `wait` seconds for the lock; gives up waiting afterwards so callers never block for too long.
+    Lock is released automatically after `timeout` seconds, if holder has died.
+
+    Yields: True if lock is acquired.
+    """
+    lock_key = cache_key + ':lock'
+    backend = get_cache_backend()
+    deadline = time.time() + wait
+    acquired = backend.add(lock_key, 1, timeout)
+    while not acquired and time.time() < deadline:
+        time.sleep(poll_interval)
+        acquired = backend.add(lock_key, 1, timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            backend.delete(lock_key)
+
+
+class TTLCache(object):
+    """
+    Cache of remote resources with stale-while-revalidate and negative caching support.
+
+    Fresh values are served for `ttl` seconds. For the next `stale_ttl` seconds stale value is served
+    while it is refreshed in a background thread. Failed fetches are cached for `negative_ttl` seconds
+    so that unavailable resources aren't requested over and over again.
+    """
+
+    def __init__(self, namespace, ttl=3600, stale_ttl=0, negative_ttl=60, settings_key=None):
+        """
+        Initialize cache.
+
+        Arguments:
+            namespace (str): Cache keys prefix.
+            ttl, stale_ttl, negative_ttl (int): Default timeouts, in seconds.
+            settings_key (str): Name of xblock setting (a dict) to override default timeouts with.
+        """
+        self.namespace = namespace
+        self.defaults = {'ttl': ttl, 'stale_ttl': stale_ttl, 'negative_ttl': negative_ttl}
+        self.settings_key = settings_key
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get_timeout(self, name):
+        """
+        Return timeout by its name, taking xblock settings into account.
+        """
+        overrides = xblock_settings().get(self.settings_key, {}) if self.settings_key else {}
+        return int(overrides.get(name, self.defaults[name]))
+
+    def make_key(self, key):
+        """
+        Make backend-safe cache key out of a tuple of key parts.
+        """
+        return make_cache_key(self.namespace, key)
+
+    def get_or_set(self, key, fetch, is_failure=lambda value: value is None):
+        """
+        Return cached value, fetch and cache it if it's missing or expired.
+
+        Arguments:
+            key (tuple): Cache key parts.
+            fetch (callable): Called without arguments to get actual value.
+            is_failure (callable): Tells if fetched value is a failure to be cached for `negative_ttl` seconds.
+        Returns:
+            Cached or fetched value.
+        """
+        cache_key = self.make_key(key)
+        entry = get_cache_backend().get(cache_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                return value
+            if not is_failure(value):
+                self.revalidate(cache_key, fetch, is_failure)
+                return value
+        return self.fetch(cache_key, fetch, is_failure)
+
+    def get(self, key, default=None):
+        """
+        Return cached value, fresh or stale, without fetching it; `default` if it's missing.
+        """
+        entry = get_cache_backend().get(self.make_key(key))
+        return default if entry is None else entry[1]
+
+    def set(self, key, value):
+        """
+        Put value to the cache.
+        """
+        self.store(self.make_key(key), value)
+
+    def fetch(self, cache_key, fetch, is_failure):
+        """
+        Fetch value and put it to the cache.
+        """
+        value = fetch()
+        self.store(cache_key, value, is_failure(value))
+        return value
+
+    def store(self, cache_key, value, failure=False):
+        """
+        Put value to the cache, keep it there for the stale-while-revalidate period if it isn't a failure.
+        """
+        if failure:
+            ttl, stale_ttl = self.get_timeout('negative_ttl'), 0
+        else:
+            ttl, stale_ttl = self.get_timeout('ttl'), self.get_timeout('stale_ttl')
+        get_cache_backend().set(cache_key, (time.time() + ttl, value), ttl + stale_ttl)
+
+    def revalidate(self, cache_key, fetch, is_failure):
+        """
+        Refresh stale value in a background thread, unless it's being refreshed already.
+
+        Stale value stays in the cache if refresh fails.
+        """
+        with self._lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def refresh():  # pylint: disable=missing-docstring
+            try:
+                value = fetch()
+                if not is_failure(value):
+                    self.store(cache_key, value)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("Failed to refresh cached value %s", cache_key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+
+        threading.Thread(target=refresh, name='video-xblock-cache-refresh', daemon=True).start()
+
+    def delete(self, key):
+        """
+        Invalidate cached value.
+        """
+        get_cache_backend().delete(self.make_key(key))
+
+
+class TokenBucket(object):
+    """
+    Token bucket rate limiter shared by all processes using the same cache.
+
+    Bucket holds up to `burst` tokens and is refilled with `rate` tokens per second, each request takes a token.
+    Once the bucket is empty, requests take tokens which are yet to be refilled and wait for them.
+    """
+
+    def __init__(self, key, rate, burst):
+        """
+        Initialize rate limiter.
+
+        Arguments:
+            key (tuple): Cache key parts, identifying the quota requests are limited by.
+            rate (float): Tokens refilled per second.
+            burst (int): Bucket capacity.
+        """
+        self.cache_key = make_cache_key('token_bucket', key)
+        self.rate = float(rate)
+        self.burst = max(float(burst), 1)
+
+    def get_tokens(self, backend, now):
+        """
+        Return number of tokens in the bucket, negative if tokens have been taken in advance.
+        """
+        tokens, updated_at = backend.get(self.cache_key) or (self.burst, now)
+        return min(self.burst, tokens + (now - updated_at) * self.rate)
+
+    def put_tokens(self, backend, tokens, now):
+        """
+        Store number of tokens in the bucket, until it's full again.
+        """
+        backend.set(self.cache_key, (tokens, now), int((self.burst - tokens) / self.rate) + 1)
+
+    def reserve(self, max_wait=0):
+        """
+        Take a token from the bucket.
+
+        Bucket's lock is waited for up to `max_wait` seconds too (a bit longer if it's 0), a request which can't
+        get it is treated as one exceeding the rate: it's heavy load the lock is contended under,
+        and it's when the limit matters most.
+
+        Arguments:
+            max_wait (float): Longest wait for a token, in seconds.
+        Returns:
+            Seconds to wait before sending a request, `None` if it's longer than `max_wait` (token isn't taken then).
+        """
+        backend = get_cache_backend()
+        started_at = time.time()
+        with cache_lock(self.cache_key, timeout=1, wait=max(max_wait, 0.5), poll_interval=0.01) as acquired:
+            if not acquired:
+                return None
+            now = time.time()
+            max_wait = max(max_wait - (now - started_at), 0)
+            tokens = self.get_tokens(backend, now)
+            delay = max(1 - tokens, 0) / self.rate
+            if delay > max_wait:
+                return None
+            self.put_tokens(backend, tokens - 1, now)
+            return delay
+
+    def drain(self):
+        """
+        Empty the bucket, e.g. once quota is found to be exceeded.
+
+        Tokens already taken in advance are kept taken.
+        """
+        backend = get_cache_backend()
+        with cache_lock(self.cache_key, timeout=1, wait=0.5, poll_interval=0.01) as acquired:
+            if acquired:
+                now = time.time()
+                self.put_tokens(backend, min(self.get_tokens(backend, now), 0), now)
@@ -29,6 +29,18 @@ class PlayerName(object):
     YOUTUBE = 'youtube-player'
 
 
+class PlayerAssetsMode(object):
+    """
+    Define how player's static assets are delivered to the `render_player` iframe.
+
+    INLINE - assets' content is embedded into each rendered player page;
+    URL - assets are referenced by content-hashed URLs, so browsers and CDNs can cache them.
+    """
+
+    INLINE = 'inline'
+    URL = 'url'
+
+
 class TranscriptSource(object):
     """
     Define transcript source, e.g. where transcript was fetched from.
@@ -1,9 +1,13 @@
 """
 Video XBlock mixins geared toward specific subsets of functionality.
 """
+from concurrent import futures
+import hashlib
+import http.client as httplib
 import logging
+import math
+import os.path
 
-import requests
 from pycaption import detect_format, WebVTTWriter
 from webob import Response
 
@@ -11,11 +15,40 @@ from xblock.core import XBlock
 from xblock.exceptions import NoSuchServiceError
 from xblock.fields import Scope, Boolean, Float, String
 
+from . import webvtt
+from .backends.base import send_api_request
+from .cache import LRUCache, TTLCache
+from .search import TranscriptSearchIndex
 from .constants import DEFAULT_LANG, TPMApiTranscriptFormatID, TPMApiLanguage, TranscriptSource, Status, PlayerName
-from .utils import import_from, ugettext as _, underscore_to_mixedcase, Transcript
+from .utils import import_from, is_not_modified, ugettext as _, underscore_to_mixedcase, xblock_settings, Transcript
 
 log = logging.getLogger(__name__)
 
+# 3PlayMedia responses are cached by API key too, so that they're served only to those who can fetch them:
+three_play_media_cache = TTLCache(  # pylint: disable=invalid-name
+    '3playmedia', ttl=3600, stale_ttl=86400, negative_ttl=60, settings_key='threeplaymedia_cache'
+)
+# 3PlayMedia responses meaning API key is wrong or revoked; whatever it has fetched before is dropped then:
+THREE_PLAY_MEDIA_AUTH_FAILURE_STATUSES = frozenset([httplib.UNAUTHORIZED, httplib.FORBIDDEN])
+# Converted transcripts are keyed by source's content hash, so they can be kept for long:
+webvtt_cache = TTLCache('webvtt', ttl=7 * 24 * 3600, settings_key='webvtt_cache')  # pylint: disable=invalid-name
+
+# Text extracted from transcripts for search index, keyed by transcripts' fingerprints:
+transcript_text_cache = TTLCache(  # pylint: disable=invalid-name
+    'transcript_text', ttl=30 * 24 * 3600, settings_key='transcript_text_cache'
+)
+# Cue indexes are keyed by transcripts' fingerprints too:
+cue_index_cache = TTLCache(  # pylint: disable=invalid-name
+    'cue_index', ttl=7 * 24 * 3600, settings_key='cue_index_cache'
+)
+# Transcripts' search indexes are kept in-process, by blocks' transcripts:
+search_index_cache = LRUCache(max_entries=500)  # pylint: disable=invalid-name
+
+WEBVTT_MAX_AGE = 3600  # seconds, for browsers to cache transcripts converted into WebVTT format
+TRANSCRIPT_TEXT_VERSION = 2  # bump to invalidate cached transcripts' text once `vtt_to_text` is changed
+CUE_INDEX_VERSION = 1  # bump to invalidate cached cue indexes once `webvtt.CueIndex` is changed
+SEARCH_RESULTS_LIMIT = 50
+
 
 @XBlock.wants('contentstore')
 class ContentStoreMixin(XBlock):
@@ -50,6 +83,17 @@ class ContentStoreMixin(XBlock):
 
         return import_from('xmodule.contentstore.content', 'StaticContent')
 
+    @property
+    def not_found_error(self):
+        """
+        Proxy to `xmodule.exceptions.NotFoundError` class, raised by contentstore if there is no such asset.
+        """
+        contentstore_service = self.runtime.service(self, 'contentstore')
+        if contentstore_service:
+            return contentstore_service.NotFoundError
+
+        return import_from('xmodule.exceptions', 'NotFoundError')
+
 
 class TranscriptsMixin(XBlock):
     """
@@ -87,6 +131,7 @@ class TranscriptsMixin(XBlock):
         Utility method to convert any supported transcripts into WebVTT format.
 
         Supported input formats: DFXP/TTML - SAMI - SCC - SRT - WebVTT.
+        SRT and WebVTT are handled by built-in line-based converter, other formats - by pycaption.
 
         Arguments:
             caps (str): Raw transcripts.
@@ -94,22 +139,49 @@ class TranscriptsMixin(XBlock):
             str: Transcripts converted into WebVTT format.
         """
         if caps:
+            vtt = webvtt.convert_to_vtt(caps)
+            if vtt is not None:
+                return vtt
             reader = detect_format(caps)
             if reader:
                 return WebVTTWriter().write(reader().read(caps))
         return ''
 
     @staticmethod
-    def vtt_to_text(vtt_content):
+    def vtt_to_text(vtt_content, max_length=None):
         """
         Utility method to extract text from WebVTT format transcript.
+
+        Header, cue identifiers and timings, notes, styles and markup are dropped, see `webvtt.iter_cue_text`.
+
+        Arguments:
+            vtt_content (str): WebVTT transcript.
+            max_length (int): Maximum length of extracted text, unlimited if `None`.
         """
-        text_lines = []
-        for line in vtt_content.splitlines():
-            if '-->' in line or line == '':
-                continue
-            text_lines.append(line)
-        return ' '.join(text_lines)
+        return webvtt.vtt_to_text(vtt_content, max_length)
+
+    def get_clip_window(self):
+        """
+        Get time window transcripts are clipped to, as set by video's start and end time.
+
+        Returns:
+            (tuple) window's start and end (`None` if video plays till the end) in milliseconds,
+            or `None` if the entire video is played.
+        """
+        start = int(self.start_time.total_seconds() * 1000)  # pylint: disable=no-member
+        end = int(self.end_time.total_seconds() * 1000)  # pylint: disable=no-member
+        if not (start or end):
+            return None
+        return start, end or None
+
+    def clip_transcript(self, vtt, window):
+        """
+        Clip WebVTT transcript to a time window, see `webvtt.clip_vtt`.
+
+        Clipped transcripts are cached by source's content hash and window.
+        """
+        content_hash = hashlib.sha1(vtt.encode('utf8')).hexdigest()
+        return webvtt_cache.get_or_set(('clip', content_hash, window), lambda: webvtt.clip_vtt(vtt, *window))
 
     def route_transcripts(self):
         """
@@ -117,12 +189,16 @@ class TranscriptsMixin(XBlock):
 
         While direct 3PlayMedia transcripts enabled: to transcript fetcher
         and to `str_to_vtt` handler for non .vtt transcripts if opposite.
+        If `clip_transcripts` xblock setting is on and video's start or end time is set,
+        transcripts are routed to handlers clipping them to the played part of video.
 
         Arguments:
             transcripts (str): Raw transcripts.
         """
         log.debug("Routing transcripts: 3PM status={}".format(self.threeplaymedia_streaming))
         transcripts = self.get_enabled_transcripts()
+        clipped = xblock_settings().get('clip_transcripts', False) and self.get_clip_window() is not None
+        suffix = 'clipped' if clipped else ''
         for tran in transcripts:
             if self.threeplaymedia_streaming:
                 # download URL remains hidden behind the handler:
@@ -134,11 +210,17 @@ class TranscriptsMixin(XBlock):
                 # So, we have to expose raw 3PM URL for Brightcove users, for now...
                 if str(self.player_name) != PlayerName.BRIGHTCOVE:
                     tran['url'] = self.runtime.handler_url(
-                        self, 'fetch_from_three_play_media', query="{}={}".format(tran['lang_id'], tran['id'])
+                        self, 'fetch_from_three_play_media', suffix,
+                        query="{}={}".format(tran['lang_id'], tran['id'])
                     )
-            elif not tran['url'].endswith('.vtt'):
+            elif tran.get('vtt_url'):
+                # non-WebVTT transcript has been converted into WebVTT on save:
+                tran['url'] = tran['vtt_url']
+                if clipped:
+                    tran['url'] = self.runtime.handler_url(self, 'srt_to_vtt', suffix, query=tran['url'])
+            elif clipped or not tran['url'].endswith('.vtt'):
                 tran['url'] = self.runtime.handler_url(
-                    self, 'srt_to_vtt', query=tran['url']
+                    self, 'srt_to_vtt', suffix, query=tran['url']
                 )
             yield tran
 
@@ -157,12 +239,14 @@ class TranscriptsMixin(XBlock):
         Upload a transcript, fetched from a video platform's API, to video xblock.
 
         Arguments:
-            ext (str): format of transcript file, default is vtt.
+            ext (str): format of transcript file, default is vtt. Transcripts of other formats are converted to vtt.
             trans_str (str): multiple string for convert to vtt file.
             reference_name (str): name of transcript file.
         Returns:
             File's file_name and external_url.
         """
+        if ext != '.vtt':
+            trans_str, ext = self.convert_caps_to_vtt(trans_str), '.vtt'
         # Define location of default transcript as a future asset and prepare content to store in assets
         file_name = reference_name.replace(" ", "_") + ext
         course_key = self.course_key
@@ -223,7 +307,7 @@ class TranscriptsMixin(XBlock):
 
         :return: (generator of OrderedDicts (dicts in Py3.6+)) all transcript's data
         """
-        feedback, transcripts_list = self.get_3pm_transcripts_list(
+        feedback, transcripts_list = self.get_cached_3pm_transcripts_list(
             self.threeplaymedia_file_id, self.threeplaymedia_apikey
         )
         log.debug("Fetched 3PM transcripts list results:\n{}".format(feedback))
@@ -232,13 +316,36 @@ class TranscriptsMixin(XBlock):
             log.error("3PlayMedia transcripts fetching API request has failed!\n{}".format(feedback['message']))
             raise StopIteration
 
+        video_id = self.get_player().media_id(self.href)
         for transcript_data in transcripts_list:
-            transcript = self.fetch_single_3pm_translation(transcript_data)
-            if transcript is None:
-                raise StopIteration
-            transcript_ordered_dict = transcript._asdict()
-            transcript_ordered_dict['content'] = ''  # we don't want to parse it to JSON
-            yield transcript_ordered_dict
+            try:
+                transcript = self.get_3pm_transcript_metadata(transcript_data, video_id=video_id)
+            except ValueError:
+                log.exception("Unsupported 3PlayMedia transcript language: {}".format(transcript_data))
+                continue
+            yield transcript._asdict()
+
+    def get_cached_3pm_transcripts_list(self, file_id, apikey):
+        """
+        Get list of available transcripts for given file ID, cached by file ID and API key.
+
+        Failed API requests are cached for a short period of time too.
+
+        :return: (tuple) feedback dict and list of transcripts' data, see `get_3pm_transcripts_list`
+        """
+        cache_key = ('transcripts', file_id, apikey)
+
+        def fetch_transcripts_list():  # pylint: disable=missing-docstring
+            feedback, transcripts_list = self.get_3pm_transcripts_list(file_id, apikey)
+            if feedback.get('status_code') in THREE_PLAY_MEDIA_AUTH_FAILURE_STATUSES:
+                three_play_media_cache.delete(cache_key)  # stale list mustn't be served to revoked API key
+            return feedback, transcripts_list
+
+        return three_play_media_cache.get_or_set(
+            cache_key,
+            fetch_transcripts_list,
+            is_failure=lambda result: result[0]['status'] is not Status.success
+        )
 
     def get_3pm_transcripts_list(self, file_id, apikey):
         """
@@ -254,10 +361,11 @@ class TranscriptsMixin(XBlock):
         feedback = {'status': Status.error, 'message': failure_message}
 
         try:
-            response = requests.get(
-                '{domain}files/{file_id}/transcripts?apikey={api_key}'.format(
+            response = send_api_request(
+                'GET', '{domain}files/{file_id}/transcripts?apikey={api_key}'.format(
                     domain=domain, file_id=file_id, api_key=apikey
-                )
+                ),
+                rate_limit_key=('3playmedia', apikey),
             )
             log.debug(response._content)  # pylint: disable=protected-access
         except IOError:
@@ -270,52 +378,292 @@ class TranscriptsMixin(XBlock):
             feedback['message'] = success_message
         else:
             feedback['status'] = Status.error
+            feedback['status_code'] = response.status_code
         return feedback, transcripts_list
 
-    def fetch_single_3pm_translation(self, transcript_data, format_id=TPMApiTranscriptFormatID.WEBVTT):
+    def get_3pm_transcripts_versions(self):
         """
-        Fetch single transcript for given file ID in given format.
+        Get versions of 3PlayMedia transcripts for current file ID, taken from cached transcripts list.
 
-        :param transcript_data:
-        :param format_id: defauts to VTT
-        :return: (namedtuple instance) transcript data
+        :return: (dict) transcripts' versions (`None` if API doesn't provide one) by transcripts' IDs
         """
-        transcript_id = transcript_data.get('id', '')
-        lang_id = transcript_data.get('language_id')
-        external_api_url = '{domain}files/{file_id}/transcripts/{tid}?apikey={api_key}&format_id={format_id}'.format(
+        _feedback, transcripts_list = self.get_cached_3pm_transcripts_list(
+            self.threeplaymedia_file_id, self.threeplaymedia_apikey
+        )
+        return {
+            transcript_data.get('id'): transcript_data.get('updated_at', transcript_data.get('version'))
+            for transcript_data in transcripts_list
+        }
+
+    def get_3pm_transcript_url(self, transcript_id, format_id=TPMApiTranscriptFormatID.WEBVTT):
+        """
+        Return 3PlayMedia API URL of a transcript for current file ID in given format.
+        """
+        return '{domain}files/{file_id}/transcripts/{tid}?apikey={api_key}&format_id={format_id}'.format(
             domain=self.THREE_PLAY_MEDIA_API_DOMAIN,
             file_id=self.threeplaymedia_file_id,
             tid=transcript_id,
             api_key=self.threeplaymedia_apikey,
             format_id=format_id
         )
-        try:
-            content = requests.get(external_api_url).text
-        except Exception:  # pylint: disable=broad-except
-            log.exception(_("Transcript fetching failure: language [{}]").format(TPMApiLanguage(lang_id)))
-            return
 
+    def get_3pm_transcript_metadata(
+            self, transcript_data, format_id=TPMApiTranscriptFormatID.WEBVTT, video_id=None
+    ):
+        """
+        Build transcript data out of an item of 3PlayMedia transcripts list, without fetching transcript's content.
+
+        :param transcript_data: (dict) item of 3PlayMedia transcripts list
+        :param format_id: defauts to VTT
+        :param video_id: (str) video ID, taken from current player if omitted
+        :return: (namedtuple instance) transcript data with empty content
+        """
+        transcript_id = transcript_data.get('id', '')
+        lang_id = transcript_data.get('language_id')
         lang_code = TPMApiLanguage(lang_id)
-        lang_label = lang_code.name
-        video_id = self.get_player().media_id(self.href)
-        source = TranscriptSource.THREE_PLAY_MEDIA
+        if video_id is None:
+            video_id = self.get_player().media_id(self.href)
         return Transcript(
             id=transcript_id,
-            content=content,
+            content='',
             lang=lang_code.iso_639_1_code,
             lang_id=lang_id,
-            label=lang_label,
+            label=lang_code.name,
             video_id=video_id,
             format=format_id,
-            source=source,
-            url=external_api_url,
+            source=TranscriptSource.THREE_PLAY_MEDIA,
+            url=self.get_3pm_transcript_url(transcript_id, format_id),
+        )
+
+    def fetch_single_3pm_translation(self, transcript_data, format_id=TPMApiTranscriptFormatID.WEBVTT):
+        """
+        Fetch single transcript for given file ID in given format.
+
+        :param transcript_data:
+        :param format_id: defauts to VTT
+        :return: (namedtuple instance) transcript data
+        """
+        transcript_id = transcript_data.get('id', '')
+        lang_id = transcript_data.get('language_id')
+        external_api_url = self.get_3pm_transcript_url(transcript_id, format_id)
+        cache_key = ('transcript', self.threeplaymedia_file_id, self.threeplaymedia_apikey, transcript_id, format_id)
+
+        def fetch_content():  # pylint: disable=missing-docstring
+            try:
+                response = send_api_request(
+                    'GET', external_api_url, rate_limit_key=('3playmedia', self.threeplaymedia_apikey)
+                )
+                if response.ok:
+                    return response.text
+                log.error("Transcript fetching failure: language [{}]: {}".format(
+                    TPMApiLanguage(lang_id), response.status_code
+                ))
+                if response.status_code in THREE_PLAY_MEDIA_AUTH_FAILURE_STATUSES:
+                    three_play_media_cache.delete(cache_key)  # stale content mustn't be served to revoked API key
+            except Exception:  # pylint: disable=broad-except
+                log.exception(_("Transcript fetching failure: language [{}]").format(TPMApiLanguage(lang_id)))
+
+        content = three_play_media_cache.get_or_set(cache_key, fetch_content)
+        if content is None:
+            return
+
+        return self.get_3pm_transcript_metadata(transcript_data, format_id)._replace(content=content)
+
+    def fetch_3pm_translations(self, transcripts_data, format_id=TPMApiTranscriptFormatID.WEBVTT):
+        """
+        Fetch several transcripts for given file ID in given format concurrently.
+
+        Number of concurrent requests and overall deadline are configured with `threeplaymedia_fetch_workers`
+        and `threeplaymedia_fetch_timeout` (in seconds) xblock settings. Requests not started by the deadline
+        are cancelled, the ones in progress are left to complete in the background (they're bounded by HTTP timeouts),
+        their results are still cached.
+
+        :param transcripts_data: (list of dicts) items of 3PlayMedia transcripts list
+        :param format_id: defauts to VTT
+        :return: (list) transcripts data in the same order, `None` for transcripts failed to be fetched in time
+        """
+        if not transcripts_data:
+            return []
+        settings = xblock_settings()
+        max_workers = min(int(settings.get('threeplaymedia_fetch_workers', 4)), len(transcripts_data))
+        deadline = float(settings.get('threeplaymedia_fetch_timeout', 30))
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = [
+            executor.submit(self.fetch_single_3pm_translation, transcript_data, format_id)
+            for transcript_data in transcripts_data
+        ]
+        futures.wait(pending, timeout=deadline)
+        executor.shutdown(wait=False)
+
+        transcripts = []
+        for transcript_data, future in zip(transcripts_data, pending):
+            if not future.done():
+                future.cancel()
+                log.error("3PlayMedia transcript fetching has timed out: {}".format(transcript_data))
+                transcripts.append(None)
+            elif future.exception() is not None:
+                log.error("3PlayMedia transcript fetching has failed: {}".format(future.exception()))
+                transcripts.append(None)
+            else:
+                transcripts.append(future.result())
+        return transcripts
+
+    def find_transcript_asset(self, file_name, as_stream=False):
+        """
+        Find transcript's asset in the contentstore.
+
+        Arguments:
+            file_name (str): Asset's file name.
+            as_stream (bool): Get `StaticContentStream`, rather than `StaticContent` with all data loaded.
+        Returns:
+            Asset found (raises `NotFoundError` if there is no such asset).
+        """
+        asset_location = self.static_content.compute_location(self.course_key, file_name)
+        return self.contentstore().find(asset_location, as_stream=as_stream)  # pylint: disable=not-callable
+
+    @staticmethod
+    def get_asset_content_hash(asset):
+        """
+        Get content hash of an asset found as a stream.
+
+        Content digest, calculated by the contentstore, is used if it's available. Otherwise content is read.
+
+        Returns:
+            (tuple) content hash and content (`None` if content hasn't been read).
+        """
+        if asset.content_digest:
+            return asset.content_digest, None
+        content = b''.join(asset.stream_data())
+        return hashlib.md5(content).hexdigest(), content
+
+    def get_transcript_fingerprint(self, transcript, versions=None):
+        """
+        Get fingerprint of transcript's content, which changes whenever content does.
+
+        Manual and default transcripts are fingerprinted by their assets' content hashes,
+        3PlayMedia transcripts - by their IDs and versions. 3PlayMedia transcripts without known version
+        can't be fingerprinted, so whatever is derived from them mustn't be cached.
+
+        Arguments:
+            transcript (dict): Enabled transcript.
+            versions (dict): 3PlayMedia transcripts' versions, see `get_3pm_transcripts_versions`.
+        Returns:
+            (tuple) fingerprint (`None` if it's unknown) and transcript's content (`None` if content hasn't been read).
+        """
+        if transcript['source'] == TranscriptSource.THREE_PLAY_MEDIA:
+            if versions is None:
+                versions = self.get_3pm_transcripts_versions()
+            version = versions.get(transcript['id'])
+            if version is None:
+                return None, None
+            fingerprint = (
+                '3playmedia', self.threeplaymedia_file_id, self.threeplaymedia_apikey, transcript['id'], version
+            )
+            return fingerprint, None
+        asset = self.find_transcript_asset(transcript['url'].split('@')[-1], as_stream=True)
+        content_hash, content = self.get_asset_content_hash(asset)
+        return ('asset', content_hash), content
+
+    def get_transcript_cue_index(self, transcript):
+        """
+        Get index of transcript's cues, built once per transcript's content and cached.
+
+        Arguments:
+            transcript (dict): Enabled transcript, as routed by `route_transcripts`.
+        Returns:
+            `webvtt.CueIndex` instance, or `None` if transcript can't be fetched.
+        """
+        fingerprint, content = self.get_transcript_fingerprint(transcript)
+
+        def build_index():  # pylint: disable=missing-docstring
+            if transcript['source'] == TranscriptSource.THREE_PLAY_MEDIA:
+                fetched_transcript = self.fetch_single_3pm_translation(
+                    transcript_data={'id': transcript['id'], 'language_id': transcript['lang_id']}
+                )
+                if fetched_transcript is None:
+                    return None
+                caps = fetched_transcript.content
+            else:
+                raw_caps = content
+                if raw_caps is None:
+                    raw_caps = self.find_transcript_asset(transcript['url'].split('@')[-1]).data
+                caps = raw_caps.decode('utf-8-sig', 'replace')
+            return webvtt.CueIndex.from_vtt(self.convert_caps_to_vtt(caps))
+
+        if fingerprint is None:
+            return build_index()
+        return cue_index_cache.get_or_set((fingerprint, CUE_INDEX_VERSION), build_index)
+
+    def get_transcript_search_index(self, lang):
+        """
+        Get search index of an enabled transcript, built on first search and kept until transcripts are changed.
+
+        Arguments:
+            lang (str): Transcript's language.
+        Returns:
+            `search.TranscriptSearchIndex` instance, or `None` if there is no such transcript.
+        """
+        key = (
+            str(self.usage_id), lang, CUE_INDEX_VERSION,
+            self.transcripts, self.threeplaymedia_streaming, self.threeplaymedia_file_id,
         )
+        search_index = search_index_cache.get(key)
+        if search_index is None:
+            transcript = next((tran for tran in self.route_transcripts() if tran['lang'] == lang), None)
+            cue_index = transcript and self.get_transcript_cue_index(transcript)
+            if cue_index is None:
+                return None
+            search_index = TranscriptSearchIndex(cue_index)
+            search_index_cache.set(key, search_index)
+        return search_index
+
+    def convert_transcript_to_vtt(self, transcript):
+        """
+        Store WebVTT copy of a non-WebVTT transcript asset and record its url as transcript's `vtt_url`.
+
+        Original transcript's url is kept intact for downloading. Transcripts are converted only once:
+        WebVTT copy is named after original asset's content hash and isn't re-created while it matches.
+
+        Arguments:
+            transcript (dict): Transcript data, with `url` of an asset.
+        Returns:
+            Updated transcript data.
+        """
+        if transcript.get('url', '').endswith('.vtt'):
+            transcript.pop('vtt_url', None)
+            return transcript
+
+        file_name = self.get_file_name_from_path(transcript.get('url', ''))
+        try:
+            asset = self.find_transcript_asset(file_name, as_stream=True)
+            content_hash, caps = self.get_asset_content_hash(asset)
+            reference_name = '{}_{}'.format(os.path.splitext(file_name)[0], content_hash[:12])
+            if self.get_file_name_from_path(transcript.get('vtt_url', '')) == reference_name + '.vtt':
+                return transcript
+            if caps is None:
+                caps = b''.join(asset.stream_data())
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Transcript conversion failure: can't read asset [{}]".format(file_name))
+            transcript.pop('vtt_url', None)
+            return transcript
+
+        vtt = self.convert_caps_to_vtt(caps.decode('utf-8-sig', 'replace'))
+        if not vtt:
+            log.warning("Transcript conversion failure: unsupported format of asset [{}]".format(file_name))
+            transcript.pop('vtt_url', None)
+            return transcript
+
+        _file_name, transcript['vtt_url'] = self.create_transcript_file(trans_str=vtt, reference_name=reference_name)
+        return transcript
 
     @XBlock.handler
     def download_transcript(self, request, _suffix=''):
         """
         Download a transcript.
 
+        Transcript is streamed from the contentstore, conditional requests are answered with "304 Not Modified".
+
         Arguments:
             request (webob.Request): Request to handle.
             suffix (string): Slug used for routing.
@@ -324,40 +672,161 @@ class TranscriptsMixin(XBlock):
         """
         trans_path = self.get_path_for(request.query_string)
         filename = self.get_file_name_from_path(trans_path)
-        transcript = requests.get(request.host_url + request.query_string).text
-        response = Response(transcript)
-        headerlist = [
-            ('Content-Type', 'text/plain'),
-            ('Content-Disposition', 'attachment; filename={}'.format(filename))
-        ]
-        response.headerlist = headerlist
+        try:
+            asset = self.find_transcript_asset(filename, as_stream=True)
+        except self.not_found_error:
+            log.warning("Transcript downloading failure: can't find asset [{}]".format(trans_path))
+            return Response(status=404)
+
+        response = Response(content_type='text/plain', charset=None)
+        response.headers['Content-Disposition'] = 'attachment; filename={}'.format(filename)
+        response.etag = asset.content_digest
+        response.last_modified = asset.last_modified_at
+        if is_not_modified(request, asset.content_digest, asset.last_modified_at):
+            response.status = 304
+            return response
+        response.app_iter = asset.stream_data()
+        response.content_length = asset.length
         return response
 
     @XBlock.handler
-    def srt_to_vtt(self, request, _suffix=''):
+    def srt_to_vtt(self, request, suffix=''):
         """
         Fetch raw transcripts, convert them into WebVTT format and return back.
 
         Path to raw transcripts is passed in as `request.query_string`.
+        Converted transcripts are cached by source asset and its content hash, so they are converted
+        only once the source is changed. WebVTT transcripts are served as they are.
 
         Arguments:
             request (webob.Request): The request to handle
-            suffix (string): The remainder of the url, after the handler url prefix, if available.
+            suffix (string): "clipped" to clip transcripts to video's start and end time, see `get_clip_window`.
         Returns:
             webob.Response: WebVTT transcripts wrapped in Response object.
         """
-        caps_path = request.query_string
-        caps = requests.get(request.host_url + caps_path).text
-        return Response(self.convert_caps_to_vtt(caps))
+        caps_path = self.get_path_for(request.query_string)
+        try:
+            asset = self.find_transcript_asset(self.get_file_name_from_path(caps_path), as_stream=True)
+        except self.not_found_error:
+            log.warning("Transcript conversion failure: can't find asset [{}]".format(caps_path))
+            return Response(status=404)
+
+        content_hash, caps = self.get_asset_content_hash(asset)
+
+        window = self.get_clip_window() if suffix == 'clipped' else None
+        response = Response(content_type='text/vtt', charset='utf8')
+        response.etag = 'vtt-{}'.format(content_hash)
+        if window:
+            response.etag = '{}-{}-{}'.format(response.etag, *window)
+        if getattr(asset, 'locked', True):
+            response.cache_control.private = True  # locked assets mustn't be cached by shared caches
+        else:
+            response.cache_control.public = True
+        response.cache_control.max_age = WEBVTT_MAX_AGE
+        if is_not_modified(request, response.etag):
+            response.status = 304
+            return response
+
+        def convert():  # pylint: disable=missing-docstring
+            raw_caps = caps if caps is not None else b''.join(asset.stream_data())
+            return self.convert_caps_to_vtt(raw_caps.decode('utf-8-sig', 'replace'))
+
+        vtt = webvtt_cache.get_or_set(('srt_to_vtt', str(asset.location), content_hash), convert)
+        response.text = self.clip_transcript(vtt, window) if window else vtt
+        return response
 
     @XBlock.handler
-    def fetch_from_three_play_media(self, request, _suffix=''):
+    def transcript_cues(self, request, _suffix=''):
+        """
+        Return cues of a transcript shown within a time window, so that long transcripts can be paged.
+
+        Cues are looked up in transcript's cue index, see `get_transcript_cue_index`.
+
+        Arguments:
+            request (webob.Request): The request to handle.
+                Query parameters: `lang` - transcript's language (current captions language if omitted),
+                `from` and `to` - window's bounds, in seconds (from the start up to the end if omitted).
+            suffix (string): not used
+        Returns:
+            webob.Response: (json) {'lang': 'en', 'from': 600.0, 'to': 900.0,
+                'cues': [{'start': 601.5, 'end': 604.0, 'text': '...'}]}
+        """
+        lang = request.GET.get('lang') or self.captions_language
+        try:
+            start = float(request.GET.get('from') or 0)
+            end = float(request.GET['to']) if request.GET.get('to') else None
+        except ValueError:
+            return Response(status=400)
+        # Bounds are checked in milliseconds, huge ones overflow once scaled:
+        if not math.isfinite(start * 1000) or (end is not None and not math.isfinite(end * 1000)):
+            return Response(status=400)
+
+        transcript = next((tran for tran in self.route_transcripts() if tran['lang'] == lang), None)
+        if transcript is None:
+            return Response(status=404)
+        try:
+            cue_index = self.get_transcript_cue_index(transcript)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Transcript cues indexing failure: [{}]".format(transcript))
+            cue_index = None
+        if cue_index is None:
+            return Response(status=404)
+
+        cues = cue_index.window(int(start * 1000), None if end is None else int(end * 1000))
+        response = Response(json={
+            'lang': lang,
+            'from': start,
+            'to': end,
+            'cues': [
+                {'start': cue_start / 1000.0, 'end': cue_end / 1000.0, 'text': text}
+                for cue_start, cue_end, text in cues
+            ],
+        })
+        response.cache_control.private = True
+        response.cache_control.max_age = WEBVTT_MAX_AGE
+        return response
+
+    @XBlock.handler
+    def search_transcript(self, request, _suffix=''):
+        """
+        Search transcript for a query, so that learners can jump to where a term is mentioned.
+
+        Arguments:
+            request (webob.Request): The request to handle.
+                Query parameters: `q` - search query, `lang` - transcript's language
+                (current captions language if omitted), `limit` - maximum number of results.
+            suffix (string): not used
+        Returns:
+            webob.Response: (json) {'lang': 'en', 'query': 'term',
+                'results': [{'start': 601.5, 'end': 604.0, 'snippet': '...', 'score': 1.2}]}
+        """
+        lang = request.GET.get('lang') or self.captions_language
+        query = request.GET.get('q', '').strip()
+        try:
+            limit = min(int(request.GET.get('limit') or 10), SEARCH_RESULTS_LIMIT)
+        except ValueError:
+            return Response(status=400)
+        if not query:
+            return Response(status=400)
+
+        try:
+            search_index = self.get_transcript_search_index(lang)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Transcript search indexing failure: [{}]".format(lang))
+            search_index = None
+        if search_index is None:
+            return Response(status=404)
+
+        return Response(json={'lang': lang, 'query': query, 'results': search_index.search(query, limit)})
+
+    @XBlock.handler
+    def fetch_from_three_play_media(self, request, suffix=''):
         """
         Proxy handler to hide real API url.
 
         Arguments:
             request (webob.Request): The request to handle
-            suffix (string): not used
+            suffix (string): "clipped" to clip transcripts to video's start and end time, see `get_clip_window`.
             query string: 'language_id=transcript_id'
         Returns:
             webob.Response: WebVTT transcripts wrapped in Response object.
@@ -366,7 +835,9 @@ class TranscriptsMixin(XBlock):
         transcript = self.fetch_single_3pm_translation(transcript_data={'id': transcript_id, 'language_id': lang_id})
         if transcript is None:
             return Response()
-        return Response(transcript.content, content_type='text/vtt')
+        window = self.get_clip_window() if suffix == 'clipped' else None
+        content = self.clip_transcript(transcript.content, window) if window else transcript.content
+        return Response(content, content_type='text/vtt')
 
     @XBlock.handler
     def validate_three_play_media_config(self, request, _suffix=''):
@@ -580,11 +1051,7 @@ class SettingsMixin(XBlock):
                 "account_id": "1234567890"
             }
         """
-        settings = import_from('django.conf', 'settings')
-        if not hasattr(settings, 'XBLOCK_SETTINGS'):
-            return {}
-
-        return settings.XBLOCK_SETTINGS.get('video_xblock', {})
+        return xblock_settings()
 
 
 class LocationMixin(XBlock):
@@ -0,0 +1,106 @@
+"""
+In-video transcripts search.
+
+Transcript's cues are indexed by terms they contain, so that learners can jump to the moments where a term is
+mentioned. Index refers to cues by their positions in `webvtt.CueIndex`, which keeps cues' timings and text.
+"""
+
+from array import array
+import heapq
+import math
+import re
+import sys
+
+from .webvtt import normalize_cue_text
+
+TOKEN_RE = re.compile(r'\w+')
+SNIPPET_LENGTH = 120  # characters
+
+
+def tokenize(text):
+    """
+    Split text into case-insensitive terms.
+    """
+    return TOKEN_RE.findall(text.casefold())
+
+
+def get_cue_text(text):
+    """
+    Make plain single-line text out of cue's text.
+    """
+    return ' '.join(filter(None, (normalize_cue_text(line) for line in text.split('\n'))))
+
+
+def make_snippet(text, terms, length=SNIPPET_LENGTH):
+    """
+    Cut a snippet of up to `length` characters out of text, around the first occurrence of a term.
+    """
+    if len(text) <= length:
+        return text
+    folded_text = text.casefold()
+    found = [position for position in (folded_text.find(term) for term in terms) if position >= 0]
+    start = max(min(found, default=0) - length // 3, 0)
+    start = min(start, len(text) - length)
+    end = start + length
+    snippet = text[start:end]
+    # Drop words cut in the middle:
+    if start and not text[start - 1].isspace():
+        snippet = snippet.split(' ', 1)[-1]
+    if end < len(text) and not text[end].isspace():
+        snippet = snippet.rsplit(' ', 1)[0]
+    return '{}{}{}'.format('...' if start else '', snippet.strip(), '...' if end < len(text) else '')
+
+
+class TranscriptSearchIndex(object):
+    """
+    Inverted index of transcript's cues: term -> positions of cues containing the term.
+
+    Positions are kept in compact arrays, terms are interned, so that they are shared by all indexes in a process.
+    """
+
+    def __init__(self, cue_index):
+        """
+        Index cues of a transcript.
+
+        Arguments:
+            cue_index (webvtt.CueIndex): Transcript's cues.
+        """
+        self.cue_index = cue_index
+        self.postings = {}
+        for position in range(len(cue_index)):
+            for term in set(tokenize(get_cue_text(cue_index.cue(position)[2]))):
+                self.postings.setdefault(sys.intern(term), array('I')).append(position)
+
+    def search(self, query, limit=10):
+        """
+        Find cues matching a query.
+
+        Cues containing more of query's terms rank higher, rare terms weigh more than frequent ones;
+        earlier cues go first among equally ranked ones.
+
+        Arguments:
+            query (str): Search query.
+            limit (int): Maximum number of results.
+        Returns:
+            list: Results as dicts with cue's `start` and `end` times (in seconds), `snippet` and `score`.
+        """
+        terms = set(tokenize(query))
+        scores = {}
+        for term in terms:
+            positions = self.postings.get(term)
+            if not positions:
+                continue
+            weight = math.log(1 + len(self.cue_index) / float(len(positions)))
+            for position in positions:
+                scores[position] = scores.get(position, 0) + weight
+
+        results = []
+        for position, score in heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0])):
+            start, end, text = self.cue_index.cue(position)
+            results.append({
+                'start': start / 1000.0,
+                'end': end / 1000.0,
+                'snippet': make_snippet(get_cue_text(text), terms),
+                'score': round(score, 3),
+            })
+        return results
@@ -0,0 +1,169 @@
+"""
+Shared HTTP session used to talk to video platforms' and 3PlayMedia APIs.
+
+Keeps connections to API hosts alive between requests, so that TCP and TLS handshakes aren't repeated.
+Pool sizes and timeouts can be configured with `http` xblock setting, e.g.:
+
+    "XBLOCK_SETTINGS": {
+        "video_xblock": {
+            "http": {"pool_connections": 10, "pool_maxsize": 10, "connect_timeout": 5, "read_timeout": 30}
+        }
+    }
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+import http.client as httplib
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .cache import get_cache_backend, make_cache_key
+from .utils import xblock_settings
+
+DEFAULT_SETTINGS = {
+    'pool_connections': 10,  # number of hosts to keep connections pools for
+    'pool_maxsize': 10,  # number of connections to keep per host
+    'connect_timeout': 5,  # seconds
+    'read_timeout': 30,  # seconds
+}
+
+VALIDATED_RESPONSE_TIMEOUT = 7 * 24 * 3600  # seconds to keep responses revalidated with their `ETag`
+
+_session = None  # pylint: disable=invalid-name
+_transports = {}  # URL prefix -> transport adapter
+_lock = threading.Lock()  # pylint: disable=invalid-name
+
+
+def get_settings():
+    """
+    Return HTTP session settings, taking xblock settings into account.
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(xblock_settings().get('http', {}))
+    return settings
+
+
+def create_session():
+    """
+    Create HTTP session with connections pools configured by xblock settings.
+
+    Session doesn't keep cookies, since it's shared by requests made on behalf of different courses.
+    """
+    settings = get_settings()
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=settings['pool_connections'], pool_maxsize=settings['pool_maxsize'])
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    for prefix, transport in _transports.items():
+        session.mount(prefix, transport)
+    return session
+
+
+def get_session():
+    """
+    Return HTTP session shared by the process, create it on first use.
+    """
+    global _session  # pylint: disable=global-statement,invalid-name
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def reset_session():
+    """
+    Close shared HTTP session, so that a new one is created on next request.
+    """
+    global _session  # pylint: disable=global-statement,invalid-name
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+def mount_transport(prefix, transport):
+    """
+    Send requests to URLs starting with `prefix` through given transport adapter, e.g. a local stand-in in tests.
+    """
+    _transports[prefix] = transport
+    reset_session()
+
+
+def unmount_transport(prefix):
+    """
+    Stop sending requests to URLs starting with `prefix` through a custom transport adapter.
+    """
+    _transports.pop(prefix, None)
+    reset_session()
+
+
+def request(method, url, **kwargs):
+    """
+    Send HTTP request through shared session, with default timeouts.
+
+    Accepts the same arguments as `requests.request`.
+    """
+    settings = get_settings()
+    kwargs.setdefault('timeout', (settings['connect_timeout'], settings['read_timeout']))
+    return get_session().request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    """
+    Send GET request through shared session.
+    """
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    """
+    Send POST request through shared session.
+    """
+    return request('POST', url, **kwargs)
+
+
+def head(url, **kwargs):
+    """
+    Send HEAD request through shared session. Redirects aren't followed, same as `requests.head` does.
+    """
+    kwargs.setdefault('allow_redirects', False)
+    return request('HEAD', url, **kwargs)
+
+
+def get_revalidated(url, **kwargs):
+    """
+    Send GET request, revalidating the response received last time with its `ETag`.
+
+    Responses having `ETag` are kept in video xblock cache. If server answers `304 Not Modified`
+    to the conditional request, a copy of the kept response is returned, so callers handle it as usual.
+    Servers not supporting `ETag` get plain GET requests.
+    """
+    params = kwargs.pop('params', None)
+    if params:
+        url = requests.Request('GET', url, params=params).prepare().url
+    backend = get_cache_backend()
+    cache_key = make_cache_key('validated_response', url)
+    validated = backend.get(cache_key)
+    if validated is not None:
+        kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'If-None-Match': validated['etag']})
+    response = get(url, **kwargs)
+
+    if response.status_code == httplib.NOT_MODIFIED and validated is not None:
+        not_modified, response = response, requests.Response()
+        response.status_code = httplib.OK
+        response.headers = CaseInsensitiveDict(validated['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response._content = validated['content']  # pylint: disable=protected-access
+    elif response.status_code == httplib.OK and response.headers.get('ETag'):
+        backend.set(cache_key, {
+            'etag': response.headers['ETag'],
+            'headers': {name: response.headers[name] for name in ('Content-Type', 'ETag') if name in response.headers},
+            'content': response.content,
+        }, VALIDATED_RESPONSE_TIMEOUT)
+    return response
@@ -8,6 +8,7 @@ function getHandlers(runtime, element) {
     return {
         downloadTranscript: runtime.handlerUrl(element, 'download_transcript'),
         authenticateVideoApi: runtime.handlerUrl(element, 'authenticate_video_api_handler'),
+        loadDefaultTranscripts: runtime.handlerUrl(element, 'load_default_transcripts'),
         uploadDefaultTranscript: runtime.handlerUrl(element, 'upload_default_transcript_handler'),
         validateThreePlayMediaConfig: runtime.handlerUrl(element, 'validate_three_play_media_config'),
         saveState: runtime.handlerUrl(element, 'save_player_state'),
@@ -9,6 +9,7 @@ describe('Runtime handlers', function() {
     var handlersMap = {
         downloadTranscript: 'download_transcript',
         authenticateVideoApi: 'authenticate_video_api_handler',
+        loadDefaultTranscripts: 'load_default_transcripts',
         uploadDefaultTranscript: 'upload_default_transcript_handler',
         validateThreePlayMediaConfig: 'validate_three_play_media_config',
         saveState: 'save_player_state',
@@ -29,8 +29,8 @@ function StudioEditableXBlock(runtime, element) {
     var transcriptsValue = [];
     var disabledLanguages = [];
     var $fileUploader = $('.input-file-uploader', element);
-    var $defaultTranscriptUploader = $('.upload-default-transcript');
-    var $defaultTranscriptRemover = $('.remove-default-transcript');
+    var $defaultTranscriptUploader;
+    var $defaultTranscriptRemover;
     var $standardTranscriptUploader = $('.add-transcript');
     var $standardTranscriptRemover = $('.remove-action');
     var $langChoiceItem = $('.language-transcript-selector', element);
@@ -667,50 +667,102 @@ function StudioEditableXBlock(runtime, element) {
         standardTranscriptRemovalWrapper(event);
     });
 
-    $defaultTranscriptUploader.click(function(event) {
-        var $currentTarget = $(event.currentTarget);
-        var langCode = $currentTarget.attr('data-lang-code');
-        var label = $currentTarget.attr('data-lang-label');
-        var url = $currentTarget.attr('data-download-url');
-        var source = $currentTarget.attr('data-source');
-        var defaultTranscript = {
-            lang: langCode,
-            label: label,
-            url: url,
-            source: source
-        };
-        event.preventDefault();
-        event.stopPropagation();
-        currentLanguageCode = langCode;
-        // Affect default transcripts
-        uploadDefaultTranscriptsToServer(defaultTranscript);
-        // Affect standard transcripts
-        createTranscriptBlock(langCode, label, transcriptsValue, runtimeHandlers.downloadTranscript);
-    });
+    /** Bind listeners to default transcripts' upload and removal links.
+     */
+    function bindDefaultTranscriptsListeners() {
+        $defaultTranscriptUploader = $('.upload-default-transcript');
+        $defaultTranscriptRemover = $('.remove-default-transcript');
+        $defaultTranscriptUploader.click(function(event) {
+            var $currentTarget = $(event.currentTarget);
+            var langCode = $currentTarget.attr('data-lang-code');
+            var label = $currentTarget.attr('data-lang-label');
+            var url = $currentTarget.attr('data-download-url');
+            var source = $currentTarget.attr('data-source');
+            var defaultTranscript = {
+                lang: langCode,
+                label: label,
+                url: url,
+                source: source
+            };
+            event.preventDefault();
+            event.stopPropagation();
+            currentLanguageCode = langCode;
+            // Affect default transcripts
+            uploadDefaultTranscriptsToServer(defaultTranscript);
+            // Affect standard transcripts
+            createTranscriptBlock(langCode, label, transcriptsValue, runtimeHandlers.downloadTranscript);
+        });
 
-    $defaultTranscriptRemover.click(function(event) {
-        var $currentTarget = $(event.currentTarget);
-        var langCode = $currentTarget.attr('data-lang-code');
-        var langLabel = $currentTarget.attr('data-lang-label');
-        var downloadUrl = $currentTarget.attr('data-download-url');
-        var defaultTranscript = {
-            lang: langCode,
-            label: langLabel,
-            url: downloadUrl
-        };
-        // Affect default transcripts
-        removeEnabledTranscriptBlock(defaultTranscript, initialDefaultTranscriptsData);
-        createAvailableTranscriptBlock(defaultTranscript, initialDefaultTranscriptsData);
-        bindUploadListenerAvailableTranscript(langCode, langLabel);
-        // Affect standard transcripts
-        removeStandardTranscriptBlock(langCode, transcriptsValue, disabledLanguages);
-        disableOption($langChoiceItem, disabledLanguages);
-        event.preventDefault();
-    });
+        $defaultTranscriptRemover.click(function(event) {
+            var $currentTarget = $(event.currentTarget);
+            var langCode = $currentTarget.attr('data-lang-code');
+            var langLabel = $currentTarget.attr('data-lang-label');
+            var downloadUrl = $currentTarget.attr('data-download-url');
+            var defaultTranscript = {
+                lang: langCode,
+                label: langLabel,
+                url: downloadUrl
+            };
+            // Affect default transcripts
+            removeEnabledTranscriptBlock(defaultTranscript, initialDefaultTranscriptsData);
+            createAvailableTranscriptBlock(defaultTranscript, initialDefaultTranscriptsData);
+            bindUploadListenerAvailableTranscript(langCode, langLabel);
+            // Affect standard transcripts
+            removeStandardTranscriptBlock(langCode, transcriptsValue, disabledLanguages);
+            disableOption($langChoiceItem, disabledLanguages);
+            event.preventDefault();
+        });
+    }
+
+    /**
+     * Authenticate to video platform's API and fetch default transcripts, once the editor is rendered.
+     * Default transcripts section is replaced with the one rendered by backend.
+     * @param {Boolean} refresh Fetch default transcripts list from video platform, rather than from the cache.
+     */
+    function loadDefaultTranscripts(refresh) {
+        $.ajax({
+            type: 'POST',
+            url: runtimeHandlers.loadDefaultTranscripts,
+            data: JSON.stringify({refresh: !!refresh}),
+            dataType: 'json'
+        })
+        .done(function(response) {
+            var $wrapper = $(response.default_transcripts_html).find('.default-transcripts-wrapper');
+            var timedOutMessages = [];
+            // Let a user know that video platform hasn't responded in time, and what's shown may be outdated
+            if ($.inArray('authentication', response.timed_out) !== -1) {
+                timedOutMessages.push(response.auth_error_message);
+            }
+            if ($.inArray('default_transcripts', response.timed_out) !== -1) {
+                timedOutMessages.push(response.transcripts_autoupload_message);
+            }
+            if (timedOutMessages.length) {
+                $('<div class="default-transcripts-status status-error default-transcripts-timed-out"></div>')
+                    .text(timedOutMessages.join(' '))
+                    .prependTo($wrapper);
+            }
+            $('.default-transcripts-wrapper', element).replaceWith($wrapper);
+            initialDefaultTranscriptsData = getInitialDefaultTranscriptsData();
+            initialDefaultTranscripts = initialDefaultTranscriptsData[0];
+            bindDefaultTranscriptsListeners();
+        })
+        .fail(function() {
+            $('.default-transcripts-loading', element).text(gettext('Failed to fetch default transcripts.'));
+        });
+    }
 
     $defaultTranscriptsSwitcher.change(function() {
         $enabledLabel.toggleClass('is-hidden', $('.enabled-default-transcripts-section:visible').length);
         $availableLabel.toggleClass('is-hidden', $('.available-default-transcripts-section:visible').length);
     });
+
+    $(element).on('click', '.refresh-default-transcripts', function(event) {
+        event.preventDefault();
+        $(event.currentTarget).addClass('is-disabled');
+        loadDefaultTranscripts(true);
+    });
+
+    bindDefaultTranscriptsListeners();
+    loadDefaultTranscripts(false);
     // End of Raccoongang addons
 }
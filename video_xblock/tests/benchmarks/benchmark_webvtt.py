@@ -0,0 +1,64 @@
+"""
+Benchmark built-in WebVTT converter against pycaption on long transcripts.
+
+Run with `make benchmark` or `python -m video_xblock.tests.benchmarks.benchmark_webvtt [hours]`.
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from pycaption import detect_format, WebVTTWriter
+
+from video_xblock import webvtt
+
+
+def make_srt(hours):
+    """
+    Generate SRT transcript with a 3-second cue for every 4 seconds of a `hours` long video.
+    """
+    def timestamp(seconds):  # pylint: disable=missing-docstring
+        return '{:02d}:{:02d}:{:02d},{:03d}'.format(seconds // 3600, seconds // 60 % 60, seconds % 60, 250)
+
+    cues = []
+    for number, start in enumerate(range(0, hours * 3600, 4), 1):
+        cues.append('{}\n{} --> {}\nCue number {} of a <i>long</i> lecture,\nsecond line & more text\n'.format(
+            number, timestamp(start), timestamp(start + 3), number
+        ))
+    return '\n'.join(cues)
+
+
+def convert_with_pycaption(caps):
+    """
+    Convert transcript the way video xblock did before the built-in converter.
+    """
+    return WebVTTWriter().write(detect_format(caps)().read(caps))
+
+
+def measure(convert, caps, number=3):
+    """
+    Return best run time and peak memory allocated by `convert(caps)`.
+    """
+    best_time = min(timeit.repeat(lambda: convert(caps), number=1, repeat=number))
+    tracemalloc.start()
+    convert(caps)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best_time, peak
+
+
+def main(hours=3):
+    """
+    Print benchmark results for SRT->VTT and VTT->VTT conversions.
+    """
+    srt = make_srt(hours)
+    vtt = webvtt.convert_to_vtt(srt)
+    print('{}-hour transcript: {} cues, {:.1f} KB'.format(hours, srt.count('-->'), len(srt) / 1024.0))
+    for name, caps in (('SRT->VTT', srt), ('VTT->VTT', vtt)):
+        for converter, convert in (('built-in', webvtt.convert_to_vtt), ('pycaption', convert_with_pycaption)):
+            seconds, peak = measure(convert, caps)
+            print('{:<10}{:<11}{:>9.3f} s{:>11.1f} MB peak'.format(name, converter, seconds, peak / 1024.0 ** 2))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,47 @@
+"""
+Benchmark conversion of Youtube timed text into WebVTT on long transcripts.
+
+Run with `make benchmark` or `python -m video_xblock.tests.benchmarks.benchmark_youtube [hours ...]`.
+"""
+
+import io
+import sys
+import timeit
+import tracemalloc
+
+from mock import Mock
+
+from video_xblock.backends.youtube import YoutubePlayer
+
+
+def make_timedtext(hours):
+    """
+    Generate Youtube timed text with a cue for every 4 seconds of a `hours` long video.
+    """
+    cues = ''.join(
+        '<text start="{}.25" dur="3.5">Cue number {} of a long lecture,\nsecond line &amp;#39;quoted&amp;#39;</text>'
+        .format(start, number) for number, start in enumerate(range(0, hours * 3600, 4), 1)
+    )
+    return '<?xml version="1.0" encoding="utf-8" ?><transcript>{}</transcript>'.format(cues).encode('utf8')
+
+
+def main(*hours_list):
+    """
+    Print conversion time, cues throughput and peak memory allocated by the parser.
+    """
+    player = YoutubePlayer(Mock())
+    for hours in hours_list or (1, 3):
+        xml = make_timedtext(hours)
+        cues = xml.count(b'<text ')
+        seconds = min(timeit.repeat(lambda: player.convert_transcript_to_vtt(io.BytesIO(xml)), number=1, repeat=3))
+        tracemalloc.start()
+        vtt = player.convert_transcript_to_vtt(io.BytesIO(xml))
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print('{}-hour transcript: {} cues, {:.3f} s, {:.0f} cues/s, {:.1f} MB peak ({:.1f} MB output)'.format(
+            hours, cues, seconds, cues / seconds, peak / 1024.0 ** 2, len(vtt) / 1024.0 ** 2
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -5,9 +5,13 @@ import json
 import unittest
 
 import mock
+from django.core.cache import cache
 from xblock.field_data import DictFieldData
 from xblock.test.tools import TestRuntime
 
+from video_xblock.backends.base import reset_circuit_breakers
+from video_xblock.cache import local_cache
+from video_xblock.mixins import search_index_cache
 from video_xblock.video_xblock import VideoXBlock
 
 
@@ -32,6 +36,10 @@ class VideoXBlockTestBase(unittest.TestCase):
         Create a XBlock VideoXBlock for testing purpose.
         """
         super(VideoXBlockTestBase, self).setUp()
+        cache.clear()
+        local_cache.clear()
+        search_index_cache.clear()
+        reset_circuit_breakers()
         runtime = TestRuntime()  # pylint: disable=abstract-class-instantiated
         self.xblock = VideoXBlock(
             runtime,
@@ -55,7 +63,8 @@ class VideoXBlockTestBase(unittest.TestCase):
         Restore state of mocked entities.
         """
         if self.mocked_objects:
-            for original in self.mocked_objects:
+            # Restore in reverse order, since the same entity may have been mocked several times.
+            for original in reversed(self.mocked_objects):
                 for index, attr in enumerate(original['attrs']):
                     setattr(original['obj'], attr, original['value'][index])
             self.mocked_objects = []
@@ -5,9 +5,8 @@ import json
 from copy import deepcopy
 from collections import OrderedDict
 from mock import Mock
-import requests
-
 
+from video_xblock import sessions
 from video_xblock.exceptions import VideoXBlockMockException
 
 
@@ -21,6 +20,8 @@ class ResponseStub(object):
         Delegate kwargs to class properties.
         """
         self.ok = True  # pylint: disable=invalid-name
+        self.status_code = 200
+        self.headers = {}
 
         for key, val in list(kwargs.items()):
             setattr(self, key, val)
@@ -63,6 +64,11 @@ class ResponseStub(object):
         """
         return getattr(self, 'body', '')
 
+    def close(self):
+        """
+        Make response compatible with requests.Response.
+        """
+
 
 class BaseMock(Mock):
     """
@@ -131,9 +137,9 @@ class BaseMock(Mock):
         Save state of object before mocks are applied.
         """
         mocked_objects.append({
-            'obj': requests,
+            'obj': sessions,
             'attrs': ['get', ],
-            'value': [deepcopy(requests.get), ]
+            'value': [deepcopy(sessions.get), ]
         })
         return mocked_objects
 
@@ -153,12 +159,12 @@ class MockCourse(object):
 
 class RequestsMock(BaseMock):
     """
-    Base class for mocking `requests.get`.
+    Base class for mocking `sessions.get`.
     """
 
     def get(self):
         """
-        Mock method that substitutes `requests.get` one.
+        Mock method that substitutes `sessions.get` one.
         """
         raise NotImplementedError
 
@@ -167,5 +173,5 @@ class RequestsMock(BaseMock):
         Save state of auth related entities before mocks are applied.
         """
         super(RequestsMock, self).apply_mock(mocked_objects)
-        requests.get = self.get()
+        sessions.get = self.get()
         return mocked_objects
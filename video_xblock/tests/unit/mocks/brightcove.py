@@ -224,7 +224,7 @@ accessed from mobile devices."""
 
     def get(self):
         """
-        Substitute requests.get method.
+        Substitute sessions.get method.
         """
         self.return_value = ResponseStub(status_code=200, body=self._vtt)
         return lambda x: self.return_value
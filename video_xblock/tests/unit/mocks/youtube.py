@@ -2,6 +2,8 @@
 """
 Youtube backend mocks.
 """
+import io
+
 from xblock.core import XBlock
 
 from video_xblock.backends import youtube
@@ -28,9 +30,9 @@ class YoutubeDefaultTranscriptsMock(BaseMock):
 
     _default_transcripts = [
         {'label': 'English', 'lang': 'en', 'source': 'default',
-         'url': 'http://video.google.com/timedtext?v=set_video_id_here&lang=en&name='},
+         'url': 'http://video.google.com/timedtext?v=44zaxzFsthY&lang=en&name='},
         {'label': 'Ukrainian', 'lang': 'uk', 'source': 'default',
-         'url': 'http://video.google.com/timedtext?v=set_video_id_here&lang=uk&name='}
+         'url': 'http://video.google.com/timedtext?v=44zaxzFsthY&lang=uk&name='}
     ]
 
     outcomes = (
@@ -136,10 +138,11 @@ Forse me la canto e me la suono da sola un po',
 
     def get(self):
         """
-        Substitute requests.get method.
+        Substitute sessions.get method.
         """
         if self.event == 'no_xml_data':
-            self.return_value = ResponseStub(status_code=200, body=b'{}')
+            body = b'{}'
         else:
-            self.return_value = ResponseStub(status_code=200, body=bytes(self._xml, 'utf-8'))
-        return lambda x: self.return_value
+            body = bytes(self._xml, 'utf-8')
+        self.return_value = ResponseStub(status_code=200, body=body, raw=io.BytesIO(body))
+        return lambda x, **kwargs: self.return_value
@@ -1,16 +1,19 @@
 """
 Test cases for video_xblock backends.
 """
+import io
 import unittest
 
 import babelfish
 import requests
 from ddt import ddt, data, unpack
+from django.core.cache import cache
 from django.test.utils import override_settings
 from lxml import etree
 from mock import PropertyMock, Mock, patch
 from xblock.core import XBlock
 
+from video_xblock import webvtt
 from video_xblock.backends import (
     base,
     brightcove,
@@ -31,6 +34,7 @@ from video_xblock.tests.unit.mocks import (
 )
 from video_xblock.tests.unit.mocks.base import ResponseStub
 from video_xblock.utils import ugettext as _
+from video_xblock.video_xblock import VideoXBlock
 
 
 class TestBaseBackendFunctionality(unittest.TestCase):
@@ -49,6 +53,186 @@ class TestBaseBackendFunctionality(unittest.TestCase):
         self.assertFalse(self.base_player.default_transcripts_in_vtt)
         self.assertEqual(self.base_player.media_id(href=Mock()), "")
 
+    def test_default_transcripts_cached(self):
+        """
+        Test transcripts lists are cached by platform, account and media id until invalidated, empty ones as well.
+        """
+        # Arrange
+        cache.clear()
+        self.base_player.xblock.player_name = 'test-player'
+        transcripts = [{'lang': 'en', 'label': 'English', 'url': 'en_url', 'source': 'default'}]
+        fetch_results = [(transcripts, ''), (transcripts, 'Refetched.'), ([], 'No transcripts.')]
+
+        # Act & Assert
+        with patch.object(self.base_player, 'get_default_transcripts', side_effect=fetch_results) as fetch_mock:
+            for _ in range(2):
+                self.assertEqual(
+                    self.base_player.get_cached_default_transcripts(video_id='video', account_id='account'),
+                    (transcripts, '')
+                )
+            self.base_player.invalidate_default_transcripts(video_id='video', account_id='account')
+            self.assertEqual(
+                self.base_player.get_cached_default_transcripts(video_id='video', account_id='account'),
+                (transcripts, 'Refetched.')
+            )
+            for _ in range(2):
+                self.assertEqual(
+                    self.base_player.get_cached_default_transcripts(video_id='video', token='token'),
+                    ([], 'No transcripts.')
+                )
+        self.assertEqual(fetch_mock.call_count, 3)
+
+
+@patch('video_xblock.backends.base.time.sleep')
+@patch('video_xblock.backends.base.xblock_settings', return_value={})
+class ApiRequestResilienceTest(unittest.TestCase):
+    """
+    Test retries and circuit breaking of API requests.
+    """
+
+    url = 'https://api.example.com/videos'
+
+    def setUp(self):
+        base.reset_circuit_breakers()
+
+    @patch('video_xblock.sessions.get')
+    def test_retried_after_delay(self, get_mock, _settings_mock, sleep_mock):
+        """
+        Test 429 and 5xx responses are retried after `Retry-After` or jittered exponential backoff delay.
+        """
+        # Arrange
+        get_mock.side_effect = [
+            ResponseStub(status_code=429, headers={'Retry-After': '2'}),
+            ResponseStub(status_code=503),
+            ResponseStub(status_code=200, body='OK'),
+        ]
+
+        # Act
+        response = base.send_api_request('GET', self.url, timeout=3)
+
+        # Assert
+        self.assertEqual(response.text, 'OK')
+        self.assertEqual(get_mock.call_count, 3)
+        get_mock.assert_called_with(self.url, timeout=3)
+        (first_delay,), _kwargs = sleep_mock.call_args_list[0]
+        (second_delay,), _kwargs = sleep_mock.call_args_list[1]
+        self.assertEqual(first_delay, 2)
+        self.assertTrue(0 <= second_delay <= 1)  # up to `backoff` doubled once
+
+    @patch('video_xblock.sessions.post')
+    def test_not_processed_requests_retried_only(self, post_mock, settings_mock, sleep_mock):
+        """
+        Test POST requests are retried only if they haven't been processed, long `Retry-After` isn't waited for.
+        """
+        # Arrange
+        settings_mock.return_value = {'api_retry': {'attempts': 5}}
+        post_mock.side_effect = [
+            ResponseStub(status_code=429, headers={'Retry-After': '1'}),
+            ResponseStub(status_code=500),
+            ResponseStub(status_code=429, headers={'Retry-After': '3600'}),
+        ]
+
+        # Act & Assert
+        self.assertEqual(base.send_api_request('POST', self.url).status_code, 500)
+        self.assertEqual(base.send_api_request('POST', self.url).status_code, 429)
+        self.assertEqual(post_mock.call_count, 3)
+        sleep_mock.assert_called_once_with(1.0)
+
+    @patch('video_xblock.sessions.get')
+    def test_rate_limited(self, get_mock, settings_mock, sleep_mock):
+        """
+        Test requests wait for their turn within account's rate limit, or are shed, and 429 response drains quota.
+        """
+        # Arrange
+        cache.clear()
+        settings_mock.return_value = {'api_rate_limit': {
+            'default': {'rate': 1, 'burst': 2}, 'vimeo': {'policy': 'shed'}
+        }}
+        get_mock.side_effect = [
+            ResponseStub(status_code=429, headers={'Retry-After': '1'}),
+        ] + [ResponseStub(status_code=200)] * 3
+
+        # Act & Assert
+        self.assertEqual(base.send_api_request('GET', self.url, rate_limit_key=('wistia', 'token')).status_code, 200)
+        for _ in range(2):
+            base.send_api_request('GET', self.url, rate_limit_key=('vimeo', 'token'))
+        with self.assertRaises(base.RateLimitExceeded):
+            base.send_api_request('GET', self.url, rate_limit_key=('vimeo', 'token'))
+        self.assertEqual(get_mock.call_count, 4)
+        (retry_delay,), _kwargs = sleep_mock.call_args_list[0]
+        (turn_delay,), _kwargs = sleep_mock.call_args_list[1]
+        self.assertEqual(sleep_mock.call_count, 2)
+        self.assertEqual(retry_delay, 1)
+        self.assertTrue(0.9 < turn_delay <= 1)  # one token left is drained
+
+    @patch('video_xblock.backends.base.time.time')
+    @patch('video_xblock.sessions.get')
+    def test_circuit_breaker(self, get_mock, time_mock, settings_mock, _sleep_mock):
+        """
+        Test requests to a failing host fail fast, until a trial request succeeds.
+        """
+        # Arrange
+        settings_mock.return_value = {
+            'api_retry': {'attempts': 2}, 'api_circuit_breaker': {'failure_threshold': 3, 'reset_timeout': 30}
+        }
+        time_mock.return_value = 1000
+        get_mock.side_effect = requests.exceptions.ConnectTimeout('timed out')
+
+        # Act & Assert
+        with self.assertRaises(requests.exceptions.ConnectTimeout):
+            base.send_api_request('GET', self.url)
+        with self.assertRaises(base.CircuitOpenError):
+            base.send_api_request('GET', self.url)  # retry isn't sent once failure threshold is reached
+        with self.assertRaises(base.CircuitOpenError):
+            base.send_api_request('GET', self.url + '/other')
+        self.assertEqual(get_mock.call_count, 3)
+
+        time_mock.return_value = 1030
+        get_mock.side_effect = None
+        get_mock.return_value = ResponseStub(status_code=200, body='OK')
+        self.assertEqual(base.send_api_request('GET', self.url).text, 'OK')
+        self.assertEqual(base.send_api_request('GET', self.url).text, 'OK')
+        with patch('video_xblock.sessions.get', side_effect=AssertionError('Other hosts are not affected')):
+            with self.assertRaises(AssertionError):
+                base.send_api_request('GET', 'https://other.example.com/')
+
+    @patch('video_xblock.backends.base.time.time')
+    @patch('video_xblock.sessions.get')
+    def test_circuit_trial_request_not_sent(self, get_mock, time_mock, settings_mock, _sleep_mock):
+        """
+        Test circuit doesn't stay open once trial request fails with non-transient error, or isn't sent at all.
+        """
+        # Arrange
+        cache.clear()
+        settings_mock.return_value = {
+            'api_retry': {'attempts': 1}, 'api_circuit_breaker': {'failure_threshold': 1, 'reset_timeout': 30},
+            'api_rate_limit': {'default': {'rate': 0.001, 'burst': 1, 'policy': 'shed'}},
+        }
+        time_mock.return_value = 1000
+        get_mock.side_effect = requests.exceptions.ConnectionError('refused')
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            base.send_api_request('GET', self.url, rate_limit_key=('vimeo', 'token'))  # rate limit is used up
+
+        # Act & Assert
+        time_mock.return_value = 1030
+        get_mock.side_effect = requests.exceptions.ChunkedEncodingError('broken body')
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            base.send_api_request('GET', self.url)
+        with self.assertRaises(base.CircuitOpenError):
+            base.send_api_request('GET', self.url)
+
+        time_mock.return_value = 1060
+        with self.assertRaises(base.RateLimitExceeded):
+            base.send_api_request('GET', self.url, rate_limit_key=('vimeo', 'token'))
+        get_mock.side_effect = ValueError('not a request failure')
+        with self.assertRaises(ValueError):
+            base.send_api_request('GET', self.url)
+
+        get_mock.side_effect = None
+        get_mock.return_value = ResponseStub(status_code=200, body='OK')
+        self.assertEqual(base.send_api_request('GET', self.url).text, 'OK')
+        self.assertEqual(get_mock.call_count, 4)
+
 
 @ddt
 class TestCustomBackends(VideoXBlockTestBase):
@@ -110,6 +294,33 @@ class TestCustomBackends(VideoXBlockTestBase):
             res = player(self.xblock).get_player_html(**context)
             self.assertIn('window.videojs', str(res.body))
 
+    def test_get_player_html_with_asset_urls(self):
+        """
+        Check that player's static assets are referenced by URLs if configured so.
+        """
+        context = {
+            'player_state': {
+                'transcripts': [{
+                    'lang': 'en',
+                    'label': 'English',
+                    'url': 'http://test.url'
+                }],
+                'currentTime': ''
+            },
+            'url': 'https://example.com/video.mp4',
+            'start_time': '',
+            'end_time': ''
+        }
+        self.xblock.runtime.handler_url = Mock(side_effect=lambda block, name, suffix: '/{}/{}'.format(name, suffix))
+        with patch.object(VideoXBlock, 'settings', new_callable=PropertyMock) as settings_mock:
+            settings_mock.return_value = {'player_assets': 'url'}
+            for backend in self.backends:
+                player = self.player[backend]
+                res = player(self.xblock).get_player_html(**context)
+                self.assertIn('/player_asset/public/static/js/videojs/videojs-event-plugin.', str(res.body))
+                self.assertIn('/player_asset/public/static/js/base.', str(res.body))
+                self.assertNotIn('window.videojs', str(res.body))
+
     expected_basic_fields = [
         ['display_name', 'href'],
         ['display_name', 'href', 'account_id'],
@@ -377,6 +588,86 @@ class TestCustomBackends(VideoXBlockTestBase):
         self.assertEqual(download_video_url, delegate_mock)
 
 
+class YoutubePlayerTest(VideoXBlockTestBase):
+    """
+    Test Youtube backend player functionality.
+    """
+
+    def setUp(self):
+        super(YoutubePlayerTest, self).setUp()
+        self.youtube_player = youtube.YoutubePlayer(self.xblock)
+
+    def test_convert_transcript_to_vtt(self):
+        """
+        Test Youtube timed text is converted into WebVTT, skipping empty cues; cues without duration last
+        until the next one starts.
+        """
+        # Arrange
+        xml = (
+            b'<?xml version="1.0" encoding="utf-8" ?><transcript>'
+            b'<text start="59.9996" dur="3600">A &amp;lt; B &amp;amp;\nC</text>'
+            b'<text start="3661">No duration</text>'
+            b'<text start="3662" dur="1"></text>'
+            b'<text start="3662.5">Last</text></transcript>'
+        )
+
+        # Act
+        vtt = self.youtube_player.convert_transcript_to_vtt(io.BytesIO(xml))
+
+        # Assert
+        self.assertEqual(vtt, (
+            'WEBVTT\n\n'
+            '1\n00:01:00.000 --> 01:00:59.999\nA &lt; B &amp; C\n\n'
+            '2\n01:01:01.000 --> 01:01:01.999\nNo duration\n\n'
+            '3\n01:01:02.500 --> 01:01:04.499\nLast\n\n'
+        ))
+        self.assertTrue(webvtt.validate_vtt(vtt))
+
+    def test_convert_transcript_to_vtt_clears_elements(self):
+        """
+        Test processed timed text elements are dropped while transcript is being parsed.
+        """
+        # Arrange
+        xml = b'<transcript>' + b''.join(
+            '<text start="{}" dur="1">Cue {}</text>'.format(i, i).encode('utf8') for i in range(100)
+        ) + b'</transcript>'
+        parsed_elements = []
+        iterparse = etree.iterparse
+
+        def iterparse_spy(*args, **kwargs):  # pylint: disable=missing-docstring
+            for event, element in iterparse(*args, **kwargs):
+                parsed_elements.append(element)
+                yield event, element
+
+        # Act
+        with patch('video_xblock.backends.youtube.etree.iterparse', iterparse_spy):
+            vtt = self.youtube_player.convert_transcript_to_vtt(io.BytesIO(xml))
+
+        # Assert
+        self.assertEqual(vtt.count(' --> '), 100)
+        self.assertEqual(len(parsed_elements), 100)
+        self.assertTrue(all(element.getparent() is None for element in parsed_elements[:-1]))
+        self.assertTrue(all(len(element) == 0 and element.text is None for element in parsed_elements))
+
+    @patch('video_xblock.sessions.get')
+    def test_download_default_transcript_streamed(self, requests_get_mock):
+        """
+        Test Youtube transcript is parsed from the response stream, and the response is closed.
+        """
+        # Arrange
+        body = b'<transcript><text start="1" dur="1">Hello</text></transcript>'
+        requests_get_mock.return_value = response = ResponseStub(status_code=200, raw=io.BytesIO(body))
+        response.close = Mock()
+
+        # Act
+        vtt = self.youtube_player.download_default_transcript(url='http://example.com')
+
+        # Assert
+        self.assertEqual(vtt, 'WEBVTT\n\n1\n00:00:01.000 --> 00:00:01.999\nHello\n\n')
+        requests_get_mock.assert_called_once_with('http://example.com', stream=True)
+        response.close.assert_called_once_with()
+
+
 class VimeoApiClientTest(VideoXBlockTestBase):
     """
     Test Vimeo backend API client.
@@ -387,7 +678,7 @@ class VimeoApiClientTest(VideoXBlockTestBase):
         self.vimeo_api_client = vimeo.VimeoApiClient(token='test_token')
         self.vimeo_player = vimeo.VimeoPlayer(self.xblock)
 
-    @patch('video_xblock.backends.vimeo.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_api_client_get_200(self, requests_get_mock):
         """
         Test Vimeo's API client GET method if status Ok returned.
@@ -406,7 +697,7 @@ class VimeoApiClientTest(VideoXBlockTestBase):
         })
         self.assertEqual(response, test_body)
 
-    @patch('video_xblock.backends.vimeo.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_api_client_get_400(self, requests_get_mock):
         """
         Test Vimeo's API client GET method if status 400 returned.
@@ -482,7 +773,9 @@ class VimeoApiClientTest(VideoXBlockTestBase):
             transcripts, message = self.vimeo_player.get_default_transcripts(video_id="test_video_id")
 
             # Assert
-            api_client_mock.get.assert_called_with('https://api.vimeo.com/videos/test_video_id/texttracks')
+            api_client_mock.get.assert_called_with(
+                'https://api.vimeo.com/videos/test_video_id/texttracks', revalidate=True
+            )
             parse_texttracks_mock.assert_called_with(test_json_data["data"])
 
             self.assertIsInstance(transcripts, list)
@@ -564,14 +857,14 @@ class VimeoApiClientTest(VideoXBlockTestBase):
             self.assertEqual(message, failure_message)
 
     @patch('video_xblock.backends.vimeo.remove_escaping')
-    @patch('video_xblock.backends.vimeo.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_vimeo_download_default_transcript(self, requests_get_mock, unescape_mock):
         """
         Test Vimeo's default transcripts downloading.
         """
         # Arrange
         test_file_data = "test_file_data"
-        requests_get_mock.return_value = Mock(content=test_file_data)
+        requests_get_mock.return_value = Mock(status_code=200, text=test_file_data)
 
         # Act
         self.vimeo_player.download_default_transcript(url='test_url')
@@ -591,7 +884,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.wistia_player = wistia.WistiaPlayer(self.xblock)
 
     @patch('video_xblock.backends.wistia.babelfish.Language')
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_success(self, requests_get_mock, babel_mock):
         """
         Test Wistia's default transcripts fetching (positive scenario).
@@ -627,7 +920,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
             self.assertEqual(transcripts, test_transcripts)
             self.assertEqual(message, test_message)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_api_failure(self, requests_get_mock):
         """
         Test Wistia's default transcripts fetching (request failure).
@@ -649,7 +942,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(transcripts, [])
         self.assertEqual(message, test_message)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_wrong_video(self, requests_get_mock):
         """
         Test Wistia's default transcripts fetching (not found case).
@@ -671,7 +964,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(transcripts, [])
         self.assertEqual(message, test_message)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_bad_request_or_else(self, requests_get_mock):
         """
         Test Wistia's default transcripts fetching (request.ok == False).
@@ -693,7 +986,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(transcripts, [])
         self.assertEqual(message, test_message)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_bad_json(self, requests_get_mock):
         """
         Test Wistia's default transcripts fetching (can't parse response JSON).
@@ -717,7 +1010,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(message, test_message)
 
     @patch('video_xblock.backends.wistia.babelfish.Language')
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_get_default_transcripts_baberlfish(self, requests_get_mock, babel_mock):
         """
         Test Wistia's default transcripts fetching (babelfish fallback).
@@ -754,7 +1047,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
             self.assertEqual(transcripts, test_transcripts)
             self.assertEqual(message, test_message)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_download_default_transcript_success(self, requests_get_mock):
         """
         Test Wistia's default transcripts downloading (positive scenario).
@@ -773,7 +1066,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(content, 'test_content')
         requests_get_mock.assert_called_once_with(test_url)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_download_default_transcript_api_failure(self, requests_get_mock):
         """
         Test Wistia's default transcripts downloading (request failure).
@@ -791,7 +1084,7 @@ class WistiaPlayerTest(VideoXBlockTestBase):
         self.assertEqual(content, '')
         requests_get_mock.assert_called_once_with(test_url)
 
-    @patch('video_xblock.backends.wistia.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_wistia_download_default_transcript_parsing_failure(self, requests_get_mock):
         """
         Test Wistia's default transcripts downloading (request parsing failure).
@@ -819,7 +1112,7 @@ class BrightcovePlayerTest(VideoXBlockTestBase):
         super(BrightcovePlayerTest, self).setUp()
         self.bc_player = brightcove.BrightcovePlayer(self.xblock)
 
-    @patch('video_xblock.backends.brightcove.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_brightcove_get_default_transcripts_no_text(self, requests_get_mock):
         """
         Test Brightcove's default transcripts fetching (empty text fetched).
@@ -844,6 +1137,72 @@ class BrightcovePlayerTest(VideoXBlockTestBase):
         self.assertEqual(transcripts, [])
         self.assertEqual(message, test_message)
 
+    @patch('video_xblock.sessions.post')
+    def test_brightcove_access_token_shared(self, requests_post_mock):
+        """
+        Test Brightcove access token is shared by API clients and refreshed once rejected.
+        """
+        # Arrange
+        requests_post_mock.side_effect = [
+            ResponseStub(status_code=200, body={'access_token': 'first_token', 'expires_in': 300}),
+            ResponseStub(status_code=200, body={'access_token': 'second_token', 'expires_in': 300}),
+            ResponseStub(status_code=401, body={}),
+        ]
+
+        # Act
+        api_clients = [brightcove.BrightcoveApiClient('test_client_id', 'test_secret') for _ in range(3)]
+        refreshed_token = api_clients[0]._refresh_access_token(  # pylint: disable=protected-access
+            rejected_token='first_token'
+        )
+        wrong_secret_client = brightcove.BrightcoveApiClient('test_client_id', 'wrong_secret')
+
+        # Assert
+        self.assertEqual([api_client.access_token for api_client in api_clients], ['first_token'] * 3)
+        self.assertEqual(refreshed_token, 'second_token')
+        self.assertEqual(brightcove.BrightcoveApiClient('test_client_id', 'test_secret').access_token, 'second_token')
+        self.assertIsNone(wrong_secret_client.access_token)
+        self.assertEqual(requests_post_mock.call_count, 3)
+
+    @patch('video_xblock.sessions.post')
+    def test_brightcove_access_token_failure_not_cached(self, requests_post_mock):
+        """
+        Test Brightcove access token failures aren't cached.
+        """
+        # Arrange
+        requests_post_mock.side_effect = [
+            ResponseStub(status_code=401, body={}),
+            ResponseStub(status_code=200, body={'access_token': 'test_token', 'expires_in': 300}),
+        ]
+
+        # Act & Assert
+        self.assertIsNone(brightcove.BrightcoveApiClient('test_client_id', 'test_secret').access_token)
+        self.assertEqual(brightcove.BrightcoveApiClient('test_client_id', 'test_secret').access_token, 'test_token')
+
+    @patch('video_xblock.sessions.get')
+    @patch('video_xblock.sessions.post')
+    def test_brightcove_requests_rate_limited_by_account(self, requests_post_mock, requests_get_mock):
+        """
+        Test Brightcove OAuth and CMS API requests share the same account's rate limit.
+        """
+        # Arrange
+        requests_post_mock.side_effect = [
+            ResponseStub(status_code=201, body={'client_id': 'client_id', 'client_secret': 'secret'}),
+            ResponseStub(status_code=200, body={'access_token': 'test_token', 'expires_in': 300}),
+        ]
+        requests_get_mock.return_value = ResponseStub(status_code=200, body={})
+        self.xblock.account_id = '1234'
+
+        # Act
+        with patch('video_xblock.backends.base.get_rate_limiter', return_value=(None, 0)) as get_rate_limiter_mock:
+            client_secret, client_id, _message = brightcove.BrightcoveApiClient.create_credentials('token', '1234')
+            self.xblock.metadata = {'client_id': client_id, 'client_secret': client_secret}
+            brightcove.BrightcovePlayer(self.xblock).api_client.get('https://cms.api.brightcove.com/v1/test')
+
+        # Assert
+        self.assertEqual(
+            [args for args, _kwargs in get_rate_limiter_mock.call_args_list], [(('brightcove', '1234'),)] * 3
+        )
+
     @patch('video_xblock.backends.brightcove.BrightcoveApiClient.create_credentials')
     def test_brightcove_authenticate_api(self, api_client_create_creds_mock):
         """
@@ -0,0 +1,220 @@
+"""
+Test caching helpers.
+"""
+
+import itertools
+import unittest
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from mock import patch, Mock
+
+from video_xblock.cache import LRUCache, TokenBucket, TTLCache, cache_lock, get_cache_backend, local_cache
+
+
+class SyncThread(object):
+    """
+    Stand-in for `threading.Thread` running target synchronously.
+    """
+
+    def __init__(self, target, **_kwargs):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+class LRUCacheTest(unittest.TestCase):
+    """
+    Test in-process LRU cache.
+    """
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test least recently used items are evicted once cache is full.
+        """
+        # Arrange
+        lru = LRUCache(max_entries=2)
+        lru.set('a', 1)
+        lru.set('b', 2)
+
+        # Act
+        lru.get('a')
+        lru.set('c', 3)
+
+        # Assert
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('c'), 3)
+
+    @patch('video_xblock.cache.time.time')
+    def test_expires_items(self, time_mock):
+        """
+        Test items are expired after timeout.
+        """
+        # Arrange
+        lru = LRUCache()
+        time_mock.return_value = 100
+        lru.set('a', 1, timeout=10)
+
+        # Act & Assert
+        time_mock.return_value = 109
+        self.assertEqual(lru.get('a'), 1)
+        time_mock.return_value = 110
+        self.assertEqual(lru.get('a', 'expired'), 'expired')
+
+    @patch('video_xblock.cache.caches')
+    def test_get_cache_backend_fallback(self, caches_mock):
+        """
+        Test in-process cache is used if Django cache isn't configured.
+        """
+        caches_mock.__getitem__.side_effect = ImproperlyConfigured()
+        self.assertIs(get_cache_backend(), local_cache)
+
+    def test_cache_lock(self):
+        """
+        Test cache lock is acquired once at a time and gives up waiting after a while.
+        """
+        cache.clear()
+        with cache_lock('test_key') as acquired:
+            with cache_lock('test_key', wait=0.1) as acquired_again:
+                self.assertTrue(acquired)
+                self.assertFalse(acquired_again)
+        with cache_lock('test_key') as acquired:
+            self.assertTrue(acquired)
+
+
+@patch('video_xblock.cache.threading.Thread', SyncThread)
+@patch('video_xblock.cache.time.time')
+class TTLCacheTest(unittest.TestCase):
+    """
+    Test remote resources cache.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.ttl_cache = TTLCache('test', ttl=10, stale_ttl=100, negative_ttl=5)
+
+    def test_fresh_value_served_from_cache(self, time_mock):
+        """
+        Test fresh value is fetched only once.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        fetch = Mock(return_value='value')
+
+        # Act
+        values = [self.ttl_cache.get_or_set(('key',), fetch) for _ in range(3)]
+
+        # Assert
+        self.assertEqual(values, ['value'] * 3)
+        fetch.assert_called_once_with()
+
+    def test_stale_value_served_while_revalidated(self, time_mock):
+        """
+        Test stale value is served and refreshed, and is kept if refresh fails.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        fetch = Mock(side_effect=['old', None, 'new'])
+        self.ttl_cache.get_or_set(('key',), fetch)
+        time_mock.return_value = 1020
+
+        # Act & Assert
+        self.assertEqual(self.ttl_cache.get_or_set(('key',), fetch), 'old')  # refresh fails
+        self.assertEqual(self.ttl_cache.get_or_set(('key',), fetch), 'old')  # refresh succeeds
+        self.assertEqual(self.ttl_cache.get_or_set(('key',), fetch), 'new')
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_failures_cached(self, time_mock):
+        """
+        Test failures are cached for a negative caching period.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        fetch = Mock(side_effect=[None, 'value'])
+
+        # Act & Assert
+        self.assertIsNone(self.ttl_cache.get_or_set(('key',), fetch))
+        self.assertIsNone(self.ttl_cache.get_or_set(('key',), fetch))
+        time_mock.return_value = 1005
+        self.assertEqual(self.ttl_cache.get_or_set(('key',), fetch), 'value')
+
+    def test_get_and_set(self, time_mock):
+        """
+        Test values are read from the cache without fetching, stale values included.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        self.ttl_cache.set(('key',), 'value')
+
+        # Act
+        time_mock.return_value = 1050
+
+        # Assert
+        self.assertEqual(self.ttl_cache.get(('key',)), 'value')
+        self.assertEqual(self.ttl_cache.get(('missing',), 'default'), 'default')
+
+    def test_timeouts_overridden_by_settings(self, _time_mock):
+        """
+        Test default timeouts can be overridden with xblock settings.
+        """
+        ttl_cache = TTLCache('test', ttl=10, settings_key='test_cache')
+        with patch('video_xblock.cache.xblock_settings', return_value={'test_cache': {'ttl': 20}}):
+            self.assertEqual(ttl_cache.get_timeout('ttl'), 20)
+            self.assertEqual(ttl_cache.get_timeout('negative_ttl'), 60)
+
+
+@patch('video_xblock.cache.time.time')
+class TokenBucketTest(unittest.TestCase):
+    """
+    Test rate limiter.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_reserve(self, time_mock):
+        """
+        Test burst of requests is let through, next ones wait for their turn unless it's too long to wait.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        bucket = TokenBucket(('test', 'account'), rate=2, burst=2)
+
+        # Act & Assert
+        self.assertEqual([bucket.reserve(max_wait=1) for _ in range(5)], [0, 0, 0.5, 1, None])
+        time_mock.return_value = 1001
+        self.assertEqual(bucket.reserve(), None)
+        self.assertEqual(TokenBucket(('test', 'another account'), rate=2, burst=2).reserve(), 0)
+        time_mock.return_value = 1001.5
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_drain(self, time_mock):
+        """
+        Test drained bucket is refilled from empty.
+        """
+        # Arrange
+        time_mock.return_value = 1000
+        bucket = TokenBucket(('test', 'account'), rate=1, burst=10)
+
+        # Act
+        bucket.drain()
+
+        # Assert
+        self.assertEqual(bucket.reserve(max_wait=5), 1)
+        time_mock.return_value = 1002
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_contended_lock(self, time_mock):
+        """
+        Test request is treated as exceeding the rate if bucket's lock can't be acquired in time.
+        """
+        # Arrange
+        time_mock.side_effect = itertools.count(1000, 0.1)
+        bucket = TokenBucket(('test', 'account'), rate=1, burst=10)
+
+        # Act & Assert
+        with cache_lock(bucket.cache_key):
+            self.assertIsNone(bucket.reserve(max_wait=1))
+        self.assertEqual(bucket.reserve(max_wait=1), 0)
@@ -0,0 +1,146 @@
+"""
+Test video platforms' backends used by many threads at once.
+
+Requests are answered by a local stand-in of video platforms' APIs, mounted to the shared HTTP session.
+"""
+
+from concurrent import futures
+import io
+import json
+import re
+import time
+
+from ddt import ddt, data
+from django.test.utils import override_settings
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from video_xblock import sessions
+from video_xblock.backends import brightcove, vimeo, wistia, youtube
+from video_xblock.settings import ALL_LANGUAGES
+from video_xblock.tests.unit.base import VideoXBlockTestBase
+
+THREADS = 8
+VIDEOS_PER_THREAD = 4
+
+
+class PlatformsStandIn(BaseAdapter):
+    """
+    Local transport adapter answering the same way video platforms' APIs do.
+
+    Each answer names the video it's given for, so that mixed up requests are noticed.
+    Answers are slightly delayed to let threads interleave.
+    """
+
+    prefixes = [
+        'http://video.google.com/',
+        'http://api.wistia.com/',
+        'https://api.wistia.com/',
+        'https://oauth.brightcove.com/',
+        'https://cms.api.brightcove.com/',
+        'https://api.vimeo.com/',
+        'https://captions.example.com/',
+    ]
+    routes = [
+        # Youtube transcripts list and transcript:
+        (r'http://video\.google\.com/timedtext\?type=list&v=(?P<video_id>\w+)$', lambda video_id: (
+            '<transcript_list docid="1">'
+            '<track id="0" name="{0}" lang_code="en" lang_translated="English"/>'
+            '<track id="1" name="{0}" lang_code="uk" lang_translated="Ukrainian"/>'
+            '</transcript_list>'.format(video_id)
+        )),
+        (r'http://video\.google\.com/timedtext\?v=(?P<video_id>\w+)&lang=\w+&name=\w+$', lambda video_id: (
+            '<transcript><text start="0" dur="1.5">{}</text></transcript>'.format(video_id)
+        )),
+        # Wistia transcripts list and transcript:
+        (r'https://api\.wistia\.com/v1/medias/(?P<video_id>\w+)/captions\.json', lambda video_id: json.dumps(
+            [{'language': 'eng', 'english_name': 'English'}, {'language': 'ukr', 'english_name': 'Ukrainian'}]
+        )),
+        (r'http://api\.wistia\.com/v1/medias/(?P<video_id>\w+)/captions/\w+\.json', lambda video_id: json.dumps(
+            {'text': 'WEBVTT\n\n00:00.000 --> 00:01.000\n{}\n'.format(video_id)}
+        )),
+        # Brightcove access token and transcripts list:
+        (r'https://oauth\.brightcove\.com/v3/access_token', lambda: json.dumps(
+            {'access_token': 'test-access-token', 'expires_in': 300}
+        )),
+        (r'https://cms\.api\.brightcove\.com/v1/accounts/\w+/videos/(?P<video_id>\w+)$', lambda video_id: json.dumps(
+            {'text_tracks': [{'src': 'https://captions.example.com/{}.vtt'.format(video_id), 'srclang': 'en'}]}
+        )),
+        # Vimeo transcripts list:
+        (r'https://api\.vimeo\.com/videos/(?P<video_id>\w+)/texttracks$', lambda video_id: json.dumps(
+            {'data': [{'language': 'en', 'link': 'https://captions.example.com/{}.vtt'.format(video_id)}]}
+        )),
+        # Brightcove and Vimeo transcripts:
+        (r'https://captions\.example\.com/(?P<video_id>\w+)\.vtt$', lambda video_id: (
+            'WEBVTT\n\n00:00.000 --> 00:01.000\n{}\n'.format(video_id)
+        )),
+    ]
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        time.sleep(0.001)
+        response = Response()
+        response.status_code = 404
+        body = ''
+        for url_re, answer in self.routes:
+            match = re.match(url_re, request.url)
+            if match:
+                response.status_code = 200
+                body = answer(**match.groupdict())
+                break
+        response.raw = io.BytesIO(body.encode('utf-8'))
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@ddt
+class BackendsConcurrencyTest(VideoXBlockTestBase):
+    """
+    Test default transcripts of different videos fetched by many threads don't get mixed up.
+    """
+
+    def setUp(self):
+        super(BackendsConcurrencyTest, self).setUp()
+        self.xblock.token = 'test-token'
+        transport = PlatformsStandIn()
+        for prefix in transport.prefixes:
+            sessions.mount_transport(prefix, transport)
+            self.addCleanup(sessions.unmount_transport, prefix)
+
+    def fetch_default_transcripts(self, player_class, video_id):
+        """
+        Fetch transcripts list of a video and download its transcripts, the way Studio editor does.
+        """
+        player = player_class(self.xblock)
+        default_transcripts, _message = player.get_default_transcripts(
+            video_id=video_id, account_id='1234567890', token='test-token'
+        )
+        return [
+            (transcript['url'], player.download_default_transcript(transcript['url'], transcript['lang']))
+            for transcript in default_transcripts
+        ]
+
+    @override_settings(ALL_LANGUAGES=ALL_LANGUAGES)
+    @data(youtube.YoutubePlayer, wistia.WistiaPlayer, brightcove.BrightcovePlayer, vimeo.VimeoPlayer)
+    def test_default_transcripts_fetched_concurrently(self, player_class):
+        """
+        Test each thread gets transcripts of its own video.
+        """
+        # Arrange
+        video_ids = ['video{}'.format(number) for number in range(THREADS * VIDEOS_PER_THREAD)]
+
+        # Act
+        with futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(
+                lambda video_id: self.fetch_default_transcripts(player_class, video_id), video_ids
+            ))
+
+        # Assert
+        for video_id, transcripts in zip(video_ids, results):
+            self.assertTrue(transcripts)
+            for url, content in transcripts:
+                self.assertEqual(set(re.findall(r'video\d+', url)), {video_id})
+                self.assertEqual(re.findall(r'video\d+', content), [video_id])
@@ -3,23 +3,34 @@ VideoXBlock mixins test cases.
 """
 
 import json
+import threading
 from collections import Iterable, OrderedDict
+from datetime import datetime, timedelta
 
 import requests
+from ddt import ddt, data, unpack
 from django.test import RequestFactory
 from django.test.utils import override_settings
 from mock import patch, Mock, MagicMock, PropertyMock
-from webob import Response
+from webob import Request, Response
 from xblock.exceptions import NoSuchServiceError
 
+from video_xblock import webvtt
 from video_xblock.constants import DEFAULT_LANG, TPMApiLanguage, Status
 from video_xblock.tests.unit.base import VideoXBlockTestBase
+from video_xblock.tests.unit.test_cache import SyncThread
 from video_xblock.tests.unit.mocks.base import ResponseStub
 from video_xblock.tests.unit.test_video_xblock_handlers import arrange_request_mock
 from video_xblock.utils import loader, Transcript, ugettext as _
 from video_xblock.video_xblock import VideoXBlock
 
 
+class NotFoundError(Exception):
+    """
+    Stand-in for contentstore's `xmodule.exceptions.NotFoundError`.
+    """
+
+
 class ContentStoreMixinTest(VideoXBlockTestBase):
     """Test ContentStoreMixin"""
 
@@ -57,6 +68,16 @@ class ContentStoreMixinTest(VideoXBlockTestBase):
             service_mock.assert_called_once_with(self.xblock, 'contentstore')
             cs_mock.assert_called_once()
 
+    @patch('video_xblock.mixins.import_from')
+    def test_not_found_error_no_service(self, import_mock):
+        """
+        Test contentstore's exception is imported.
+        """
+        import_mock.return_value = NotFoundError
+
+        self.assertIs(self.xblock.not_found_error, NotFoundError)
+        import_mock.assert_called_once_with('xmodule.exceptions', 'NotFoundError')
+
     def test_static_content(self):
         """
         Test xBlock's StaticContent property works properly.
@@ -322,6 +343,7 @@ class SettingsMixinTests(VideoXBlockTestBase):
         self.assertIsInstance(populated_field.default, bool)
 
 
+@ddt
 class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inherits-tests
     """
     Test TranscriptsMixin
@@ -352,6 +374,16 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         vtt_writer_mock.assert_not_called()
         detect_format_mock.assert_called_once_with('test caps')
 
+    @patch('video_xblock.mixins.detect_format')
+    def test_convert_caps_to_vtt_srt(self, detect_format_mock):
+        """
+        Test SRT transcript is converted into WebVTT without pycaption.
+        """
+        caps = '1\n00:00:01,000 --> 00:00:02,000\nHello\n'
+
+        self.assertEqual(self.xblock.convert_caps_to_vtt(caps), 'WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello\n')
+        detect_format_mock.assert_not_called()
+
     @patch.object(VideoXBlock, 'static_content')
     @patch.object(VideoXBlock, 'contentstore')
     @patch.object(VideoXBlock, 'course_key', new_callable=PropertyMock)
@@ -380,30 +412,72 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         self.assertEqual(file_name, 'test_transcripts.vtt')
         self.assertEqual(external_url, '/test-location.vtt')
 
-    @patch.object(VideoXBlock, 'get_file_name_from_path')
-    @patch('video_xblock.mixins.requests.get')
-    def test_download_transcript_handler_response_object(self, get_mock, get_filename_mock):
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    def test_download_transcript_handler_response_object(self, find_asset_mock):
         """
         Test transcripts downloading works properly.
         """
         # Arrange
-        get_filename_mock.return_value = 'transcript.vtt'
-        get_mock.return_value.text = 'vtt transcripts'
-        request_mock = MagicMock()
-        request_mock.host_url = 'test.host'
-        request_mock.query_string = '/test-query-string'
+        find_asset_mock.return_value = Mock(
+            content_digest='test-digest', last_modified_at=datetime(2021, 8, 27, 10, 0, 0, 500),
+            length=15, stream_data=lambda: iter([b'vtt ', b'transcripts'])
+        )
+        request = Request.blank('/handler?/asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.vtt')
 
         # Act
-        vtt_response = self.xblock.download_transcript(request_mock, 'unused suffix')
+        vtt_response = self.xblock.download_transcript(request, 'unused suffix')
 
         # Assert
         self.assertIsInstance(vtt_response, Response)
-        self.assertEqual(vtt_response.text, 'vtt transcripts')
-        self.assertEqual(vtt_response.headerlist, [
-            ('Content-Type', 'text/plain'),
-            ('Content-Disposition', 'attachment; filename={}'.format('transcript.vtt'))
-        ])
-        get_mock.assert_called_once_with('test.host/test-query-string')
+        self.assertEqual(vtt_response.status_code, 200)
+        self.assertEqual(vtt_response.body, b'vtt transcripts')
+        self.assertEqual(vtt_response.headers['Content-Type'], 'text/plain')
+        self.assertEqual(vtt_response.headers['Content-Disposition'], 'attachment; filename=transcript.vtt')
+        self.assertEqual(vtt_response.headers['Content-Length'], '15')
+        self.assertEqual(vtt_response.headers['ETag'], '"test-digest"')
+        self.assertEqual(vtt_response.headers['Last-Modified'], 'Fri, 27 Aug 2021 10:00:00 GMT')
+        find_asset_mock.assert_called_once_with('transcript.vtt', as_stream=True)
+
+    @data(
+        {'If-None-Match': '"test-digest"'},
+        {'If-Modified-Since': 'Fri, 27 Aug 2021 10:00:00 GMT'},
+    )
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    def test_download_transcript_handler_not_modified(self, headers, find_asset_mock):
+        """
+        Test transcripts downloading answers conditional requests.
+        """
+        # Arrange
+        find_asset_mock.return_value = asset_mock = Mock(
+            content_digest='test-digest', last_modified_at=datetime(2021, 8, 27, 10, 0, 0, 500)
+        )
+        request = Request.blank(
+            '/handler?/asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.vtt', headers=headers
+        )
+
+        # Act
+        vtt_response = self.xblock.download_transcript(request, 'unused suffix')
+
+        # Assert
+        self.assertEqual(vtt_response.status_code, 304)
+        self.assertEqual(vtt_response.body, b'')
+        asset_mock.stream_data.assert_not_called()
+
+    @data('download_transcript', 'srt_to_vtt')
+    @patch.object(VideoXBlock, 'not_found_error', new_callable=PropertyMock, return_value=NotFoundError)
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    def test_transcript_handler_not_found(self, handler_name, find_asset_mock, _not_found_error_mock):
+        """
+        Test transcripts downloading and conversion of a missing asset, other failures aren't masked.
+        """
+        handler = getattr(self.xblock, handler_name)
+        request = Request.blank('/handler?/asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.vtt')
+
+        find_asset_mock.side_effect = NotFoundError()
+        self.assertEqual(handler(request, 'unused suffix').status_code, 404)
+        find_asset_mock.side_effect = TypeError()
+        with self.assertRaises(TypeError):
+            handler(request, 'unused suffix')
 
     @patch.object(VideoXBlock, 'captions_language', new_callable=PropertyMock)
     @patch.object(VideoXBlock, 'transcripts', new_callable=PropertyMock)
@@ -445,28 +519,255 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
             self.assertIsInstance(transcripts_routes, Iterable)
             self.assertEqual(next(transcripts_routes), {'url': 'test-trans.vtt'})
             handler_url_mock.assert_called_once_with(
-                self.xblock, 'srt_to_vtt', query='test-trans.srt'
+                self.xblock, 'srt_to_vtt', '', query='test-trans.srt'
+            )
+
+    def test_route_transcripts_converted_on_save(self):
+        """
+        Test transcripts converted into WebVTT on save are routed to their WebVTT copies.
+        """
+        # Arrange
+        transcripts = [{"url": "/asset@test-trans.srt", "vtt_url": "/asset@test-trans_0123456789ab.vtt"}]
+        with patch.object(self.xblock, 'runtime') as runtime_mock, \
+                patch.object(self.xblock, 'get_enabled_transcripts') as get_enabled_transcripts_mock:
+            get_enabled_transcripts_mock.return_value = transcripts
+
+            # Act
+            transcripts_routes = list(self.xblock.route_transcripts())
+
+            # Assert
+            self.assertEqual(transcripts_routes[0]['url'], '/asset@test-trans_0123456789ab.vtt')
+            runtime_mock.handler_url.assert_not_called()
+
+    @patch('video_xblock.mixins.xblock_settings', Mock(return_value={'clip_transcripts': True}))
+    def test_route_transcripts_clipped(self):
+        """
+        Test transcripts are routed to handlers clipping them, if video's start or end time is set.
+        """
+        # Arrange
+        transcripts = [{"url": "/asset@test-trans.srt", "vtt_url": "/asset@test-trans_0123456789ab.vtt"}]
+        self.xblock.end_time = timedelta(seconds=90)
+        with patch.object(self.xblock, 'runtime') as runtime_mock, \
+                patch.object(self.xblock, 'get_enabled_transcripts') as get_enabled_transcripts_mock:
+            runtime_mock.handler_url.return_value = 'clipped-trans.vtt'
+            get_enabled_transcripts_mock.return_value = transcripts
+
+            # Act
+            transcripts_routes = list(self.xblock.route_transcripts())
+
+            # Assert
+            self.assertEqual(transcripts_routes[0]['url'], 'clipped-trans.vtt')
+            runtime_mock.handler_url.assert_called_once_with(
+                self.xblock, 'srt_to_vtt', 'clipped', query='/asset@test-trans_0123456789ab.vtt'
             )
 
-    @patch('video_xblock.mixins.requests', new_callable=MagicMock)
+    @patch.object(VideoXBlock, 'fetch_single_3pm_translation')
+    def test_fetch_from_three_play_media_clipped(self, fetch_single_3pm_translation_mock):
+        """
+        Test 3PlayMedia transcript is clipped to video's start and end time.
+        """
+        # Arrange
+        self.xblock.start_time = timedelta(seconds=60)
+        self.xblock.end_time = timedelta(seconds=120)
+        fetch_single_3pm_translation_mock.return_value = Mock(content=(
+            'WEBVTT\n\n00:00:30.000 --> 00:00:40.000\nBefore\n\n'
+            '00:00:55.000 --> 00:01:05.000\nStart\n\n'
+            '00:01:58.000 --> 00:02:05.000\nEnd\n\n'
+            '00:02:05.000 --> 00:02:10.000\nAfter\n'
+        ))
+        request = Request.blank('/handler?1=test_id')
+
+        # Act
+        response = self.xblock.fetch_from_three_play_media(request, 'clipped')
+        unclipped_response = self.xblock.fetch_from_three_play_media(request, '')
+
+        # Assert
+        self.assertEqual(response.text, (
+            'WEBVTT\n\n00:00:00.000 --> 00:00:05.000\nStart\n\n00:00:58.000 --> 00:01:00.000\nEnd\n\n'
+        ))
+        self.assertIn('After', unclipped_response.text)
+
+    @patch.object(VideoXBlock, 'create_transcript_file')
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    @patch.object(VideoXBlock, 'convert_caps_to_vtt')
+    def test_convert_transcript_to_vtt(self, convert_caps_to_vtt_mock, find_asset_mock, create_transcript_file_mock):
+        """
+        Test non-WebVTT transcript is converted once and its WebVTT copy is recorded.
+        """
+        # Arrange
+        convert_caps_to_vtt_mock.return_value = 'WEBVTT transcripts'
+        find_asset_mock.return_value = Mock(
+            content_digest='0123456789abcdef', stream_data=lambda: iter([b'srt ', b'transcripts'])
+        )
+        create_transcript_file_mock.return_value = (
+            'test-trans_0123456789ab.vtt', '/asset@test-trans_0123456789ab.vtt'
+        )
+        transcript = {'lang': 'en', 'url': '/asset@test-trans.srt'}
+
+        # Act
+        converted_transcript = self.xblock.convert_transcript_to_vtt(dict(transcript))
+        reconverted_transcript = self.xblock.convert_transcript_to_vtt(dict(converted_transcript))
+
+        # Assert
+        expected_transcript = dict(transcript, vtt_url='/asset@test-trans_0123456789ab.vtt')
+        self.assertEqual(converted_transcript, expected_transcript)
+        self.assertEqual(reconverted_transcript, expected_transcript)
+        find_asset_mock.assert_called_with('test-trans.srt', as_stream=True)
+        convert_caps_to_vtt_mock.assert_called_once_with('srt transcripts')
+        create_transcript_file_mock.assert_called_once_with(
+            trans_str='WEBVTT transcripts', reference_name='test-trans_0123456789ab'
+        )
+
+    @data(
+        ({'url': '/asset@test-trans.vtt', 'vtt_url': '/asset@outdated.vtt'}, Mock()),
+        ({'url': '/asset@test-trans.srt', 'vtt_url': '/asset@outdated.vtt'}, Exception('NotFoundError')),
+    )
+    @unpack
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    def test_convert_transcript_to_vtt_skipped(self, transcript, find_asset_result, find_asset_mock):
+        """
+        Test WebVTT transcripts and unavailable assets aren't converted.
+        """
+        find_asset_mock.side_effect = [find_asset_result]
+        self.assertNotIn('vtt_url', self.xblock.convert_transcript_to_vtt(transcript))
+
+    @patch.object(VideoXBlock, 'find_transcript_asset')
     @patch.object(VideoXBlock, 'convert_caps_to_vtt')
-    def test_srt_to_vtt(self, convert_caps_to_vtt_mock, requests_mock):
+    def test_srt_to_vtt(self, convert_caps_to_vtt_mock, find_asset_mock):
         """
         Test xBlock's srt-to-vtt convertation works properly.
         """
         # Arrange
-        request_mock = MagicMock()
         convert_caps_to_vtt_mock.return_value = 'vtt transcripts'
-        requests_mock.get.return_value.text = text_mock = PropertyMock()
-        text_mock.return_value = 'vtt transcripts'
+        find_asset_mock.return_value = Mock(
+            location='asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.srt', content_digest='test-digest',
+            locked=False, stream_data=lambda: iter([b'\xef\xbb\xbfsrt ', b'transcripts'])
+        )
+        request = Request.blank('/handler?/asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.srt')
 
         # Act
-        vtt_response = self.xblock.srt_to_vtt(request_mock, 'unused suffix')
+        vtt_response = self.xblock.srt_to_vtt(request, 'unused suffix')
+        cached_vtt_response = self.xblock.srt_to_vtt(request, 'unused suffix')
 
         # Assert
         self.assertIsInstance(vtt_response, Response)
         self.assertEqual(vtt_response.text, 'vtt transcripts')
-        convert_caps_to_vtt_mock.assert_called_once_with(text_mock)
+        self.assertEqual(cached_vtt_response.text, 'vtt transcripts')
+        self.assertEqual(vtt_response.headers['Content-Type'], 'text/vtt; charset=utf8')
+        self.assertEqual(vtt_response.headers['ETag'], '"vtt-test-digest"')
+        self.assertEqual(vtt_response.headers['Cache-Control'], 'max-age=3600, public')
+        find_asset_mock.assert_called_with('transcript.srt', as_stream=True)
+        convert_caps_to_vtt_mock.assert_called_once_with('srt transcripts')
+
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    @patch.object(VideoXBlock, 'route_transcripts')
+    def test_transcript_cues(self, route_transcripts_mock, find_asset_mock):
+        """
+        Test cues of a time window are returned, and cue index is built once.
+        """
+        # Arrange
+        route_transcripts_mock.side_effect = lambda: iter([
+            {'lang': 'en', 'source': 'manual', 'url': '/asset-v1:test+test+test+type@asset+block@en.srt'},
+        ])
+        find_asset_mock.return_value = Mock(
+            content_digest=None,
+            stream_data=lambda: iter([
+                b'1\n00:00:01,000 --> 00:00:05,000\nFirst\n\n'
+                b'2\n00:00:05,000 --> 00:00:09,500\nSecond\nline\n\n'
+                b'3\n00:00:10,000 --> 00:00:11,000\nThird\n'
+            ]),
+        )
+
+        # Act
+        response = self.xblock.transcript_cues(Request.blank('/handler?lang=en&from=4.5&to=10'), '')
+        cached_response = self.xblock.transcript_cues(Request.blank('/handler?lang=en&from=10.5'), '')
+
+        # Assert
+        self.assertEqual(response.json, {'lang': 'en', 'from': 4.5, 'to': 10.0, 'cues': [
+            {'start': 1.0, 'end': 5.0, 'text': 'First'},
+            {'start': 5.0, 'end': 9.5, 'text': 'Second\nline'},
+        ]})
+        self.assertEqual(cached_response.json['cues'], [{'start': 10.0, 'end': 11.0, 'text': 'Third'}])
+        self.assertEqual(response.headers['Cache-Control'], 'max-age=3600, private')
+        self.assertEqual(find_asset_mock.call_count, 2)  # content is read once
+
+    @data(
+        ('/handler?lang=en&from=start', 400),
+        ('/handler?lang=en&to=inf', 400),
+        ('/handler?lang=en&from=nan', 400),
+        ('/handler?lang=en&from=1e306', 400),
+        ('/handler?lang=en&to=-1e306', 400),
+        ('/handler?lang=fr', 404),
+    )
+    @unpack
+    @patch.object(VideoXBlock, 'route_transcripts')
+    def test_transcript_cues_bad_request(self, url, status, route_transcripts_mock):
+        """
+        Test bad requests for transcript's cues are rejected.
+        """
+        route_transcripts_mock.return_value = iter([{'lang': 'en', 'source': 'manual', 'url': 'en.vtt'}])
+
+        self.assertEqual(self.xblock.transcript_cues(Request.blank(url), '').status_code, status)
+
+    @patch.object(VideoXBlock, 'get_transcript_cue_index')
+    def test_search_transcript(self, get_cue_index_mock):
+        """
+        Test transcript is indexed on first search, and re-indexed once transcripts are changed.
+        """
+        # Arrange
+        self.xblock.transcripts = json.dumps([{'lang': 'en', 'label': 'English', 'url': 'en.vtt'}])
+        get_cue_index_mock.return_value = webvtt.CueIndex.from_vtt(
+            'WEBVTT\n\n00:01.000 --> 00:02.000\nHello world\n\n00:03.000 --> 00:04.000\nGoodbye world\n'
+        )
+        request = Request.blank('/handler?lang=en&q=hello')
+
+        # Act
+        response = self.xblock.search_transcript(request, '')
+        self.xblock.search_transcript(request, '')
+        self.xblock.transcripts = json.dumps([{'lang': 'en', 'label': 'English', 'url': 'new.vtt'}])
+        self.xblock.search_transcript(request, '')
+
+        # Assert
+        self.assertEqual(response.json['results'], [
+            {'start': 1.0, 'end': 2.0, 'snippet': 'Hello world', 'score': 1.099}
+        ])
+        self.assertEqual(get_cue_index_mock.call_count, 2)
+        self.assertEqual(get_cue_index_mock.call_args[0][0]['url'], 'new.vtt')
+
+    @data(
+        ('/handler?lang=en', 400),
+        ('/handler?lang=en&q=hello&limit=all', 400),
+        ('/handler?lang=fr&q=hello', 404),
+    )
+    @unpack
+    def test_search_transcript_bad_request(self, url, status):
+        """
+        Test bad transcript search requests are rejected.
+        """
+        self.xblock.transcripts = json.dumps([{'lang': 'en', 'label': 'English', 'url': 'en.vtt'}])
+
+        self.assertEqual(self.xblock.search_transcript(Request.blank(url), '').status_code, status)
+
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    @patch.object(VideoXBlock, 'convert_caps_to_vtt')
+    def test_srt_to_vtt_not_modified(self, convert_caps_to_vtt_mock, find_asset_mock):
+        """
+        Test xBlock's srt-to-vtt convertation answers conditional requests without conversion.
+        """
+        # Arrange
+        find_asset_mock.return_value = Mock(content_digest='test-digest', locked=True)
+        request = Request.blank(
+            '/handler?/asset-v1-RaccoonGang+1+2018+type@asset+block@transcript.srt',
+            headers={'If-None-Match': '"vtt-test-digest"'}
+        )
+
+        # Act
+        vtt_response = self.xblock.srt_to_vtt(request, 'unused suffix')
+
+        # Assert
+        self.assertEqual(vtt_response.status_code, 304)
+        self.assertEqual(vtt_response.headers['Cache-Control'], 'max-age=3600, private')
+        convert_caps_to_vtt_mock.assert_not_called()
 
     def test_fetch_available_3pm_transcripts_with_errors(self):
         """
@@ -487,21 +788,22 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
             self.assertRaises((StopIteration, RuntimeError), next, transcripts_gen)  # py3.5, py3.6+
             threepm_transcripts_mock.assert_called_once_with(file_id_mock, apikey_mock)
 
-    def test_fetch_available_3pm_transcripts_success(self):
+    @patch.object(VideoXBlock, 'get_player')
+    @patch('video_xblock.sessions.get')
+    def test_fetch_available_3pm_transcripts_success(self, requests_get_mock, player_mock):
         """
         Test available 3PlayMedia transcripts fetching (success case).
         """
         # Arrange:
         test_feedback = {'status': Status.success, 'message': 'test_message'}
-        test_transcripts_list = [{'id': 'test_id', 'language_id': '2'}]
+        test_transcripts_list = [{'id': 'test_id', 'language_id': '1'}, {'id': 'bad_id', 'language_id': '-1'}]
         test_args = ['id', 'label', 'lang', 'lang_id', 'content', 'format', 'video_id', 'source', 'url']
+        player_mock.return_value.media_id.return_value = 'test_video_id'
+        self.xblock.threeplaymedia_file_id = 'test_file_id'
+        self.xblock.threeplaymedia_apikey = 'test_api_key'
 
-        with patch.object(self.xblock, 'get_3pm_transcripts_list') as threepm_transcripts_mock, \
-                patch.object(self.xblock, 'fetch_single_3pm_translation') as fetch_3pm_translation_mock, \
-                patch.object(self.xblock, 'threeplaymedia_file_id') as file_id_mock, \
-                patch.object(self.xblock, 'threeplaymedia_apikey') as apikey_mock:
+        with patch.object(self.xblock, 'get_3pm_transcripts_list') as threepm_transcripts_mock:
             threepm_transcripts_mock.return_value = test_feedback, test_transcripts_list
-            fetch_3pm_translation_mock.return_value = Transcript(*test_args)
 
             # Act:
             transcripts_gen = self.xblock.fetch_available_3pm_transcripts()
@@ -512,11 +814,19 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
                 self.assertIsInstance(transcripts[0], OrderedDict)  # py3.5
             except AssertionError:
                 self.assertIsInstance(transcripts[0], dict)  # compat for py3.6+
+            self.assertEqual(len(transcripts), 1)  # unsupported language is skipped
             self.assertSequenceEqual(set(test_args), set(transcripts[0].keys()))
-            threepm_transcripts_mock.assert_called_once_with(file_id_mock, apikey_mock)
-            fetch_3pm_translation_mock.assert_called_once_with(test_transcripts_list[0])
+            self.assertEqual(transcripts[0]['content'], '')
+            self.assertEqual(transcripts[0]['lang'], 'en')
+            self.assertEqual(transcripts[0]['video_id'], 'test_video_id')
+            self.assertEqual(
+                transcripts[0]['url'],
+                'https://static.3playmedia.com/files/test_file_id/transcripts/test_id?apikey=test_api_key&format_id=51'
+            )
+            threepm_transcripts_mock.assert_called_once_with('test_file_id', 'test_api_key')
+            requests_get_mock.assert_not_called()  # transcripts' content isn't downloaded
 
-    @patch('video_xblock.mixins.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_get_3pm_transcripts_list_success(self, requests_get_mock):
         """
         Test fetching of the list of available 3PlayMedia transcripts (success case).
@@ -543,7 +853,7 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         self.assertEqual(feedback, test_feedback)
         requests_get_mock.assert_called_once_with(test_api_url)
 
-    @patch('video_xblock.mixins.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_get_3pm_transcripts_list_api_failure(self, requests_get_mock):
         """
         Test fetching of the list of available 3PlayMedia transcripts (api failure case).
@@ -565,7 +875,7 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         requests_get_mock.assert_called_once_with(test_api_url)
 
     @patch.object(VideoXBlock, 'get_player')
-    @patch('video_xblock.mixins.requests.get')
+    @patch('video_xblock.sessions.get')
     def test_fetch_single_3pm_translation_success(self, requests_get_mock, player_mock):
         """
         Test single 3PlayMedia transcript fetching (success case).
@@ -608,7 +918,78 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         # Assert:
         self.assertEqual(transcript, Transcript(*test_args))
 
-    @patch('video_xblock.mixins.requests.get')
+    @patch.object(VideoXBlock, 'get_player')
+    @patch('video_xblock.sessions.get')
+    def test_fetch_single_3pm_translation_cached(self, requests_get_mock, _player_mock):
+        """
+        Test single 3PlayMedia transcript is fetched once and then served from cache.
+        """
+        # Arrange:
+        requests_get_mock.return_value = ResponseStub(body='test_transcript_text')
+        self.xblock.threeplaymedia_file_id = 'test_file_id'
+        test_transcript_data = {'id': 'test_id', 'language_id': '1'}
+
+        # Act:
+        transcripts = [self.xblock.fetch_single_3pm_translation(test_transcript_data) for _ in range(2)]
+
+        # Assert:
+        self.assertEqual([transcript.content for transcript in transcripts], ['test_transcript_text'] * 2)
+        requests_get_mock.assert_called_once()
+
+    @patch.object(VideoXBlock, 'get_player')
+    @patch('video_xblock.sessions.get')
+    def test_fetch_single_3pm_translation_cached_per_api_key(self, requests_get_mock, _player_mock):
+        """
+        Test 3PlayMedia transcript cached for one API key isn't served to another one.
+        """
+        # Arrange:
+        requests_get_mock.side_effect = [
+            ResponseStub(body='test_transcript_text'), ResponseStub(ok=False, status_code=401)
+        ]
+        self.xblock.threeplaymedia_file_id = 'test_file_id'
+        self.xblock.threeplaymedia_apikey = 'test_api_key'
+        test_transcript_data = {'id': 'test_id', 'language_id': '1'}
+        self.xblock.fetch_single_3pm_translation(test_transcript_data)
+        self.xblock.threeplaymedia_apikey = 'other_api_key'
+
+        # Act:
+        transcript = self.xblock.fetch_single_3pm_translation(test_transcript_data)
+
+        # Assert:
+        self.assertIsNone(transcript)
+        self.assertEqual(requests_get_mock.call_count, 2)
+
+    @patch('video_xblock.cache.threading.Thread', SyncThread)
+    @patch('video_xblock.cache.time.time')
+    @patch.object(VideoXBlock, 'get_player')
+    @patch('video_xblock.sessions.get')
+    def test_fetch_single_3pm_translation_revoked_api_key(self, requests_get_mock, _player_mock, time_mock):
+        """
+        Test stale 3PlayMedia transcript is dropped once API key is rejected.
+        """
+        # Arrange:
+        time_mock.return_value = 1000
+        requests_get_mock.side_effect = [
+            ResponseStub(body='test_transcript_text'),
+            ResponseStub(ok=False, status_code=401),
+            ResponseStub(ok=False, status_code=401),
+        ]
+        self.xblock.threeplaymedia_file_id = 'test_file_id'
+        self.xblock.threeplaymedia_apikey = 'test_api_key'
+        test_transcript_data = {'id': 'test_id', 'language_id': '1'}
+        self.xblock.fetch_single_3pm_translation(test_transcript_data)
+        time_mock.return_value = 1000 + 3600 + 1
+
+        # Act:
+        stale_transcript = self.xblock.fetch_single_3pm_translation(test_transcript_data)
+        transcript = self.xblock.fetch_single_3pm_translation(test_transcript_data)
+
+        # Assert:
+        self.assertEqual(stale_transcript.content, 'test_transcript_text')
+        self.assertIsNone(transcript)
+        self.assertEqual(requests_get_mock.call_count, 3)
+
+    @patch('video_xblock.sessions.get')
     def test_fetch_single_3pm_translation_failure(self, requests_get_mock):
         """
         Test single 3PlayMedia transcript fetching (failure case).
@@ -630,6 +1011,31 @@ class TranscriptsMixinTests(VideoXBlockTestBase):  # pylint: disable=test-inheri
         # Assert:
         self.assertIsNone(transcript)
 
+    @patch('video_xblock.mixins.xblock_settings', return_value={'threeplaymedia_fetch_timeout': 0.2})
+    def test_fetch_3pm_translations(self, _settings_mock):
+        """
+        Test concurrent 3PlayMedia transcripts fetching keeps order and handles failures and timeouts.
+        """
+        # Arrange:
+        release = threading.Event()
+
+        def fetch_single_3pm_translation(transcript_data, _format_id):  # pylint: disable=missing-docstring
+            if transcript_data['id'] == 'slow':
+                release.wait(5)
+            elif transcript_data['id'] == 'broken':
+                raise ValueError()
+            return transcript_data['id']
+
+        test_transcripts_data = [{'id': transcript_id} for transcript_id in ['first', 'slow', 'broken', 'last']]
+
+        # Act:
+        with patch.object(self.xblock, 'fetch_single_3pm_translation', side_effect=fetch_single_3pm_translation):
+            transcripts = self.xblock.fetch_3pm_translations(test_transcripts_data)
+        release.set()
+
+        # Assert:
+        self.assertEqual(transcripts, ['first', None, None, 'last'])
+
     def test_validate_three_play_media_config_initial_case(self):
         """
         Test 3PlayMedia configuration validation (initial case).
@@ -0,0 +1,55 @@
+"""
+Test in-video transcripts search.
+"""
+
+import unittest
+
+from video_xblock.search import TranscriptSearchIndex, make_snippet
+from video_xblock.webvtt import CueIndex
+
+
+class TranscriptSearchIndexTest(unittest.TestCase):
+    """
+    Test transcript's search index.
+    """
+
+    def setUp(self):
+        self.search_index = TranscriptSearchIndex(CueIndex.from_vtt(
+            'WEBVTT\n\n'
+            '00:01.000 --> 00:02.000\n<v Lecturer>Welcome to the <b>Python</b> course\n\n'
+            '00:03.000 --> 00:04.000\nPython lists and dicts\n\n'
+            '00:05.000 --> 00:06.000\nDicts &amp; sets\n\n'
+            '00:07.000 --> 00:08.000\nSets of Python lists\n'
+        ))
+
+    def test_search_ranks_results(self):
+        """
+        Test cues matching more and rarer terms rank higher, earlier cues go first otherwise.
+        """
+        results = self.search_index.search('python DICTS')
+
+        self.assertEqual([(result['start'], result['snippet']) for result in results], [
+            (3.0, 'Python lists and dicts'),
+            (5.0, 'Dicts & sets'),
+            (1.0, 'Welcome to the Python course'),
+            (7.0, 'Sets of Python lists'),
+        ])
+        self.assertEqual(results[0]['end'], 4.0)
+        self.assertGreater(results[1]['score'], results[2]['score'])  # "dicts" is rarer than "python"
+
+    def test_search_limit_and_no_results(self):
+        """
+        Test number of results is limited, and unknown terms aren't found.
+        """
+        self.assertEqual(len(self.search_index.search('python', limit=2)), 2)
+        self.assertEqual(self.search_index.search('java'), [])
+
+    def test_make_snippet(self):
+        """
+        Test long text is cut around the first occurrence of a term.
+        """
+        text = ' '.join(['word{}'.format(index) for index in range(100)])
+
+        snippet = make_snippet(text, {'word50'}, length=30)
+
+        self.assertEqual(snippet, '...word49 word50 word51 word52...')
@@ -0,0 +1,135 @@
+"""
+Test shared HTTP session.
+"""
+
+import unittest
+
+from django.core.cache import cache
+from mock import patch
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from video_xblock import sessions
+
+
+class StandInTransport(BaseAdapter):
+    """
+    Local transport adapter answering all requests with a cookie-setting response.
+    """
+
+    def __init__(self):
+        super(StandInTransport, self).__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        self.requests.append((request, kwargs))
+        response = Response()
+        response.status_code = 200
+        response.headers['Set-Cookie'] = 'session=secret; Path=/'
+        response.request = request
+        response.url = request.url
+        response._content = b'OK'  # pylint: disable=protected-access
+        return response
+
+    def close(self):
+        pass
+
+
+class ETagTransport(StandInTransport):
+    """
+    Local transport adapter answering conditional requests with `304 Not Modified` while content is unchanged.
+    """
+
+    etag = '"v1"'
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        response = super(ETagTransport, self).send(request, **kwargs)
+        response.headers['ETag'] = self.etag
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        if request.headers.get('If-None-Match') == self.etag:
+            response.status_code = 304
+            response._content = b''  # pylint: disable=protected-access
+        else:
+            response._content = '["{}"]'.format(self.etag.strip('"')).encode()  # pylint: disable=protected-access
+        return response
+
+
+class SessionsTest(unittest.TestCase):
+    """
+    Test shared HTTP session helpers.
+    """
+
+    def setUp(self):
+        self.transport = StandInTransport()
+        sessions.mount_transport('https://api.example.com/', self.transport)
+
+    def tearDown(self):
+        sessions.unmount_transport('https://api.example.com/')
+
+    def test_session_shared(self):
+        """
+        Test the same session is reused until it's reset.
+        """
+        session = sessions.get_session()
+        self.assertIs(sessions.get_session(), session)
+        sessions.reset_session()
+        self.assertIsNot(sessions.get_session(), session)
+
+    def test_requests_sent_through_mounted_transport_with_timeouts(self):
+        """
+        Test requests are sent through mounted transport with default timeouts, cookies aren't kept.
+        """
+        # Act
+        first_response = sessions.get('https://api.example.com/videos')
+        sessions.post('https://api.example.com/videos', data={'name': 'video'}, timeout=1)
+
+        # Assert
+        self.assertEqual(first_response.text, 'OK')
+        (first_request, first_kwargs), (second_request, second_kwargs) = self.transport.requests
+        self.assertEqual(first_kwargs['timeout'], (5, 30))
+        self.assertEqual(second_kwargs['timeout'], 1)
+        self.assertEqual(second_request.method, 'POST')
+        self.assertNotIn('Cookie', second_request.headers)
+
+    @patch('video_xblock.sessions.xblock_settings')
+    def test_settings(self, xblock_settings_mock):
+        """
+        Test pool sizes and timeouts are configured with xblock settings.
+        """
+        # Arrange
+        xblock_settings_mock.return_value = {'http': {'pool_maxsize': 20, 'read_timeout': 60}}
+        sessions.reset_session()
+
+        # Act
+        sessions.head('https://api.example.com/player.js')
+        adapter = sessions.get_session().get_adapter('https://other.example.com/')
+
+        # Assert
+        self.assertEqual(self.transport.requests[0][1]['timeout'], (5, 60))
+        self.assertEqual(adapter._pool_maxsize, 20)  # pylint: disable=protected-access
+
+    def test_get_revalidated(self):
+        """
+        Test responses are revalidated with their `ETag`, kept response is served if it's not modified.
+        """
+        # Arrange
+        cache.clear()
+        transport = ETagTransport()
+        sessions.mount_transport('https://etag.example.com/', transport)
+        self.addCleanup(sessions.unmount_transport, 'https://etag.example.com/')
+
+        # Act
+        responses = [
+            sessions.get_revalidated('https://etag.example.com/captions', params={'lang': 'en'}) for _ in range(2)
+        ]
+        transport.etag = '"v2"'
+        modified_response = sessions.get_revalidated('https://etag.example.com/captions', params={'lang': 'en'})
+
+        # Assert
+        self.assertEqual([response.status_code for response in responses], [200, 200])
+        self.assertEqual([response.json() for response in responses], [['v1'], ['v1']])
+        self.assertEqual(modified_response.json(), ['v2'])
+        self.assertEqual(
+            [request.headers.get('If-None-Match') for request, _kwargs in transport.requests], [None, '"v1"', '"v1"']
+        )
+        self.assertEqual(transport.requests[0][0].url, 'https://etag.example.com/captions?lang=en')
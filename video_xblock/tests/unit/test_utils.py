@@ -1,6 +1,7 @@
 """
 Test utils.
 """
+import hashlib
 import types
 import unittest
 
@@ -9,7 +10,9 @@ from mock import patch, Mock, PropertyMock
 
 from video_xblock.constants import TranscriptSource
 from video_xblock.utils import (
-    import_from, underscore_to_mixedcase, create_reference_name, normalize_transcripts, filter_transcripts_by_source
+    import_from, underscore_to_mixedcase, create_reference_name, normalize_transcripts, filter_transcripts_by_source,
+    hashed_asset_uri, resolve_hashed_asset_uri, resource_hash, ResourceRegistry,
+    create_template_engine, get_template_engine, reset_template_engine, warm_up_templates,
 )
 
 
@@ -132,3 +135,139 @@ class UtilsTest(unittest.TestCase):
         # Assert
         self.assertIsInstance(filtered_transcripts, types.GeneratorType)
         self.assertListEqual(list(filtered_transcripts), three_pm_transcripts)
+
+    def test_hashed_asset_uri(self):
+        """
+        Test content-hashed asset URI is built and resolved back to asset's path.
+        """
+        # Arrange
+        path = 'static/vendor/js/video.min.js'
+
+        # Act
+        uri = hashed_asset_uri(path)
+
+        # Assert
+        self.assertEqual(uri, 'public/static/vendor/js/video.min.{}.js'.format(resource_hash(path)))
+        self.assertEqual(resolve_hashed_asset_uri(uri), path)
+
+    @data(
+        'public/static/vendor/js/video.min.000000000000.js',  # outdated hash
+        'public/static/vendor/js/video.min.js',  # no hash
+        'public/static/../setup.000000000000.js',  # unsafe path
+        'static/vendor/js/video.min.000000000000.js',  # not public
+        'public/static/vendor/js/missing.000000000000.js',  # missing file
+    )
+    def test_resolve_hashed_asset_uri_rejects_invalid_uri(self, uri):
+        """
+        Test malformed or outdated content-hashed URIs aren't resolved.
+        """
+        self.assertIsNone(resolve_hashed_asset_uri(uri))
+
+    @patch('video_xblock.utils.pkg_resources.resource_string', return_value=b'<p>{{ text }}</p>')
+    def test_resource_registry_memoizes_resources(self, resource_string_mock):
+        """
+        Test resources are read and templates are compiled only once.
+        """
+        # Arrange
+        registry = ResourceRegistry('video_xblock.utils')
+
+        # Act
+        first_template = registry.get_template('static/html/test.html')
+        second_template = registry.get_template('static/html/test.html')
+        text = registry.get_string('static/html/test.html')
+
+        # Assert
+        self.assertIs(first_template, second_template)
+        self.assertEqual(text, '<p>{{ text }}</p>')
+        resource_string_mock.assert_called_once_with('video_xblock.utils', 'static/html/test.html')
+        self.assertDictEqual(registry.stats(), {'hits': 2, 'misses': 2, 'resources': 1, 'templates': 1})
+
+        registry.clear()
+        self.assertDictEqual(registry.stats(), {'hits': 0, 'misses': 0, 'resources': 0, 'templates': 0})
+
+    @patch('video_xblock.utils.os.path.getmtime')
+    @patch('video_xblock.utils.pkg_resources.resource_filename', return_value='/tmp/test.html')
+    @patch('video_xblock.utils.pkg_resources.resource_string', side_effect=[b'old', b'new'])
+    @patch('video_xblock.utils.xblock_settings', return_value={'resource_cache_autoreload': True})
+    def test_resource_registry_autoreload(self, _settings_mock, _resource_string_mock, _filename_mock, mtime_mock):
+        """
+        Test resources are re-read once changed on disk if autoreload is enabled.
+        """
+        # Arrange
+        registry = ResourceRegistry('video_xblock.utils')
+        mtime_mock.return_value = 1
+
+        # Act & Assert
+        self.assertEqual(registry.get_string('static/html/test.html'), 'old')
+        self.assertEqual(registry.get_string('static/html/test.html'), 'old')
+        mtime_mock.return_value = 2
+        self.assertEqual(registry.get_string('static/html/test.html'), 'new')
+
+    @patch('video_xblock.utils.os.path.getmtime')
+    @patch('video_xblock.utils.pkg_resources.resource_filename', return_value='/tmp/test.js')
+    @patch('video_xblock.utils.pkg_resources.resource_string', side_effect=[b'old', b'new'])
+    @patch('video_xblock.utils.xblock_settings', return_value={'resource_cache_autoreload': True})
+    def test_resource_registry_memoizes_hashes(self, _settings_mock, _resource_string_mock, _filename_mock, mtime_mock):
+        """
+        Test content hash is computed once per resource's version.
+        """
+        # Arrange
+        registry = ResourceRegistry('video_xblock.utils')
+        mtime_mock.return_value = 1
+
+        # Act
+        with patch('video_xblock.utils.hashlib.sha1', wraps=hashlib.sha1) as sha1_mock:
+            old_hashes = {registry.get_hash('static/js/test.js') for _ in range(3)}
+            mtime_mock.return_value = 2
+            new_hash = registry.get_hash('static/js/test.js')
+
+        # Assert
+        self.assertEqual(old_hashes, {hashlib.sha1(b'old').hexdigest()[:12]})
+        self.assertEqual(new_hash, hashlib.sha1(b'new').hexdigest()[:12])
+        self.assertEqual(sha1_mock.call_count, 2)
+
+    def test_get_template_engine_is_shared(self):
+        """
+        Test template engine is created once and reused with compiled templates.
+        """
+        # Arrange
+        reset_template_engine()
+
+        # Act
+        engine = get_template_engine()
+
+        # Assert
+        self.assertIs(get_template_engine(), engine)
+        self.assertFalse(engine.debug)
+        self.assertIs(engine.get_template('studio-edit.html'), engine.get_template('studio-edit.html'))
+
+    @data(
+        ({}, False, True),
+        ({'template_debug': True}, True, True),
+        ({'resource_cache_autoreload': True}, False, False),
+    )
+    def test_create_template_engine(self, test_data):
+        """
+        Test template engine debugging and caching are configured by xblock settings.
+        """
+        xblock_settings, expected_debug, expected_cached = test_data
+        with patch('video_xblock.utils.xblock_settings', return_value=xblock_settings):
+            engine = create_template_engine()
+
+        self.assertEqual(engine.debug, expected_debug)
+        self.assertEqual(engine.get_template('base.html') is engine.get_template('base.html'), expected_cached)
+
+    def test_warm_up_templates(self):
+        """
+        Test all templates, including nested field templates, are pre-compiled.
+        """
+        # Arrange
+        engine = Mock()
+
+        # Act
+        template_names = warm_up_templates(engine)
+
+        # Assert
+        self.assertIn('studio-edit.html', template_names)
+        self.assertIn('fields/set.html', template_names)
+        self.assertEqual(engine.get_template.call_count, len(template_names))
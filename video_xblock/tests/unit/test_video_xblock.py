@@ -5,17 +5,20 @@ Test cases for video_xblock.
 import datetime
 import json
 
+from ddt import ddt, data
 from mock import patch, Mock, MagicMock, PropertyMock
 
 from web_fragments.fragment import FragmentResource
+from webob import Request
 from xblock.fragment import Fragment
 
 from video_xblock import VideoXBlock, __version__
 from video_xblock.constants import PlayerName
-from video_xblock.utils import ugettext as _
+from video_xblock.utils import hashed_asset_uri, resource_string, Transcript, ugettext as _
 from video_xblock.tests.unit.base import VideoXBlockTestBase
 
 
+@ddt
 class VideoXBlockTests(VideoXBlockTestBase):
     """
     Test cases for video_xblock.
@@ -62,6 +65,32 @@ class VideoXBlockTests(VideoXBlockTestBase):
             )
         )
 
+    def test_player_asset(self):
+        """
+        Test player's static assets are served by content-hashed URIs, to be cached for good.
+        """
+        # Arrange
+        asset_path = 'static/vendor/js/video.min.js'
+
+        # Act
+        response = self.xblock.player_asset(Request.blank('/'), hashed_asset_uri(asset_path))
+
+        # Assert
+        self.assertEqual(response.text, resource_string(asset_path))
+        self.assertIn(response.content_type, ('application/javascript', 'text/javascript'))
+        self.assertEqual(response.headers['Cache-Control'], 'public, max-age=31536000, immutable')
+
+    @data('public/static/vendor/js/video.min.js', 'public/static/vendor/js/video.min.000000000000.js')
+    def test_player_asset_not_found(self, uri):
+        """
+        Test non-hashed and outdated asset URIs aren't served.
+        """
+        # Act
+        response = self.xblock.player_asset(Request.blank('/'), uri)
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+
     @patch('video_xblock.video_xblock.render_resource')
     @patch.object(VideoXBlock, 'route_transcripts', return_value=[])
     @patch.object(VideoXBlock, 'get_player')
@@ -154,13 +183,13 @@ class VideoXBlockTests(VideoXBlockTestBase):
     @patch('video_xblock.video_xblock.ALL_LANGUAGES', new_callable=MagicMock)
     @patch('video_xblock.video_xblock.render_template')
     @patch.object(VideoXBlock, 'route_transcripts')
-    @patch.object(VideoXBlock, 'authenticate_video_api')
-    @patch.object(VideoXBlock, '_update_default_transcripts')
+    @patch.object(VideoXBlock, 'request_video_api_authentication')
+    @patch.object(VideoXBlock, 'fetch_default_transcripts')
     @patch.object(VideoXBlock, 'prepare_studio_editor_fields')
     @patch('video_xblock.video_xblock.resource_string')
     def test_studio_view_uses_correct_context(
-            self, resource_string_mock, prepare_fields_mock, update_default_transcripts_mock,
-            authenticate_video_api_mock, _route_transcripts, render_template_mock,
+            self, resource_string_mock, prepare_fields_mock, fetch_default_transcripts_mock,
+            request_authentication_mock, _route_transcripts, render_template_mock,
             all_languages_mock
     ):
         """
@@ -170,9 +199,6 @@ class VideoXBlockTests(VideoXBlockTestBase):
         unused_context_stub = object()
         all_languages_mock.__iter__.return_value = [['en', 'English']]
         self.xblock.runtime.handler_url = handler_url_mock = Mock()
-        update_default_transcripts_mock.return_value = (
-            ['stub1', 'stub2'], 'Stub autoupload messate'
-        )
         prepare_fields_mock.side_effect = \
             basic_fields_stub, advanced_fields_stub, transcripts_fields_stub, three_pm_fields_stub = [
                 [{'name': 'display_name'}],
@@ -201,7 +227,8 @@ class VideoXBlockTests(VideoXBlockTestBase):
             'download_transcript_handler_url': handler_url_mock.return_value,
             'enabled_default_transcripts': [],
             'enabled_managed_transcripts': [],
-            'initial_default_transcripts': ['stub1', 'stub2'],
+            'default_transcripts_loading': True,
+            'initial_default_transcripts': [],
             'languages': [{'code': 'en', 'label': 'English'}],
             'player_name': self.xblock.player_name,
             'players': PlayerName,
@@ -209,7 +236,7 @@ class VideoXBlockTests(VideoXBlockTestBase):
             'three_pm_fields': three_pm_fields_stub,
             'transcripts': [],
             'transcripts_fields': transcripts_fields_stub,
-            'transcripts_autoupload_message': 'Stub autoupload messate',
+            'transcripts_autoupload_message': '',
             'transcripts_type': 'manual',
         }
 
@@ -219,8 +246,8 @@ class VideoXBlockTests(VideoXBlockTestBase):
         # Assert
         render_template_mock.assert_called_once_with('studio-edit.html', **expected_context)
         handler_url_mock.assert_called_with(self.xblock, 'download_transcript')
-        update_default_transcripts_mock.assert_called_once()
-        authenticate_video_api_mock.assert_not_called()
+        fetch_default_transcripts_mock.assert_not_called()
+        request_authentication_mock.assert_not_called()
 
     @staticmethod
     def _make_fragment_resource(file_name):
@@ -299,6 +326,148 @@ class VideoXBlockTests(VideoXBlockTestBase):
         self.assertEqual(transcripts, [])
         self.assertFalse(normalize_transcripts_mock.called)
 
+    @patch.object(VideoXBlock, 'convert_transcript_to_vtt')
+    def test_clean_studio_edits_converts_transcripts(self, convert_transcript_to_vtt_mock):
+        """
+        Test submitted transcripts are converted into WebVTT.
+        """
+        # Arrange
+        convert_transcript_to_vtt_mock.side_effect = lambda transcript: dict(transcript, vtt_url='test.vtt')
+        data = {'href': '', 'transcripts': '[{"lang": "en", "url": "test.srt"}]'}
+
+        # Act
+        self.xblock.clean_studio_edits(data)
+
+        # Assert
+        self.assertEqual(json.loads(data['transcripts']), [{'lang': 'en', 'url': 'test.srt', 'vtt_url': 'test.vtt'}])
+
+    @patch('video_xblock.video_xblock.BaseVideoPlayer.load_class')
+    def test_get_player_memoized(self, load_class_mock):
+        """
+        Test player is created once until player related fields are changed.
+        """
+        # Arrange
+        load_class_mock.side_effect = lambda player_name: Mock(side_effect=lambda xblock: Mock())
+
+        # Act
+        player = self.xblock.get_player()
+        same_player = self.xblock.get_player()
+        self.xblock.metadata['client_id'] = 'new_api_key'
+        new_player = self.xblock.get_player()
+
+        # Assert
+        self.assertIs(player, same_player)
+        self.assertIsNot(player, new_player)
+        self.assertEqual(load_class_mock.call_count, 2)
+
+    @patch.object(VideoXBlock, 'get_3pm_transcripts_versions', Mock(return_value={}))
+    @patch.object(VideoXBlock, 'fetch_3pm_translations')
+    @patch.object(VideoXBlock, 'route_transcripts')
+    def test_index_dictionary_with_3pm_transcripts(self, route_transcripts_mock, fetch_3pm_translations_mock):
+        """
+        Test 3PlayMedia transcripts are fetched at once and indexed.
+        """
+        # Arrange
+        route_transcripts_mock.return_value = iter([
+            {'id': 'PM1', 'lang': 'en', 'lang_id': 1, 'source': '3play-media', 'url': 'url_en'},
+            {'id': 'PM2', 'lang': 'fr', 'lang_id': 5, 'source': '3play-media', 'url': 'url_fr'},
+        ])
+        fetch_3pm_translations_mock.return_value = [
+            Transcript(*(['PM1'] + [''] * 3 + ['WEBVTT\n\n00:00.000 --> 00:01.000\nHello'] + [''] * 4)),
+            None,
+        ]
+
+        # Act
+        index = self.xblock.index_dictionary()
+
+        # Assert
+        self.assertEqual(index['content'], {'display_name': 'Video', 'en': 'Hello'})
+        fetch_3pm_translations_mock.assert_called_once_with([
+            {'id': 'PM1', 'language_id': 1}, {'id': 'PM2', 'language_id': 5}
+        ])
+
+    @patch.object(VideoXBlock, 'get_3pm_transcripts_versions')
+    @patch.object(VideoXBlock, 'fetch_3pm_translations')
+    @patch.object(VideoXBlock, 'route_transcripts')
+    def test_index_dictionary_reuses_3pm_transcripts_text(
+            self, route_transcripts_mock, fetch_3pm_translations_mock, get_versions_mock
+    ):
+        """
+        Test 3PlayMedia transcripts are fetched again only if their versions have changed.
+        """
+        # Arrange
+        route_transcripts_mock.side_effect = lambda: iter([
+            {'id': 'PM1', 'lang': 'en', 'lang_id': 1, 'source': '3play-media', 'url': 'url_en'},
+            {'id': 'PM2', 'lang': 'fr', 'lang_id': 5, 'source': '3play-media', 'url': 'url_fr'},
+        ])
+        fetch_3pm_translations_mock.side_effect = lambda transcripts_data: [
+            Transcript(*([data['id']] + [''] * 3 + ['00:00.000 --> 00:01.000\n' + data['id']] + [''] * 4))
+            for data in transcripts_data
+        ]
+        get_versions_mock.return_value = {'PM1': '2021-01-01', 'PM2': '2021-01-01'}
+        self.xblock.index_dictionary()
+
+        # Act
+        get_versions_mock.return_value = {'PM1': '2021-01-01', 'PM2': '2021-02-01'}
+        index = self.xblock.index_dictionary()
+
+        # Assert
+        self.assertEqual(index['content'], {'display_name': 'Video', 'en': 'PM1', 'fr': 'PM2'})
+        fetch_3pm_translations_mock.assert_called_with([{'id': 'PM2', 'language_id': 5}])
+
+        # Transcripts without known version aren't reused:
+        get_versions_mock.return_value = {'PM1': '2021-01-01'}
+        for _ in range(2):
+            fetch_3pm_translations_mock.reset_mock()
+            self.xblock.index_dictionary()
+            fetch_3pm_translations_mock.assert_called_once_with([{'id': 'PM2', 'language_id': 5}])
+
+    @patch.object(VideoXBlock, 'find_transcript_asset')
+    @patch.object(VideoXBlock, 'route_transcripts')
+    def test_index_dictionary_reuses_manual_transcripts_text(self, route_transcripts_mock, find_asset_mock):
+        """
+        Test manual transcripts are read and parsed again only if their content has changed.
+        """
+        # Arrange
+        route_transcripts_mock.side_effect = lambda: iter([
+            {'lang': 'en', 'source': 'manual', 'url': '/asset-v1:test+test+test+type@asset+block@en.vtt'},
+        ])
+
+        def find_asset(_file_name, as_stream=False):  # pylint: disable=missing-docstring
+            if as_stream:
+                return Mock(content_digest='test_hash')
+            return Mock(data=b'\xef\xbb\xbfWEBVTT\n\n00:00.000 --> 00:01.000\nHello')
+        find_asset_mock.side_effect = find_asset
+
+        # Act
+        indexes = [self.xblock.index_dictionary() for _ in range(2)]
+
+        # Assert
+        self.assertEqual(indexes[0]['content'], {'display_name': 'Video', 'en': 'Hello'})
+        self.assertEqual(indexes[0], indexes[1])
+        find_asset_mock.assert_called_with('en.vtt', as_stream=True)
+        self.assertEqual(find_asset_mock.call_count, 3)  # content is read once
+
+    @patch.object(VideoXBlock, 'fetch_available_3pm_transcripts')
+    def test_get_enabled_transcripts_memoized(self, fetch_3pm_transcripts_mock):
+        """
+        Test enabled transcripts are computed once until transcripts related fields are changed.
+        """
+        # Arrange
+        self.xblock.threeplaymedia_streaming = True
+        fetch_3pm_transcripts_mock.side_effect = lambda: iter([{'id': 'PM1', 'source': '3play-media', 'url': ''}])
+
+        # Act
+        transcripts = self.xblock.get_enabled_transcripts()
+        transcripts[0]['url'] = 'modified'
+        memoized_transcripts = self.xblock.get_enabled_transcripts()
+        self.xblock.threeplaymedia_file_id = 'new_file_id'
+        self.xblock.get_enabled_transcripts()
+
+        # Assert
+        self.assertEqual(memoized_transcripts, [{'id': 'PM1', 'source': '3play-media', 'url': ''}])
+        self.assertEqual(fetch_3pm_transcripts_mock.call_count, 2)
+
     @patch.object(VideoXBlock, 'get_enabled_managed_transcripts')
     @patch.object(VideoXBlock, 'fetch_available_3pm_transcripts')
     @patch('video_xblock.video_xblock.normalize_transcripts')
@@ -3,6 +3,8 @@ Test cases for VideoXBlock handlers
 """
 
 import json
+import threading
+import time
 
 from mock import patch, Mock, PropertyMock
 
@@ -36,6 +38,154 @@ class AuthenticateApiHandlerTests(VideoXBlockTestBase):
         auth_video_api_mock.assert_called_once_with('test-token-123')  # Python string
 
 
+class LoadDefaultTranscriptsHandlerTests(VideoXBlockTestBase):
+    """
+    Test cases for `VideoXBlock.load_default_transcripts`.
+    """
+
+    def setUp(self):
+        super(LoadDefaultTranscriptsHandlerTests, self).setUp()
+        self.xblock.token = 'test-token'
+        self.xblock.runtime.handler_url = Mock(return_value='/download_transcript')
+        self.default_transcripts = [
+            {'lang': 'uk', 'label': 'Ukrainian', 'url': 'uk_url'}, {'lang': 'en', 'label': 'English', 'url': 'en_url'}
+        ]
+
+    @staticmethod
+    def arrange_player(player_mock, auth_player_mock):
+        """
+        Arrange API stubs of current player, and of the one authentication is made with.
+        """
+        player = player_mock.return_value
+        player.metadata_fields = ['access_token']
+        auth_player_mock.return_value.authenticate_api.return_value = {'access_token': 'test-access-token'}, ''
+        player.clean_default_transcripts.side_effect = lambda transcripts: transcripts
+        player.filter_default_transcripts.side_effect = lambda transcripts, _enabled: list(transcripts)
+        return player
+
+    @patch.object(VideoXBlock, 'settings', new_callable=PropertyMock, return_value={'studio_api_timeout': 0.5})
+    @patch('video_xblock.video_xblock.render_template', return_value='<div>rendered</div>')
+    @patch.object(VideoXBlock, 'create_player')
+    @patch.object(VideoXBlock, 'get_player')
+    def test_load_default_transcripts(self, player_mock, auth_player_mock, render_template_mock, _settings_mock):
+        """
+        Test video platform's API is authenticated to, then default transcripts are fetched and rendered.
+        """
+        # Arrange
+        player = self.arrange_player(player_mock, auth_player_mock)
+        player.get_cached_default_transcripts.return_value = self.default_transcripts, ''
+
+        # Act
+        response = self.xblock.load_default_transcripts(arrange_request_mock('{}'))
+
+        # Assert
+        self.assertEqual(response.json, {
+            'auth_error_message': '',
+            'default_transcripts_html': '<div>rendered</div>',
+            'timed_out': [],
+            'transcripts_autoupload_message': '',
+        })
+        auth_player_mock.return_value.authenticate_api.assert_called_once_with(token=b'test-token')
+        player.authenticate_api.assert_not_called()
+        self.assertEqual(self.xblock.metadata['access_token'], 'test-access-token')
+        self.assertEqual(player.get_cached_default_transcripts.call_args[1]['access_token'], 'test-access-token')
+        self.assertEqual([transcript['lang'] for transcript in self.xblock.default_transcripts], ['en', 'uk'])
+        self.assertEqual(
+            render_template_mock.call_args[1]['initial_default_transcripts'], self.default_transcripts
+        )
+
+    @patch.object(VideoXBlock, 'settings', new_callable=PropertyMock, return_value={'studio_api_timeout': 0.5})
+    @patch('video_xblock.video_xblock.render_template', return_value='<div>rendered</div>')
+    @patch.object(VideoXBlock, 'create_player')
+    @patch.object(VideoXBlock, 'get_player')
+    def test_refresh_invalidates_cached_transcripts(
+            self, player_mock, auth_player_mock, _render_template_mock, _settings_mock
+    ):
+        """
+        Test cached default transcripts list is dropped before it's fetched, if refresh is requested.
+        """
+        # Arrange
+        player = self.arrange_player(player_mock, auth_player_mock)
+        player.get_cached_default_transcripts.return_value = self.default_transcripts, ''
+        player.media_id.return_value = 'test-video-id'
+
+        # Act
+        self.xblock.load_default_transcripts(arrange_request_mock('{"refresh": true}'))
+
+        # Assert
+        player.invalidate_default_transcripts.assert_called_once_with(
+            video_id='test-video-id', account_id='account_id', client_id='api_key', client_secret='api_secret',
+            access_token='test-access-token',
+        )
+        player.get_cached_default_transcripts.assert_called_once()
+
+    @patch.object(VideoXBlock, 'settings', new_callable=PropertyMock, return_value={'studio_api_timeout': 0.5})
+    @patch('video_xblock.video_xblock.render_template', return_value='<div>rendered</div>')
+    @patch.object(VideoXBlock, 'create_player')
+    @patch.object(VideoXBlock, 'get_player')
+    def test_partial_results_on_timeout(self, player_mock, auth_player_mock, render_template_mock, settings_mock):
+        """
+        Test authentication result is applied, while default transcripts stored are kept if fetching times out.
+        """
+        # Arrange
+        settings_mock.return_value = {'studio_api_timeout': 0.05}
+        player = self.arrange_player(player_mock, auth_player_mock)
+        released = threading.Event()
+        player.get_cached_default_transcripts.side_effect = lambda **_kwargs: released.wait(5) and ([], '')
+        self.xblock.default_transcripts = self.default_transcripts
+
+        # Act
+        try:
+            response = self.xblock.load_default_transcripts(arrange_request_mock('{}'))
+        finally:
+            released.set()
+
+        # Assert
+        self.assertEqual(response.json['timed_out'], ['default_transcripts'])
+        self.assertEqual(response.json['auth_error_message'], '')
+        self.assertEqual(self.xblock.metadata['access_token'], 'test-access-token')
+        self.assertEqual(self.xblock.default_transcripts, self.default_transcripts)
+        self.assertEqual(render_template_mock.call_args[1]['default_transcripts'], self.default_transcripts)
+        self.assertEqual(render_template_mock.call_args[1]['initial_default_transcripts'], [])
+
+    @patch.object(VideoXBlock, 'settings', new_callable=PropertyMock, return_value={'studio_api_timeout': 0.2})
+    @patch('video_xblock.video_xblock.render_template', return_value='<div>rendered</div>')
+    @patch.object(VideoXBlock, 'create_player')
+    @patch.object(VideoXBlock, 'get_player')
+    def test_fetch_after_authentication_timeout(
+            self, player_mock, auth_player_mock, render_template_mock, _settings_mock
+    ):
+        """
+        Test default transcripts are still fetched, with credentials known before, if authentication times out.
+        """
+        # Arrange
+        player = self.arrange_player(player_mock, auth_player_mock)
+        released = threading.Event()
+        auth_player_mock.return_value.authenticate_api.side_effect = lambda **_kwargs: released.wait(5) and (
+            {'access_token': 'test-access-token'}, ''
+        )
+        player.get_cached_default_transcripts.side_effect = lambda **_kwargs: time.sleep(0.01) or (
+            self.default_transcripts, ''
+        )
+
+        # Act
+        try:
+            response = self.xblock.load_default_transcripts(arrange_request_mock('{}'))
+        finally:
+            released.set()
+
+        # Assert
+        self.assertEqual(response.json['timed_out'], ['authentication'])
+        self.assertEqual(
+            response.json['auth_error_message'],
+            'Video platform API has not responded in time, please try again later.'
+        )
+        self.assertNotEqual(player.get_cached_default_transcripts.call_args[1].get('access_token'), 'test-access-token')
+        self.assertEqual(
+            render_template_mock.call_args[1]['initial_default_transcripts'], self.default_transcripts
+        )
+
+
 class UploadDefaultTranscriptHandlerTests(VideoXBlockTestBase):
     """
     Test cases for `VideoXBlock.upload_default_transcript_handler`.
@@ -0,0 +1,194 @@
+"""
+Test WebVTT helpers.
+"""
+
+import pickle
+import unittest
+
+from ddt import ddt, data, unpack
+
+from video_xblock import webvtt
+
+
+@ddt
+class WebVTTConverterTest(unittest.TestCase):
+    """
+    Test built-in SRT and WebVTT converter.
+    """
+
+    def test_srt_to_vtt(self):
+        """
+        Test SRT transcript is converted into WebVTT.
+        """
+        # Arrange
+        srt = (
+            '﻿1\r\n'
+            '00:00:01,000 --> 00:00:02,500\r\n'
+            'Hello <i>world</i> & <font color="red">friends</font>\r\n'
+            '42\r\n'
+            '\r\n'
+            '2\r\n'
+            '1:02:03,5 --> 01:02:04,000 align:start\r\n'
+            '{\\an8}a < b\r\n'
+        )
+
+        # Act
+        vtt = webvtt.convert_to_vtt(srt)
+
+        # Assert
+        self.assertEqual(vtt, (
+            'WEBVTT\n'
+            '\n'
+            '00:00:01.000 --> 00:00:02.500\n'
+            'Hello <i>world</i> &amp; friends\n'
+            '42\n'
+            '\n'
+            '01:02:03.500 --> 01:02:04.000 align:start\n'
+            'a &lt; b\n'
+        ))
+        self.assertTrue(webvtt.validate_vtt(vtt))
+
+    def test_vtt_passed_through(self):
+        """
+        Test valid WebVTT transcript is passed through.
+        """
+        vtt = '﻿WEBVTT - Lecture 1\r\n\r\nNOTE converted\r\n\r\n00:01.000 --> 00:02.000\r\nHello\r\n'
+
+        self.assertEqual(
+            webvtt.convert_to_vtt(vtt), 'WEBVTT - Lecture 1\n\nNOTE converted\n\n00:01.000 --> 00:02.000\nHello\n'
+        )
+
+    @data(
+        ('WEBVTT\n\n00:00:01,000 --> 00:00:02,000\nInvalid timings', False),
+        ('WEBVTTX\n\n00:01.000 --> 00:02.000\nInvalid header', False),
+        ('WEBVTT\tHeader\n\n00:01.000 --> 00:02.000 line:0\nValid', True),
+    )
+    @unpack
+    def test_validate_vtt(self, vtt, is_valid):
+        """
+        Test WebVTT validation.
+        """
+        self.assertEqual(webvtt.validate_vtt(vtt), is_valid)
+
+    @data(
+        '<tt xmlns="http://www.w3.org/ns/ttml"><body></body></tt>',
+        '<SAMI><BODY></BODY></SAMI>',
+        'Scenarist_SCC V1.0',
+        '',
+    )
+    def test_other_formats_not_converted(self, caps):
+        """
+        Test formats other than SRT and WebVTT are left for pycaption.
+        """
+        self.assertIsNone(webvtt.convert_to_vtt(caps))
+
+
+@ddt
+class WebVTTTextExtractionTest(unittest.TestCase):
+    """
+    Test extraction of transcripts' text.
+    """
+
+    vtt = (
+        '﻿WEBVTT\r\nKind: captions\r\n\r\n'
+        'NOTE Converted\r\nby hand\r\n\r\n'
+        'STYLE\r\n::cue { color: yellow }\r\n\r\n'
+        'intro\r\n00:00.000 --> 00:01.000 align:start\r\n<v Roger>Hello &amp; <c.yellow>welcome</c>\r\n\r\n'
+        '00:01.000 --> 00:02.000\r\nHello &amp; welcome\r\n<00:00:01.500><c> to</c><c> the</c>   course\r\n\r\n'
+        '3\r\n00:02.000 --> 00:03.000\r\nto the course\r\nNOTE is cue text here\r\n'
+    )
+
+    def test_iter_cue_text(self):
+        """
+        Test header, notes, styles, cue identifiers, markup and rolling captions' repeated lines are dropped.
+        """
+        self.assertEqual(
+            list(webvtt.iter_cue_text(self.vtt)), ['Hello & welcome', 'to the course', 'NOTE is cue text here']
+        )
+
+    def test_iter_cue_text_srt(self):
+        """
+        Test text is extracted from SRT transcript.
+        """
+        srt = '1\n00:00:01,000 --> 00:00:02,000\n<i>Hello</i>\n\n2\n00:00:02,000 --> 00:00:03,000\nWEBVTT\n'
+
+        self.assertEqual(list(webvtt.iter_cue_text(srt)), ['Hello', 'WEBVTT'])
+
+    @data(
+        (None, 'Hello & welcome to the course NOTE is cue text here'),
+        (29, 'Hello & welcome to the course'),
+        (28, 'Hello & welcome to the'),
+        (15, 'Hello & welcome'),
+        (4, ''),
+    )
+    @unpack
+    def test_vtt_to_text(self, max_length, text):
+        """
+        Test extracted text is cut at a word boundary.
+        """
+        self.assertEqual(webvtt.vtt_to_text(self.vtt, max_length), text)
+
+
+class WebVTTClipTest(unittest.TestCase):
+    """
+    Test clipping of transcripts to a time window.
+    """
+
+    def test_clip_vtt(self):
+        """
+        Test cues outside of the window are dropped, the rest are cut and rebased; notes are dropped.
+        """
+        # Arrange
+        vtt = (
+            'WEBVTT\nKind: captions\n\nSTYLE\n::cue { color: yellow }\n\nNOTE not needed\n\n'
+            'intro\n00:00:01.000 --> 00:00:05.000 align:start\nOne\n\n'
+            '00:05.000 --> 00:09.000\n<00:00:06.000><c>Two</c>\n\n'
+            '00:10.000 --> 00:20.000\nThree\n\n'
+            '00:20.000 --> 00:25.000\nFour\n'
+        )
+
+        # Act
+        clipped_vtt = webvtt.clip_vtt(vtt, 4000, 12000)
+
+        # Assert
+        self.assertEqual(clipped_vtt, (
+            'WEBVTT\nKind: captions\n\nSTYLE\n::cue { color: yellow }\n\n'
+            'intro\n00:00:00.000 --> 00:00:01.000 align:start\nOne\n\n'
+            '00:00:01.000 --> 00:00:05.000\n<00:00:02.000><c>Two</c>\n\n'
+            '00:00:06.000 --> 00:00:08.000\nThree\n\n'
+        ))
+        self.assertTrue(webvtt.validate_vtt(clipped_vtt))
+        self.assertEqual(webvtt.clip_vtt(vtt, 20000).count('-->'), 1)
+
+
+class CueIndexTest(unittest.TestCase):
+    """
+    Test transcript's cue index.
+    """
+
+    def setUp(self):
+        self.cue_index = webvtt.CueIndex.from_vtt(
+            'WEBVTT\n\n'
+            '00:10.000 --> 00:12.000\nThird\n\n'
+            'first\n00:00.000 --> 01:00.000\nFirst, long one\n\n'
+            '00:05.000 --> 00:06.000 align:start\nSecond\n'
+        )
+
+    def test_window(self):
+        """
+        Test cues overlapping a time window are found, including long cues started before the window.
+        """
+        self.assertEqual(self.cue_index.window(6000, 11000), [(0, 60000, 'First, long one'), (10000, 12000, 'Third')])
+        self.assertEqual(self.cue_index.window(4000), [
+            (0, 60000, 'First, long one'), (5000, 6000, 'Second'), (10000, 12000, 'Third')
+        ])
+        self.assertEqual(self.cue_index.window(60000), [])
+
+    def test_pickled(self):
+        """
+        Test cue index can be kept in cache.
+        """
+        cue_index = pickle.loads(pickle.dumps(self.cue_index))
+
+        self.assertEqual(len(cue_index), 3)
+        self.assertEqual(cue_index.window(5500, 5600), self.cue_index.window(5500, 5600))
@@ -3,20 +3,31 @@ Video xblock helpers.
 """
 
 from collections import namedtuple
+from datetime import timezone
 from html import parser as html_parser
 from importlib import import_module
 from xml.sax.saxutils import unescape
+import hashlib
+import logging
 import os.path
+import re
+import threading
 import pkg_resources
 
-from django.template import Engine, Context, Template
+from django.template import Engine, Context, Template, TemplateSyntaxError
 from xblockutils.resources import ResourceLoader
 
 from .constants import TranscriptSource
 
+log = logging.getLogger(__name__)
 
 loader = ResourceLoader(__name__)  # pylint: disable=invalid-name
 
+# Content-hashed static asset URI, e.g. "public/static/vendor/js/video.min.0123456789ab.js"
+HASHED_ASSET_URI_RE = re.compile(
+    r'^public/(?P<name>static/[\w./-]+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.(?:js|css))$'
+)
+
 
 def import_from(module, klass):
     """
@@ -25,12 +36,177 @@ def import_from(module, klass):
     return getattr(import_module(module), klass)
 
 
+def xblock_settings():
+    """
+    Return video xblock settings set in `XBLOCK_SETTINGS` of edx-platform config files.
+
+    Falls back to an empty dict if Django settings aren't configured.
+    """
+    settings = import_from('django.conf', 'settings')
+    if not settings.configured or not hasattr(settings, 'XBLOCK_SETTINGS'):
+        return {}
+    return settings.XBLOCK_SETTINGS.get('video_xblock', {})
+
+
+class ResourceRegistry(object):
+    """
+    Process-wide registry of our kit's static resources.
+
+    Reads and decodes each resource only once, and keeps Django templates compiled from resources.
+    Resources are shipped with the package, so they don't change during process lifetime,
+    unless `resource_cache_autoreload` xblock setting is enabled (handy for development):
+    in that case resources are re-read as soon as their files' modification time changes.
+    """
+
+    def __init__(self, package):
+        """
+        Initialize empty registry for resources of a given package.
+        """
+        self.package = package
+        self.hits = 0
+        self.misses = 0
+        self._resources = {}  # path -> (mtime, text)
+        self._hashes = {}  # path -> (mtime, content hash)
+        self._templates = {}  # path -> (mtime, Template)
+        self._lock = threading.Lock()
+
+    @property
+    def autoreload(self):
+        """
+        Return True if resources should be re-read once changed on disk.
+        """
+        return bool(xblock_settings().get('resource_cache_autoreload', False))
+
+    def _get_mtime(self, path):
+        """
+        Return resource file modification time, if autoreload is enabled.
+        """
+        if not self.autoreload:
+            return None
+        try:
+            return os.path.getmtime(pkg_resources.resource_filename(self.package, path))
+        except (OSError, NotImplementedError):
+            return None
+
+    def _get_cached(self, storage, path, factory):
+        """
+        Get an item from a given storage, create and store it using `factory(path)` on a cache miss.
+        """
+        mtime = self._get_mtime(path)
+        cached = storage.get(path)
+        if cached is not None and cached[0] == mtime:
+            with self._lock:
+                self.hits += 1
+            return cached[1]
+        item = factory(path)
+        with self._lock:
+            self.misses += 1
+            storage[path] = (mtime, item)
+        return item
+
+    def get_string(self, path):
+        """
+        Return decoded content of a resource.
+        """
+        return self._get_cached(
+            self._resources, path, lambda path_: pkg_resources.resource_string(self.package, path_).decode('utf8')
+        )
+
+    def get_template(self, path):
+        """
+        Return Django template compiled from a resource.
+        """
+        return self._get_cached(self._templates, path, lambda path_: Template(self.get_string(path_)))
+
+    def get_hash(self, path):
+        """
+        Return short content hash of a resource.
+        """
+        return self._get_cached(
+            self._hashes, path, lambda path_: hashlib.sha1(self.get_string(path_).encode('utf8')).hexdigest()[:12]
+        )
+
+    def stats(self):
+        """
+        Return registry usage metrics.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'resources': len(self._resources),
+            'templates': len(self._templates),
+        }
+
+    def clear(self):
+        """
+        Drop all registered resources and templates, reset metrics.
+        """
+        with self._lock:
+            self._resources.clear()
+            self._hashes.clear()
+            self._templates.clear()
+            self.hits = self.misses = 0
+
+
+resources = ResourceRegistry(__name__)  # pylint: disable=invalid-name
+
+
 def resource_string(path):
     """
     Handy helper for getting resources from our kit.
     """
-    data = pkg_resources.resource_string(__name__, path)
-    return data.decode("utf8")
+    return resources.get_string(path)
+
+
+def resource_stream(path):
+    """
+    Open a resource from our kit as a binary file-like object.
+    """
+    return pkg_resources.resource_stream(__name__, path)
+
+
+def resource_hash(path):
+    """
+    Return short content hash of a static resource.
+    """
+    return resources.get_hash(path)
+
+
+def hashed_asset_uri(path):
+    """
+    Build content-hashed local resource URI for a static asset.
+
+    Example:
+        'static/vendor/js/video.min.js' -> 'public/static/vendor/js/video.min.0123456789ab.js'
+
+    Arguments:
+        path (str): Path to a static asset, relative to the package root.
+    Returns:
+        str: URI to be passed to `VideoXBlock.player_asset` handler as a suffix.
+    """
+    name, ext = os.path.splitext(path)
+    return 'public/{name}.{hash}{ext}'.format(name=name, hash=resource_hash(path), ext=ext)
+
+
+def resolve_hashed_asset_uri(uri):
+    """
+    Resolve content-hashed local resource URI back to a static asset path.
+
+    Arguments:
+        uri (str): URI built by `hashed_asset_uri()`.
+    Returns:
+        str: Path to a static asset or None if URI is malformed or outdated.
+    """
+    match = HASHED_ASSET_URI_RE.match(uri)
+    if not match or '/.' in uri:
+        return None
+    path = match.group('name') + match.group('ext')
+    try:
+        if resource_hash(path) != match.group('hash'):
+            return None
+    except IOError:
+        return None
+    return path
 
 
 def render_resource(path, **context):
@@ -39,22 +215,85 @@ def render_resource(path, **context):
 
     Returns: django.utils.safestring.SafeText
     """
-    html = Template(resource_string(path))
+    html = resources.get_template(path)
     return html_parser.unescape(
         html.render(Context(context))
     )
 
 
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'static/html')
+
+_template_engine = None  # pylint: disable=invalid-name
+_template_engine_lock = threading.Lock()  # pylint: disable=invalid-name
+
+
+def get_template_engine():
+    """
+    Return Django template engine shared by the process, create and warm it up on first use.
+
+    Compiled templates are cached by the engine unless `resource_cache_autoreload` xblock setting is enabled.
+    Template debugging is switched on with `template_debug` xblock setting.
+    """
+    global _template_engine  # pylint: disable=global-statement,invalid-name
+    if _template_engine is None:
+        with _template_engine_lock:
+            if _template_engine is None:
+                _template_engine = create_template_engine()
+                warm_up_templates(_template_engine)
+    return _template_engine
+
+
+def create_template_engine():
+    """
+    Create Django template engine to render templates from `static/html` directory.
+    """
+    settings = xblock_settings()
+    loaders = ['django.template.loaders.filesystem.Loader']
+    if not settings.get('resource_cache_autoreload', False):
+        loaders = [('django.template.loaders.cached.Loader', loaders)]
+    return Engine(
+        dirs=[TEMPLATES_DIR],
+        debug=bool(settings.get('template_debug', False)),
+        loaders=loaders,
+        libraries={'i18n': 'django.templatetags.i18n'},
+    )
+
+
+def warm_up_templates(engine):
+    """
+    Pre-compile all templates from `static/html` directory.
+
+    Returns: list of compiled templates' names.
+    """
+    template_names = []
+    for root, _dirs, files in os.walk(TEMPLATES_DIR):
+        for file_name in sorted(files):
+            if file_name.endswith('.html'):
+                template_names.append(os.path.relpath(os.path.join(root, file_name), TEMPLATES_DIR))
+    for template_name in template_names:
+        try:
+            engine.get_template(template_name)
+        except TemplateSyntaxError:
+            log.exception("Failed to pre-compile template %s", template_name)
+    return template_names
+
+
+def reset_template_engine():
+    """
+    Drop shared template engine along with its compiled templates.
+    """
+    global _template_engine  # pylint: disable=global-statement,invalid-name
+    with _template_engine_lock:
+        _template_engine = None
+
+
 def render_template(template_name, **context):
     """
     Render static resource using provided context.
 
     Returns: django.utils.safestring.SafeText
     """
-    template_dirs = [os.path.join(os.path.dirname(__file__), 'static/html')]
-    libraries = {'i18n': 'django.templatetags.i18n'}
-    engine = Engine(dirs=template_dirs, debug=True, libraries=libraries)
-    html = engine.get_template(template_name)
+    html = get_template_engine().get_template(template_name)
 
     return html_parser.unescape(
         html.render(Context(context))
@@ -144,6 +383,26 @@ def normalize_transcripts(transcripts):
     return transcripts
 
 
+def is_not_modified(request, etag=None, last_modified=None):
+    """
+    Check if client's cached copy of a resource is still valid, per conditional request headers.
+
+    Arguments:
+        request (webob.Request): Request to check `If-None-Match` and `If-Modified-Since` headers of.
+        etag (str): Current entity tag of the resource.
+        last_modified (datetime.datetime): Resource modification time, naive values are considered UTC.
+    Returns:
+        True if "304 Not Modified" response can be sent.
+    """
+    if request.if_none_match:
+        return bool(etag) and etag in request.if_none_match
+    if request.if_modified_since and last_modified:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
 Transcript = namedtuple('Transcript', [
     'id', 'label', 'lang', 'lang_id', 'content', 'format', 'video_id', 'source', 'url'
 ])
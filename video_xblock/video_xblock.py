@@ -12,10 +12,13 @@ Some terms could be useful for subject understanding:
 to "manual" + "default".
 """
 
+from concurrent import futures
 import datetime
 import json
 import logging
+import mimetypes
 import os.path
+import time
 
 import requests
 from webob import Response
@@ -26,20 +29,26 @@ from xblock.validation import ValidationMessage
 from xblockutils.studio_editable import StudioEditableXBlockMixin
 
 from . import __version__
-from .backends.base import BaseVideoPlayer
+from .backends.base import BaseVideoPlayer, send_api_request
 from .constants import PlayerName, TranscriptSource
 from .exceptions import ApiClientError
 from .fields import RelativeTime
-from .mixins import ContentStoreMixin, LocationMixin, PlaybackStateMixin, SettingsMixin, TranscriptsMixin
+from .mixins import (
+    ContentStoreMixin, LocationMixin, PlaybackStateMixin, SettingsMixin, TranscriptsMixin,
+    TRANSCRIPT_TEXT_VERSION, transcript_text_cache,
+)
 from .settings import ALL_LANGUAGES
 from .utils import (
     create_reference_name, filter_transcripts_by_source, normalize_transcripts,
-    render_resource, render_template, resource_string, ugettext as _,
+    render_resource, render_template, resolve_hashed_asset_uri, resource_stream, resource_string, ugettext as _,
 )
 from .workbench.mixin import WorkbenchMixin
 
 log = logging.getLogger(__name__)
 
+# Player's static assets are served by content-hashed URLs, so that they're never changed once cached:
+PLAYER_ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
 
 class VideoXBlock(
         SettingsMixin, TranscriptsMixin, PlaybackStateMixin, LocationMixin,
@@ -234,7 +243,7 @@ class VideoXBlock(
             return
 
         try:
-            response = requests.head(VideoXBlock.get_brightcove_js_url(data.account_id, data.player_id))
+            response = send_api_request('HEAD', VideoXBlock.get_brightcove_js_url(data.account_id, data.player_id))
             if not response.ok:
                 self.add_validation_message(validation, _(
                     "Invalid Account ID or Player ID, please recheck."
@@ -331,12 +340,10 @@ class VideoXBlock(
         frag.initialize_js('VideoXBlockStudentViewInit')
         return frag
 
-    def _update_default_transcripts(self, player, transcripts):
+    def get_default_transcripts_kwargs(self, player):
         """
-        Private method to fetch/update default transcripts.
+        Prepare parameters necessary to make requests for default transcripts to a video platform's API.
         """
-        log.debug("Default transcripts updating...")
-        # Prepare parameters necessary to make requests to API.
         video_id = player.media_id(self.href)
         kwargs = {'video_id': video_id}
         for k in self.metadata:
@@ -346,13 +353,31 @@ class VideoXBlock(
             self.account_id is not self.fields['account_id'].default  # pylint: disable=unsubscriptable-object
         if is_not_default_account_id:
             kwargs['account_id'] = self.account_id
+        return kwargs
+
+    @staticmethod
+    def fetch_default_transcripts(player, **kwargs):
+        """
+        Fetch captions list (available/default transcripts list) from video platform API, or from the cache.
 
-        # Fetch captions list (available/default transcripts list) from video platform API
+        Xblock's fields aren't touched, so it's safe to call this method from a worker thread.
+
+        Returns:
+            default_transcripts (list): Transcripts available on a video platform.
+            transcripts_autoupload_message (str): Status message for template rendering.
+        """
         try:
-            default_transcripts, transcripts_autoupload_message = player.get_default_transcripts(**kwargs)
+            default_transcripts, transcripts_autoupload_message = player.get_cached_default_transcripts(**kwargs)
         except ApiClientError:
             default_transcripts, transcripts_autoupload_message = [], _('Failed to fetch default transcripts.')
         log.debug("Autofetch message: '{}'".format(transcripts_autoupload_message))
+        return default_transcripts, transcripts_autoupload_message
+
+    def _update_default_transcripts(self, player, transcripts, default_transcripts):
+        """
+        Private method to update default transcripts with ones fetched from a video platform.
+        """
+        log.debug("Default transcripts updating...")
         # Default transcripts should contain transcripts of distinct languages only
         distinct_default_transcripts = player.clean_default_transcripts(default_transcripts)
         # Needed for frontend
@@ -363,7 +388,7 @@ class VideoXBlock(
         if self.default_transcripts:
             self.default_transcripts.sort(key=lambda l: l['label'])
 
-        return initial_default_transcripts, transcripts_autoupload_message
+        return initial_default_transcripts
 
     def studio_view(self, _context):
         """
@@ -375,25 +400,16 @@ class VideoXBlock(
         languages.sort(key=lambda l: l['label'])
         transcripts = self.get_enabled_transcripts()
         download_transcript_handler_url = self.runtime.handler_url(self, 'download_transcript')
-        auth_error_message = ''
-        # Authenticate to API of the player video platform and update metadata with auth information.
-        # Note that there is no need to authenticate to Youtube API,
-        # whilst for Wistia, a sample authorised request is to be made to ensure authentication succeeded,
-        # since it is needed for the auth status message generation and the player's state update with auth status.
-        if self.token:
-            _auth_data, auth_error_message = self.authenticate_video_api(self.token.encode(encoding='utf-8'))
-
-        initial_default_transcripts, transcripts_autoupload_message = self._update_default_transcripts(
-            player, transcripts
-        )
-        log.debug("Fetched default transcripts: {}".format(initial_default_transcripts))
+        # Authentication to API of the player video platform and default transcripts fetching are deferred
+        # to `load_default_transcripts` handler, called by JavaScript once the editor is rendered.
+        # Until then, default transcripts fetched last time are displayed.
 
         # Prepare basic_fields and advanced_fields for them to be rendered
         basic_fields = self.prepare_studio_editor_fields(player.basic_fields)
         advanced_fields = self.prepare_studio_editor_fields(player.advanced_fields)
         context = {
             'advanced_fields': advanced_fields,
-            'auth_error_message': auth_error_message,
+            'auth_error_message': '',
             'basic_fields': basic_fields,
             'courseKey': self.course_key,
             'languages': languages,
@@ -410,8 +426,9 @@ class VideoXBlock(
             'default_transcripts': self.default_transcripts,
             'enabled_default_transcripts': filter_transcripts_by_source(transcripts),
             'enabled_managed_transcripts': self.get_enabled_managed_transcripts(),
-            'initial_default_transcripts': initial_default_transcripts,
-            'transcripts_autoupload_message': transcripts_autoupload_message,
+            'initial_default_transcripts': [],
+            'default_transcripts_loading': True,
+            'transcripts_autoupload_message': '',
             'download_transcript_handler_url': download_transcript_handler_url,
         }
 
@@ -457,6 +474,29 @@ class VideoXBlock(
             transcripts=transcripts,
         )
 
+    @XBlock.handler
+    def player_asset(self, _request, suffix=''):
+        """
+        Serve player's static asset referenced by content-hashed URI, to be cached by browsers for good.
+
+        See `BaseVideoPlayer.asset_url()`.
+
+        Arguments:
+            _request (webob.Request): Request to handle. Imposed by `XBlock.handler`.
+            suffix (string): Asset's URI built by `hashed_asset_uri()`.
+        Returns:
+            webob.Response: Asset's content, 404 if URI is malformed or outdated.
+        """
+        asset_path = resolve_hashed_asset_uri(suffix)
+        if asset_path is None:
+            return Response(status=404)
+        content_type, _encoding = mimetypes.guess_type(asset_path)
+        response = Response(
+            body=resource_stream(asset_path).read(), content_type=content_type or 'application/octet-stream'
+        )
+        response.cache_control = PLAYER_ASSET_CACHE_CONTROL
+        return response
+
     @XBlock.json_handler
     def publish_event(self, data, _suffix=''):
         """
@@ -482,6 +522,7 @@ class VideoXBlock(
 
         Try to detect player by submitted video url. If fails, it defaults to 'dummy-player'.
         Also, populate xblock's default values from settings.
+        Store WebVTT copies of submitted non-WebVTT transcripts, so that they aren't converted on playback.
 
         Arguments:
             data (dict): POST data.
@@ -495,15 +536,39 @@ class VideoXBlock(
                 log.debug("Submitted player[{}] with data: {}".format(player_name, data))
                 break
 
+        if data.get('transcripts'):
+            try:
+                transcripts = json.loads(data['transcripts'])
+            except ValueError:
+                log.exception("JSON parser can't handle submitted transcripts: {}".format(data['transcripts']))
+            else:
+                data['transcripts'] = json.dumps([
+                    self.convert_transcript_to_vtt(transcript) for transcript in transcripts
+                ])
+
     def get_player(self):
         """
         Helper method to load video player by entry-point label.
 
+        Player object is created once per xblock instance (i.e. per request) and recreated
+        only if `player_name`, `href`, `token` or `metadata` fields are changed.
+
         Returns:
             Current player object (instance of a platform-specific player class).
         """
-        player = BaseVideoPlayer.load_class(self.player_name)
-        return player(self)
+        memo_key = (
+            self.player_name, self.href, self.token, json.dumps(self.metadata, sort_keys=True, default=str)
+        )
+        memo = getattr(self, '_player_memo', None)
+        if memo is None or memo[0] != memo_key:
+            memo = self._player_memo = (memo_key, self.create_player())
+        return memo[1]
+
+    def create_player(self):
+        """
+        Create new video player object, e.g. for a worker thread, which mustn't share current one.
+        """
+        return BaseVideoPlayer.load_class(self.player_name)(self)
 
     def _get_field_help(self, field_name, field):
         """
@@ -681,15 +746,19 @@ class VideoXBlock(
         response = Response(json.dumps(resp), content_type='application/json', charset='utf8')
         return response
 
-    def authenticate_video_api(self, token):
+    def request_video_api_authentication(self, token, player=None):
         """
-        Authenticate to a video platform's API.
+        Request authentication data from a video platform's API, without updating xblock's metadata.
+
+        Xblock's fields aren't changed, so it's safe to call this method from a worker thread,
+        given the player object isn't used by other threads.
 
         Arguments:
             token (str): token provided by a user before the save button was clicked (for handlers).
+            player (object): Player to authenticate with, current player if omitted.
         Returns:
-            error_message (dict): Status message for template rendering.
-            auth_data (dict): Tokens and credentials, necessary to perform authorised API requests.
+            auth_data (dict): Tokens and credentials, `None` if authentication wasn't even attempted.
+            error_message (str): Status message for template rendering.
         """
         # TODO move auth fields validation and kwargs population to specific backends
         # Handles a case where no token was provided by a user
@@ -699,10 +768,9 @@ class VideoXBlock(
         if str(self.player_name) == PlayerName.BRIGHTCOVE:
             if self.account_id == self.fields['account_id'].default:  # pylint: disable=unsubscriptable-object
                 error_message = 'In order to authenticate to a video platform\'s API, please provide an Account Id.'
-                return {}, error_message
+                return None, error_message
             kwargs['account_id'] = self.account_id
 
-        player = self.get_player()
         if str(self.player_name) == PlayerName.BRIGHTCOVE and self.metadata.get('client_id'):
             auth_data = {
                 'client_secret': self.metadata.get('client_secret'),
@@ -710,12 +778,122 @@ class VideoXBlock(
             }
             error_message = ''
         else:
-            auth_data, error_message = player.authenticate_api(**kwargs)
+            auth_data, error_message = (player or self.get_player()).authenticate_api(**kwargs)
+        return auth_data, error_message
+
+    def authenticate_video_api(self, token):
+        """
+        Authenticate to a video platform's API.
+
+        Arguments:
+            token (str): token provided by a user before the save button was clicked (for handlers).
+        Returns:
+            error_message (dict): Status message for template rendering.
+            auth_data (dict): Tokens and credentials, necessary to perform authorised API requests.
+        """
+        auth_data, error_message = self.request_video_api_authentication(token)
+        if auth_data is None:
+            return {}, error_message
 
         # Metadata is to be updated on each authentication effort.
-        self.update_metadata_authentication(auth_data=auth_data, player=player)
+        self.update_metadata_authentication(auth_data=auth_data, player=self.get_player())
         return auth_data, error_message
 
+    @XBlock.json_handler
+    def load_default_transcripts(self, data, _suffix=''):
+        """
+        Authenticate to a video platform's API and fetch default transcripts. Called by JavaScript of `studio_view`.
+
+        Default transcripts are fetched once authentication is done, with credentials it has updated.
+        Both API requests are to be completed in `studio_api_timeout` seconds (xblock setting, 10 by default),
+        whatever hasn't is reported as timed out, and the rest of the results are returned.
+        Default transcripts fetching is given at least a fifth of that time, even if authentication has used it up,
+        then it's made with credentials known before authentication.
+        Timed out request is left to complete in the background (it's bounded by HTTP timeouts), its result is dropped.
+        Default transcripts list is taken from the cache, unless `refresh` is requested.
+
+        Arguments:
+            data (dict): Data from frontend, e.g. `{"refresh": true}` to drop cached default transcripts list.
+            _suffix (str): Slug used for routing. Imposed by `XBlock.json_handler`.
+        Returns:
+            response (dict): Rendered default transcripts section, status messages,
+                and names of requests timed out (`authentication`, `default_transcripts`).
+        """
+        transcripts = self.get_enabled_transcripts()
+        api_timeout = float(self.settings.get('studio_api_timeout', 10))
+        deadline = time.time() + api_timeout
+        # Default transcripts fetching mustn't wait for timed out authentication, hence two workers:
+        executor = futures.ThreadPoolExecutor(max_workers=2)
+        results, timed_out = {}, []
+
+        def wait_for(name, future, min_timeout=0):  # pylint: disable=missing-docstring
+            try:
+                results[name] = future.result(timeout=max(deadline - time.time(), min_timeout))
+            except futures.TimeoutError:
+                future.cancel()
+                log.error("Video platform API request has timed out: {}".format(name))
+                timed_out.append(name)
+            except Exception as exc:  # pylint: disable=broad-except
+                log.error("Video platform API request has failed: {}: {}".format(name, exc))
+
+        # Note that there is no need to authenticate to Youtube API,
+        # whilst for Wistia, a sample authorised request is to be made to ensure authentication succeeded,
+        # since it is needed for the auth status message generation and the player's state update with auth status.
+        # Authentication is made with a player of its own: it updates player's credentials, and is left running
+        # in the background if it times out, while default transcripts are fetched.
+        if self.token:
+            token = self.token.encode(encoding='utf-8')
+            wait_for('authentication', executor.submit(
+                lambda: self.request_video_api_authentication(token, player=self.create_player())
+            ))
+            if results.get('authentication', (None,))[0] is not None:
+                # Metadata is to be updated on each authentication effort.
+                self.update_metadata_authentication(auth_data=results['authentication'][0], player=self.get_player())
+
+        player = self.get_player()  # recreated with credentials updated by authentication, if any
+        default_transcripts_kwargs = self.get_default_transcripts_kwargs(player)
+        if data.get('refresh'):
+            player.invalidate_default_transcripts(**default_transcripts_kwargs)
+        wait_for('default_transcripts', executor.submit(
+            self.fetch_default_transcripts, player, **default_transcripts_kwargs
+        ), min_timeout=api_timeout / 5)
+        executor.shutdown(wait=False)
+
+        auth_error_message = ''
+        if 'authentication' in results:
+            _auth_data, auth_error_message = results['authentication']
+        elif 'authentication' in timed_out:
+            auth_error_message = _('Video platform API has not responded in time, please try again later.')
+
+        initial_default_transcripts = []
+        if 'default_transcripts' in results:
+            default_transcripts, transcripts_autoupload_message = results['default_transcripts']
+            initial_default_transcripts = self._update_default_transcripts(player, transcripts, default_transcripts)
+            log.debug("Fetched default transcripts: {}".format(initial_default_transcripts))
+        elif 'default_transcripts' in timed_out:
+            transcripts_autoupload_message = _(
+                'Video platform API has not responded in time, default transcripts shown may be outdated.'
+            )
+        else:
+            transcripts_autoupload_message = _('Failed to fetch default transcripts.')
+
+        default_transcripts_html = render_template(
+            'studio-edit-default-transcripts.html',
+            field=self.prepare_studio_editor_fields(['default_transcripts'])[0],
+            default_transcripts=self.default_transcripts,
+            enabled_default_transcripts=filter_transcripts_by_source(transcripts),
+            initial_default_transcripts=initial_default_transcripts,
+            transcripts_autoupload_message=transcripts_autoupload_message,
+            auth_error_message=auth_error_message,
+            download_transcript_handler_url=self.runtime.handler_url(self, 'download_transcript'),
+        )
+        return {
+            'auth_error_message': auth_error_message,
+            'default_transcripts_html': default_transcripts_html,
+            'timed_out': timed_out,
+            'transcripts_autoupload_message': transcripts_autoupload_message,
+        }
+
     @XBlock.json_handler
     def authenticate_video_api_handler(self, data, _suffix=''):
         """
@@ -816,13 +994,23 @@ class VideoXBlock(
     def get_enabled_transcripts(self):
         """
         Get transcripts from different sources depending on current usage mode.
+
+        Transcripts are computed once per xblock instance (i.e. per request) and recomputed
+        only if `transcripts` or 3PlayMedia fields are changed.
+        Copies are returned, since callers are free to modify transcripts (e.g. `route_transcripts`).
         """
-        if self.threeplaymedia_streaming:
-            transcripts = normalize_transcripts(list(self.fetch_available_3pm_transcripts()))
-        else:
-            transcripts = self.get_enabled_managed_transcripts()
-        log.debug("Getting enabled transcripts: %s", transcripts)
-        return transcripts
+        memo_key = (
+            self.transcripts, self.threeplaymedia_streaming, self.threeplaymedia_apikey, self.threeplaymedia_file_id
+        )
+        memo = getattr(self, '_enabled_transcripts_memo', None)
+        if memo is None or memo[0] != memo_key:
+            if self.threeplaymedia_streaming:
+                transcripts = normalize_transcripts(list(self.fetch_available_3pm_transcripts()))
+            else:
+                transcripts = self.get_enabled_managed_transcripts()
+            log.debug("Getting enabled transcripts: %s", transcripts)
+            memo = self._enabled_transcripts_memo = (memo_key, transcripts)
+        return [dict(transcript) for transcript in memo[1]]
 
     def get_enabled_managed_transcripts(self):
         """
@@ -844,23 +1032,52 @@ class VideoXBlock(
 
         Is invoked during course [re]index operation.
         Takes enabled transcripts' content and puts it to search index.
+        Text extracted from transcripts is cached by their content fingerprints,
+        so that only transcripts changed since the last reindex are fetched and parsed.
         """
         xblock_body = super(VideoXBlock, self).index_dictionary()
         video_body = {"display_name": self.display_name}
 
-        content = None
-        enabled_transcripts = self.route_transcripts()
-        for transcript in enabled_transcripts:
+        enabled_transcripts = list(self.route_transcripts())
+        texts = {}  # transcript's position -> extracted text
+        pending = []  # (position, transcript, fingerprint, content) of transcripts to be fetched and parsed
+        versions = None
+        max_length = self.settings.get('transcript_text_max_length')  # per language
+        text_version = (TRANSCRIPT_TEXT_VERSION, max_length)
+        for position, transcript in enumerate(enabled_transcripts):
+            try:
+                if transcript['source'] == TranscriptSource.THREE_PLAY_MEDIA and versions is None:
+                    versions = self.get_3pm_transcripts_versions()
+                fingerprint, content = self.get_transcript_fingerprint(transcript, versions)
+            except Exception:  # pylint: disable=broad-except
+                log.debug("Can't fingerprint transcript, it's going to be parsed: [{}]".format(transcript))
+                fingerprint, content = None, None
+            text = fingerprint and transcript_text_cache.get((fingerprint, text_version))
+            if text is None:
+                pending.append((position, transcript, fingerprint, content))
+            else:
+                texts[position] = text
+
+        three_play_media_transcripts = [
+            transcript for _position, transcript, _fingerprint, _content in pending
+            if transcript['source'] == TranscriptSource.THREE_PLAY_MEDIA
+        ]
+        fetched_transcripts = dict(zip(
+            [transcript['id'] for transcript in three_play_media_transcripts],
+            self.fetch_3pm_translations([
+                {'id': transcript['id'], 'language_id': transcript['lang_id']}
+                for transcript in three_play_media_transcripts
+            ])
+        ))
+        for position, transcript, fingerprint, content in pending:
             asset_file_name = transcript['url'].split('@')[-1]
             try:
                 if transcript['source'] in [TranscriptSource.MANUAL, TranscriptSource.DEFAULT]:
-                    asset_location = self.static_content.compute_location(self.course_key, asset_file_name)
-                    asset = self.contentstore().find(asset_location)  # pylint: disable=not-callable
-                    content = asset.data
+                    if content is None:
+                        content = self.find_transcript_asset(asset_file_name).data
+                    content = content.decode('utf-8-sig', 'replace')
                 elif transcript['source'] == TranscriptSource.THREE_PLAY_MEDIA:
-                    external_transcript = self.fetch_single_3pm_translation({
-                        'id': transcript['id'], 'language_id': transcript['lang_id']
-                    })
+                    external_transcript = fetched_transcripts.get(transcript['id'])
                     content = external_transcript and external_transcript.content
             except IOError:
                 log.exception("Transcript indexing failure: can't fetch external transcript[{}]".format(transcript))
@@ -870,10 +1087,13 @@ class VideoXBlock(
                 )
             else:
                 if content:
-                    content_ = self.vtt_to_text(content)
-                    video_body.update({transcript['lang']: content_})
-            finally:
-                content = None
+                    texts[position] = self.vtt_to_text(content, max_length)
+                    if fingerprint:
+                        transcript_text_cache.set((fingerprint, text_version), texts[position])
+
+        for position, transcript in enumerate(enabled_transcripts):
+            if position in texts:
+                video_body[transcript['lang']] = texts[position]
 
         if "content" in xblock_body:
             xblock_body["content"].update(video_body)
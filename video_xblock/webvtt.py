@@ -0,0 +1,383 @@
+"""
+Lightweight WebVTT helpers.
+
+Handle the most common transcripts formats (SRT and WebVTT) line by line, without building
+a full captions object model, as pycaption does. Other formats are left for pycaption.
+
+Reference: https://www.w3.org/TR/webvtt1/
+"""
+
+from array import array
+from bisect import bisect_left
+from html import unescape
+import io
+import itertools
+import re
+
+WEBVTT_HEADER_RE = re.compile(r'^WEBVTT(?:[ \t].*)?$')
+TIMESTAMP = r'(?:(\d+):)?(\d{1,2}):(\d{1,2})[,.](\d{1,3})'
+SRT_TIMING_RE = re.compile(r'^\s*' + TIMESTAMP + r'\s*-->\s*' + TIMESTAMP + r'(.*)$')
+VTT_TIMING_RE = re.compile(r'^(?:(\d{2,}):)?([0-5]\d):([0-5]\d)\.(\d{3})[ \t]+-->[ \t]+'
+                           r'(?:(\d{2,}):)?([0-5]\d):([0-5]\d)\.(\d{3})(?:[ \t].*)?$')
+SRT_FONT_TAG_RE = re.compile(r'</?font(?:\s[^>]*)?>', re.IGNORECASE)
+SRT_ASS_TAG_RE = re.compile(r'{\\[^}]*}')
+UNSAFE_LT_RE = re.compile(r'<(?!/?[ibu]>)')
+UNSAFE_AMP_RE = re.compile(r'&(?!(?:amp|lt|gt|nbsp|lrm|rlm|#\d+|#x[0-9a-fA-F]+);)')
+CUE_TIMESTAMP_TAG_RE = re.compile(r'<((?:\d+:)?\d{2}:\d{2}\.\d{3})>')
+SKIPPED_BLOCK_RE = re.compile(r'^(?:NOTE|STYLE|REGION)(?:[ \t].*)?$')
+CUE_TAG_RE = re.compile(r'<[^>]*>')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def format_timestamp(hours, minutes, seconds, milliseconds):
+    """
+    Format WebVTT timestamp, e.g. "01:02:03.004".
+    """
+    return '{:02d}:{:02d}:{:02d}.{:03d}'.format(
+        int(hours or 0), int(minutes), int(seconds), int(milliseconds.ljust(3, '0'))
+    )
+
+
+def iter_lines(caps):
+    """
+    Iterate over lines of transcript's text, with byte order mark and line endings stripped.
+
+    Lines are read one by one, so that a list of all lines isn't built.
+    """
+    for index, line in enumerate(io.StringIO(caps, newline=None)):
+        line = line.rstrip('\n')
+        yield line.lstrip('\ufeff') if index == 0 else line
+
+
+def escape_cue_text(line):
+    """
+    Make SRT cue text line safe for WebVTT: strip unsupported markup, escape special characters.
+    """
+    if '<' not in line and '&' not in line and '{' not in line and '>' not in line:
+        return line
+    line = SRT_ASS_TAG_RE.sub('', SRT_FONT_TAG_RE.sub('', line))
+    line = UNSAFE_AMP_RE.sub('&amp;', line)
+    return UNSAFE_LT_RE.sub('&lt;', line).replace('-->', '--&gt;')
+
+
+def is_srt(caps):
+    """
+    Tell if transcript looks like SRT: its first cue is an optional number followed by SRT cue timings.
+    """
+    for line in iter_lines(caps):
+        line = line.strip()
+        if not line or line.isdigit():
+            continue
+        return bool(SRT_TIMING_RE.match(line))
+    return False
+
+
+def iter_srt_to_vtt(lines):
+    """
+    Convert SRT transcript's lines into WebVTT, line by line.
+
+    SRT cue numbers are dropped, timestamps are converted, font and ASS styling tags are stripped.
+
+    Arguments:
+        lines (iterable): SRT transcript's lines, without line endings.
+    Yields:
+        str: WebVTT transcript's lines, with line endings.
+    """
+    yield 'WEBVTT\n'
+    in_cue = False
+    pending_number = None
+    for line in lines:
+        timing = SRT_TIMING_RE.match(line)
+        if timing:
+            groups = timing.groups()
+            yield '\n{} --> {}{}\n'.format(
+                format_timestamp(*groups[0:4]), format_timestamp(*groups[4:8]), groups[8].rstrip()
+            )
+            in_cue, pending_number = True, None
+        elif not line.strip():
+            if pending_number is not None and in_cue:
+                yield escape_cue_text(pending_number) + '\n'
+            in_cue, pending_number = False, None
+        elif in_cue:
+            if pending_number is not None:
+                # A number inside of a cue is its text, not a number of the next cue:
+                yield escape_cue_text(pending_number) + '\n'
+                pending_number = None
+            if line.strip().isdigit():
+                pending_number = line
+            else:
+                yield escape_cue_text(line) + '\n'
+    if pending_number is not None and in_cue:
+        yield escape_cue_text(pending_number) + '\n'
+
+
+def srt_to_vtt(caps):
+    """
+    Convert SRT transcript into WebVTT format.
+    """
+    return ''.join(iter_srt_to_vtt(iter_lines(caps)))
+
+
+def validate_vtt(caps):
+    """
+    Check WebVTT transcript's header and cue timings.
+
+    Returns:
+        True if transcript is valid WebVTT.
+    """
+    lines = iter_lines(caps)
+    if not WEBVTT_HEADER_RE.match(next(lines, '')):
+        return False
+    for line in lines:
+        if '-->' in line and not VTT_TIMING_RE.match(line):
+            return False
+    return True
+
+
+def normalize_vtt(caps):
+    """
+    Pass valid WebVTT transcript through, with line endings normalized and byte order mark stripped.
+    """
+    return '\n'.join(iter_lines(caps)) + '\n'
+
+
+def convert_to_vtt(caps):
+    """
+    Convert transcript into WebVTT format if it's SRT, or pass it through if it's valid WebVTT already.
+
+    Returns:
+        str: WebVTT transcript, or `None` if transcript is neither SRT nor valid WebVTT.
+    """
+    if validate_vtt(caps):
+        return normalize_vtt(caps)
+    if is_srt(caps):
+        return srt_to_vtt(caps)
+    return None
+
+
+def normalize_cue_text(line):
+    """
+    Strip markup (e.g. `<c>`, `<v Speaker>`, `<00:00:01.000>`) off cue text line, unescape entities, collapse spaces.
+    """
+    if '<' in line:
+        line = CUE_TAG_RE.sub('', line)
+    if '&' in line:
+        line = unescape(line)
+    return WHITESPACE_RE.sub(' ', line).strip()
+
+
+def iter_cue_text(caps):
+    """
+    Extract text of transcript's cues, e.g. for search indexing.
+
+    Header, cue identifiers and timings, NOTE, STYLE and REGION blocks and markup are dropped.
+    Rolling captions repeat lines of a previous cue; such lines are emitted once.
+    Works for SRT transcripts as well.
+
+    Yields:
+        str: Normalized text of cues' lines.
+    """
+    previous_lines, cue_lines = (), []
+    in_cue = skipping = False
+    block_start = True
+    for index, line in enumerate(iter_lines(caps)):
+        if not line.strip():
+            if in_cue:
+                previous_lines, cue_lines = cue_lines, []
+            in_cue = skipping = False
+            block_start = True
+        elif in_cue:
+            text = normalize_cue_text(line)
+            if text and text not in previous_lines:
+                yield text
+            cue_lines.append(text)
+        elif skipping:
+            continue
+        elif '-->' in line:
+            in_cue = True
+        elif block_start and ((index == 0 and WEBVTT_HEADER_RE.match(line)) or SKIPPED_BLOCK_RE.match(line)):
+            skipping = True
+        else:
+            block_start = False  # cue identifier
+
+
+def vtt_to_text(caps, max_length=None):
+    """
+    Extract text of transcript's cues, see `iter_cue_text`.
+
+    Arguments:
+        caps (str): WebVTT (or SRT) transcript.
+        max_length (int): Maximum length of extracted text, it's cut at a word boundary if exceeded.
+    Returns:
+        str: Cues' text, separated by spaces.
+    """
+    pieces = []
+    length = 0
+    for text in iter_cue_text(caps):
+        if max_length is not None and length + len(text) > max_length:
+            remainder = text[:max(max_length - length, 0) + 1].rsplit(' ', 1)
+            if len(remainder) > 1 and remainder[0]:
+                pieces.append(remainder[0])
+            break
+        pieces.append(text)
+        length += len(text) + 1
+    return ' '.join(pieces)
+
+
+def parse_timestamp(hours, minutes, seconds, milliseconds):
+    """
+    Convert parts of a cue timestamp, as matched by `SRT_TIMING_RE`, into milliseconds.
+    """
+    return ((int(hours or 0) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(milliseconds.ljust(3, '0'))
+
+
+def rebase_timestamp(milliseconds, offset):
+    """
+    Shift timestamp back by `offset` milliseconds, not earlier than zero, and format it.
+    """
+    milliseconds = max(milliseconds - offset, 0)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return '{:02d}:{:02d}:{:02d}.{:03d}'.format(hours, minutes, seconds, milliseconds)
+
+
+def rebase_timestamp_tag(match, offset):
+    """
+    Shift cue timestamp tag (e.g. `<00:01:02.500>`) back by `offset` milliseconds.
+    """
+    parts = re.split(r'[:.]', match.group(1))
+    hours = parts[0] if len(parts) == 4 else None
+    return '<{}>'.format(rebase_timestamp(parse_timestamp(hours, *parts[-3:]), offset))
+
+
+def iter_clipped_vtt(lines, start, end=None):
+    """
+    Clip WebVTT transcript to a time window: drop cues outside of it and make timestamps relative to its start.
+
+    Cues overlapping window's bounds are cut to fit into the window. Header, STYLE and REGION blocks are kept,
+    notes are dropped.
+
+    Arguments:
+        lines (iterable): WebVTT transcript's lines, without line endings.
+        start (int): Window's start, in milliseconds.
+        end (int): Window's end, in milliseconds; up to the end of transcript if omitted.
+    Yields:
+        str: Clipped transcript's lines, with line endings.
+    """
+    block = []
+    for line in itertools.chain(lines, ['']):
+        if line.strip():
+            block.append(line)
+            continue
+        if not block:
+            continue
+        timing_position = next((index for index, block_line in enumerate(block) if '-->' in block_line), None)
+        if timing_position is None:
+            if not block[0].startswith('NOTE'):  # header, STYLE or REGION block
+                yield '\n'.join(block) + '\n\n'
+        else:
+            match = SRT_TIMING_RE.match(block[timing_position])
+            cue_start = match and parse_timestamp(*match.groups()[0:4])
+            cue_end = match and parse_timestamp(*match.groups()[4:8])
+            if match and cue_end > start and (end is None or cue_start < end):
+                cue_end = cue_end if end is None else min(cue_end, end)
+                block[timing_position] = '{} --> {}{}'.format(
+                    rebase_timestamp(cue_start, start), rebase_timestamp(cue_end, start), match.group(9).rstrip()
+                )
+                for index in range(timing_position + 1, len(block)):
+                    if '<' in block[index]:
+                        block[index] = CUE_TIMESTAMP_TAG_RE.sub(
+                            lambda tag: rebase_timestamp_tag(tag, start), block[index]
+                        )
+                yield '\n'.join(block) + '\n\n'
+        block = []
+
+
+def clip_vtt(caps, start, end=None):
+    """
+    Clip WebVTT transcript to a time window, see `iter_clipped_vtt`.
+    """
+    return ''.join(iter_clipped_vtt(iter_lines(caps), start, end))
+
+
+class CueIndex(object):
+    """
+    Compact index of transcript's cues, to look cues up by time.
+
+    Cues are kept in parallel arrays of start and end times (in milliseconds) and offsets
+    of cues' text in a single string, sorted by start time, so that index is cheap to keep in cache
+    and cues in a time window are found with a binary search.
+    """
+
+    def __init__(self, starts, ends, offsets, text):
+        """
+        Initialize index out of its arrays, see `from_vtt` to build one.
+        """
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text = text
+        self.max_duration = max((end - start for start, end in zip(starts, ends)), default=0)
+
+    @classmethod
+    def from_vtt(cls, caps):
+        """
+        Build index out of WebVTT (or SRT) transcript.
+        """
+        cues = []
+        timing = None
+        lines = []
+        for line in iter_lines(caps):
+            if not line.strip():
+                if timing:
+                    cues.append((timing[0], timing[1], '\n'.join(lines)))
+                timing, lines = None, []
+                continue
+            if timing:
+                lines.append(line)
+                continue
+            match = SRT_TIMING_RE.match(line)
+            if match:
+                groups = match.groups()
+                timing = parse_timestamp(*groups[0:4]), parse_timestamp(*groups[4:8])
+        if timing:
+            cues.append((timing[0], timing[1], '\n'.join(lines)))
+        cues.sort(key=lambda cue: cue[0])
+
+        starts, ends, offsets, texts = array('q'), array('q'), array('q', [0]), []
+        for start, end, text in cues:
+            starts.append(start)
+            ends.append(end)
+            texts.append(text)
+            offsets.append(offsets[-1] + len(text))
+        return cls(starts, ends, offsets, ''.join(texts))
+
+    def __len__(self):
+        """
+        Return number of cues.
+        """
+        return len(self.starts)
+
+    def cue(self, position):
+        """
+        Return cue at given position as a tuple of start and end times (in milliseconds) and text.
+        """
+        return (
+            self.starts[position], self.ends[position], self.text[self.offsets[position]:self.offsets[position + 1]]
+        )
+
+    def window(self, start, end=None):
+        """
+        Find cues shown within a time window.
+
+        Arguments:
+            start (int): Window's start, in milliseconds.
+            end (int): Window's end, in milliseconds; up to the end of transcript if omitted.
+        Returns:
+            list: Cues overlapping the window, see `cue`.
+        """
+        # Cues starting earlier than the window's start by more than the longest cue lasts are over before it:
+        position = bisect_left(self.starts, start - self.max_duration)
+        stop = len(self) if end is None else bisect_left(self.starts, end, position)
+        return [self.cue(index) for index in range(position, stop) if self.ends[index] > start]